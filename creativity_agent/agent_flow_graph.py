@@ -2,35 +2,42 @@
 """
 Graph-based Creativity Agent Flow
 
-A multi-agent graph with feedback loops for creative ideation using:
+A multi-agent graph driven by an iteration loop for creative ideation using:
 1. Chaos Generator (divergent thinking)
 2. High-temperature creative agent
 3. Low-temperature refinement agent
 4. Independent judge evaluation
-5. Iteration control
-6. Deep research expansion
+5. Deep research expansion (after the final iteration)
 
 This replaces the manual flow control with a clean graph architecture.
 """
 
 from strands import Agent
 from strands.multiagent import GraphBuilder
+from strands.multiagent.base import Status
+from strands.multiagent.graph import GraphResult
 from strands.models import BedrockModel
-from typing import Optional
+from botocore.config import Config as BotocoreConfig
+from typing import Dict, Optional
+from functools import cached_property
+from collections import defaultdict
+from itertools import chain
+import boto3
 import os
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
-from creativity_agent.config import FlowConfig
-from creativity_agent.tools import search_web, get_url_content, bulk_search_web, set_web_cache
+from creativity_agent.config import FlowConfig, ModelConfig
+from creativity_agent.tools import get_url_content, bulk_search_web, set_web_cache
 from creativity_agent.utilities import (
     MemoryManager, ChaosGenerator,
-    GlobalWebCache, IndependentJudge, ObservabilityTracker,
-    JinjaPromptBuilder
+    GlobalWebCache, ResponseCache, IndependentJudge, ObservabilityTracker,
+    JinjaPromptBuilder, BufferedOutputWriter
 )
 from creativity_agent.models import IdeaStatistics, ExecutionState, SharedState
 from creativity_agent.nodes import (
-    ChaosGeneratorNode, IterationControllerNode, JudgeNode,
+    ChaosGeneratorNode, JudgeNode, BatchJudgeNode,
     MockAgent, MockChaosNode, MockJudgeNode,
     CreativeAgentNode, RefinementAgentNode
 )
@@ -39,6 +46,35 @@ from creativity_agent.nodes import (
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Separators for the judge summary report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+# Per-idea header and score lines for accepted ideas (missing scores show as N/A)
+_ACCEPTED_IDEA_BLOCK = (
+    "{idea_name}\n"
+    "   Quality Score: {quality_score}/10\n"
+    "   Feasibility: {feasibility_score}/10\n"
+    "   Impact: {impact_score}/10\n"
+    "   Originality: {originality_score}/10"
+)
+
+
+def _make_bedrock_model(
+    model_config: ModelConfig,
+    temperature: float,
+    *,
+    session: Optional[boto3.Session] = None,
+    client_config: Optional[BotocoreConfig] = None
+) -> BedrockModel:
+    """Build a BedrockModel for one model at the given temperature."""
+    return BedrockModel(
+        model_id=model_config.model_id,
+        temperature=temperature,
+        streaming=model_config.streaming,
+        boto_session=session,
+        boto_client_config=client_config
+    )
+
 
 class CreativityAgentFlowGraph:
     """Graph-based creativity flow with automatic loop control."""
@@ -68,22 +104,45 @@ class CreativityAgentFlowGraph:
         
         logger.info(f"Created run directory: {self.run_dir}")
         
+        # Node output files are written by a background thread, off the hot path
+        self.output_writer = BufferedOutputWriter(flush_interval_s=1.0, max_buffered_bytes=1 << 20)
+        
+        region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+        
+        # Single boto3 session (credentials/region resolved once) and client config
+        # shared by every Bedrock client: judge, chaos generator and all models
+        self._boto_session = boto3.Session(region_name=region)
+        self._boto_config = BotocoreConfig(
+            max_pool_connections=max(16, 4 * len(config.models)),
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            tcp_keepalive=True,
+            read_timeout=120
+        )
+        
         self.enable_memory = enable_memory
         self.enable_observability = enable_observability
         self.chaos_seeds_per_iteration = chaos_seeds_per_iteration
         
         # Initialize Jinja2 prompt builder (always required)
-        self.jinja_builder = JinjaPromptBuilder()
+        self.jinja_builder = JinjaPromptBuilder(bytecode_cache_dir=self.base_outputs_dir / "_jinja_cache")
         logger.info("Jinja2 prompt builder initialized")
         
+        # System prompts are static: render them once for all agents
+        self._creative_sys_prompt = self.jinja_builder.get_creative_agent_system_prompt()
+        self._refinement_sys_prompt = self.jinja_builder.get_refinement_agent_system_prompt()
+        
         # Initialize global web cache
         if global_cache_dir is None:
             global_cache_dir = self.base_outputs_dir / "global_cache"
+        self.global_cache_dir = global_cache_dir
         self.global_web_cache = GlobalWebCache(global_cache_dir)
         logger.info(f"Global web cache initialized at {global_cache_dir}")
         
         # Set the global web cache for the tools module
         set_web_cache(self.global_web_cache)
+        
+        # Refinement responses are cached across runs only when enabled in config
+        self.response_cache = ResponseCache(global_cache_dir) if config.cache_refinement and not mock_mode else None
 
         
         # Initialize memory manager
@@ -95,80 +154,99 @@ class CreativityAgentFlowGraph:
         else:
             self.memory_manager = None
         
-        # Initialize independent judge
-        self.judge = IndependentJudge(
+        # Judge, chaos generator, observability and models are created lazily
+        # (see the properties below) so mock runs never build Bedrock/ES clients
+        self._semantic_backend = semantic_backend
+        self._es_uri = es_uri
+        self._es_api_key = es_api_key
+        
+        # Build the graph
+        self.graph = self._build_graph()
+    
+    @cached_property
+    def judge(self) -> Optional[IndependentJudge]:
+        """Independent judge, created on first use (None in mock mode)."""
+        if self.mock_mode:
+            return None
+        judge = IndependentJudge(
             jinja_builder=self.jinja_builder,
-            judge_model_id=config.judge.model_id,
-            judge_temperature=config.judge.temperature,
-            streaming=config.judge.streaming,
-            region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+            judge_model_id=self.config.judge.model_id,
+            judge_temperature=self.config.judge.temperature,
+            streaming=self.config.judge.streaming,
+            boto_session=self._boto_session,
+            boto_client_config=self._boto_config
         )
-        logger.info(f"Independent judge enabled ({config.judge.model_id})")
-        
-        # Initialize observability
-        if self.enable_observability and es_uri and es_api_key:
-            self.observability = ObservabilityTracker(
-                es_uri=es_uri,
-                es_api_key=es_api_key,
-                index_name="super-creativity"
-            )
-            logger.info("Observability tracking enabled (ElasticSearch)")
-        else:
-            self.observability = None
-
-        # Initialize chaos generator
-        self.chaos_generator = ChaosGenerator(
-            model_id=config.chaos_generator.model_id,
-            temperature=config.chaos_generator.temperature,
-            streaming=config.chaos_generator.streaming,
-            region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
-            semantic_backend=semantic_backend,
+        logger.info(f"Independent judge enabled ({self.config.judge.model_id})")
+        return judge
+    
+    @cached_property
+    def observability(self) -> Optional[ObservabilityTracker]:
+        """ElasticSearch observability tracker, created on first use when configured."""
+        if not (self.enable_observability and self._es_uri and self._es_api_key):
+            return None
+        observability = ObservabilityTracker(
+            es_uri=self._es_uri,
+            es_api_key=self._es_api_key,
+            index_name="super-creativity",
+            queue_path=self.global_cache_dir / "super-creativity-queue.jsonl"
+        )
+        logger.info("Observability tracking enabled (ElasticSearch)")
+        return observability
+    
+    @cached_property
+    def chaos_generator(self) -> Optional[ChaosGenerator]:
+        """Chaos generator, created on first use (None in mock mode)."""
+        if self.mock_mode:
+            return None
+        chaos_generator = ChaosGenerator(
+            model_id=self.config.chaos_generator.model_id,
+            temperature=self.config.chaos_generator.temperature,
+            streaming=self.config.chaos_generator.streaming,
+            boto_session=self._boto_session,
+            boto_client_config=self._boto_config,
+            semantic_backend=self._semantic_backend,
             tangent_range=(0.3, 0.7)
         )
         logger.info("Chaos generator enabled")
-        
-        # Create model instances
-        self.models = {}
-        for model_key, model_config in config.models.items():
-            self.models[f"{model_key}_high"] = BedrockModel(
-                model_id=model_config.model_id,
-                temperature=model_config.high_temp,
-                streaming=model_config.streaming,
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
-            )
-            self.models[f"{model_key}_low"] = BedrockModel(
-                model_id=model_config.model_id,
-                temperature=model_config.low_temp,
-                streaming=model_config.streaming,
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+        return chaos_generator
+    
+    @cached_property
+    def models(self) -> Dict[str, BedrockModel]:
+        """Bedrock model instances keyed "{model_key}_high" / "{model_key}_low"."""
+        # Built sequentially: boto3 sessions are not thread-safe, and with the shared
+        # session credential and endpoint resolution only happens once anyway
+        return {
+            f"{model_key}_{suffix}": _make_bedrock_model(
+                model_config, getattr(model_config, f"{suffix}_temp"),
+                session=self._boto_session, client_config=self._boto_config
             )
-        
-        # Build the graph
-        self.graph = self._build_graph()
+            for model_key, model_config in self.config.models.items()
+            for suffix in ("high", "low")
+        }
     
     def _build_graph(self):
-        """Build the multi-agent graph with feedback loops.
-        
-        Graph flow (like a for loop, SEQUENTIAL):
-        iteration_controller (condition check) 
-            -> if not done: chaos_generator 
-                -> model_A_creative 
-                -> model_A_refinement 
-                -> model_A_judge
-                -> model_B_creative 
-                -> model_B_refinement
-                -> model_B_judge
-                -> back to iteration_controller
-            -> if done: deep_research
-        
-        Note: Each iteration runs through all model chains SEQUENTIALLY.
+        """Build the acyclic multi-agent graph for a single iteration.
+        
+        Graph flow (one iteration, model chains run IN PARALLEL):
+        chaos_generator 
+            -> model_A_creative -> model_A_refinement -> model_A_judge
+            -> model_B_creative -> model_B_refinement -> model_B_judge
+        
+        Note: The model chains are independent, so they fan out from the chaos
+        generator. Strands executes each ready batch of nodes concurrently, so an
+        iteration costs roughly one chain's latency instead of the sum over all models.
         Each model chain: creative (high temp) -> refinement (low temp) -> judge
         Each model gets its own judge instance to avoid graph flow conflicts.
+        With judge.batch_models enabled, the per-model judges are replaced by a single
+        "judge" node that waits for every refinement and evaluates them in one request.
+        
+        The iteration loop itself is a plain Python for loop in run(), which invokes
+        this graph once per iteration and calls the deep research agent at the end.
         
         The original prompt flows through invocation_state to all nodes.
         """
         # Create SharedState instance for coordinating all nodes
-        shared_state = SharedState(
+        self.shared_state = shared_state = SharedState(
             current_iteration=0,
             max_iterations=self.config.iterations,
             run_id=self.run_id,
@@ -183,7 +261,8 @@ class CreativityAgentFlowGraph:
             chaos_node = MockChaosNode(
                 shared_state=shared_state,
                 chaos_seeds_per_iteration=self.chaos_seeds_per_iteration,
-                outputs_dir=self.run_dir
+                outputs_dir=self.run_dir,
+                output_writer=self.output_writer
             )
         elif self.chaos_generator:
             chaos_node = ChaosGeneratorNode(
@@ -191,16 +270,20 @@ class CreativityAgentFlowGraph:
                 chaos_generator=self.chaos_generator,
                 chaos_seeds_per_iteration=self.chaos_seeds_per_iteration,
                 outputs_dir=self.run_dir,
-                jinja_builder=self.jinja_builder
+                jinja_builder=self.jinja_builder,
+                output_writer=self.output_writer
             )
         else:
             raise ValueError("Chaos generator must be provided or mock_mode enabled")
         
         builder.add_node(chaos_node, "chaos_generator")
+        self.chaos_node = chaos_node
         
         # Create creative, refinement, and judge agents for each model (in order)
-        # These will be chained sequentially
+        # Each model's triple forms an independent chain executed in parallel
         agent_chain = []  # List of (creative_name, refinement_name, judge_name) tuples
+        # One judge request for all models instead of a judge node per model
+        batch_judge = not self.mock_mode and self.config.judge.batch_models and bool(self.judge)
         
         for model_key in self.config.models.keys():
             creative_agent_name = f"{model_key}_creative"
@@ -213,14 +296,15 @@ class CreativityAgentFlowGraph:
                     shared_state=shared_state,
                     name=creative_agent_name,
                     agent_type="creative",
-                    outputs_dir=self.run_dir
+                    outputs_dir=self.run_dir,
+                    output_writer=self.output_writer
                 )
             else:
                 agent = Agent(
                     name=creative_agent_name,
                     model=self.models[f"{model_key}_high"],
-                    tools=[search_web, get_url_content, bulk_search_web],
-                    system_prompt=self.jinja_builder.get_creative_agent_system_prompt()
+                    tools=[bulk_search_web, get_url_content],
+                    system_prompt=self._creative_sys_prompt
                 )
                 creative_agent = CreativeAgentNode(
                     shared_state=shared_state,
@@ -228,7 +312,8 @@ class CreativityAgentFlowGraph:
                     node_name=creative_agent_name,
                     outputs_dir=self.run_dir,
                     memory_manager=self.memory_manager,
-                    jinja_builder=self.jinja_builder
+                    jinja_builder=self.jinja_builder,
+                    output_writer=self.output_writer
                 )
             builder.add_node(creative_agent, creative_agent_name)
             
@@ -238,14 +323,15 @@ class CreativityAgentFlowGraph:
                     shared_state=shared_state,
                     name=refinement_agent_name,
                     agent_type="refinement",
-                    outputs_dir=self.run_dir
+                    outputs_dir=self.run_dir,
+                    output_writer=self.output_writer
                 )
             else:
                 agent = Agent(
                     name=refinement_agent_name,
                     model=self.models[f"{model_key}_low"],
-                    tools=[search_web, get_url_content, bulk_search_web],
-                    system_prompt=self.jinja_builder.get_refinement_agent_system_prompt()
+                    tools=[bulk_search_web, get_url_content],
+                    system_prompt=self._refinement_sys_prompt
                 )
                 refinement_agent = RefinementAgentNode(
                     shared_state=shared_state,
@@ -253,19 +339,27 @@ class CreativityAgentFlowGraph:
                     node_name=refinement_agent_name,
                     outputs_dir=self.run_dir,
                     memory_manager=self.memory_manager,
-                    jinja_builder=self.jinja_builder
+                    jinja_builder=self.jinja_builder,
+                    output_writer=self.output_writer,
+                    response_cache=self.response_cache
                 )
             builder.add_node(refinement_agent, refinement_agent_name)
             
             # Create judge node for this model
             if self.mock_mode:
-                judge_node = MockJudgeNode(shared_state=shared_state, outputs_dir=self.run_dir)
-            elif self.judge:
+                judge_node = MockJudgeNode(
+                    shared_state=shared_state,
+                    outputs_dir=self.run_dir,
+                    output_writer=self.output_writer
+                )
+            elif self.judge and not batch_judge:
                 judge_node = JudgeNode(
                     shared_state=shared_state,
                     judge=self.judge,
                     observability=self.observability,
-                    outputs_dir=self.run_dir
+                    outputs_dir=self.run_dir,
+                    model_key=model_key,
+                    output_writer=self.output_writer
                 )
             else:
                 judge_node = None
@@ -276,10 +370,6 @@ class CreativityAgentFlowGraph:
             # Store the triple for building the chain
             agent_chain.append((creative_agent_name, refinement_agent_name, judge_agent_name if judge_node else None))
         
-        # Create iteration controller (acts like the for loop condition)
-        iteration_controller = IterationControllerNode(shared_state=shared_state)
-        builder.add_node(iteration_controller, "iteration_controller")
-        
         # Create deep research agent (final step after iterations complete)
         final_model_key = list(self.config.models.keys())[0]
         if self.mock_mode:
@@ -287,305 +377,390 @@ class CreativityAgentFlowGraph:
                 shared_state=shared_state,
                 name="deep_research",
                 agent_type="final",
-                outputs_dir=self.run_dir
+                outputs_dir=self.run_dir,
+                output_writer=self.output_writer
             )
         else:
             deep_research_agent = Agent(
                 name="deep_research",
                 model=self.models[f"{final_model_key}_low"],
-                tools=[search_web, get_url_content, bulk_search_web]
+                tools=[bulk_search_web, get_url_content]
+            )
+        # Invoked directly by run() after the last iteration, not part of the graph
+        self.deep_research_agent = deep_research_agent
+        
+        # Build the graph edges - PARALLEL model chains with per-model judges
+        builder.set_entry_point("chaos_generator")
+        
+        # Fan out: chaos -> X_creative -> X_refinement -> X_judge for every model X
+        nodes_per_iteration = 1  # chaos_generator
+        for creative_name, refinement_name, judge_name in agent_chain:
+            builder.add_edge("chaos_generator", creative_name)
+            builder.add_edge(creative_name, refinement_name)
+            nodes_per_iteration += 2
+            if judge_name:
+                builder.add_edge(refinement_name, judge_name)
+                nodes_per_iteration += 1
+        
+        if batch_judge:
+            refinement_names = [refinement_name for _, refinement_name, _ in agent_chain]
+            builder.add_node(
+                BatchJudgeNode(
+                    shared_state=shared_state,
+                    judge=self.judge,
+                    observability=self.observability,
+                    outputs_dir=self.run_dir,
+                    refinement_nodes={f"{key}_refinement": key for key in self.config.models},
+                    output_writer=self.output_writer
+                ),
+                "judge"
             )
-        builder.add_node(deep_research_agent, "deep_research")
-        
-        # Conditional functions following AWS Strands documentation pattern
-        def should_continue_iterating(state):
-            """Loop condition: if iterations remain, continue to chaos generator."""
-            controller_result = state.results.get("iteration_controller")
-            if not controller_result:
-                return False
             
-            try:
-                # The result should be a MultiAgentResult with the state updates
-                result_obj = controller_result.result
-                if hasattr(result_obj, 'results') and 'iteration_controller' in result_obj.results:
-                    node_result = result_obj.results['iteration_controller']
-                    if hasattr(node_result, 'state'):
-                        return node_result.state.get("should_continue", False)
-                
-                # Fallback: check the result message
-                result_text = str(result_obj)
-                return "Starting iteration" in result_text or "complete. Starting" in result_text
-            except (AttributeError, KeyError):
-                return False
-        
-        def is_done_iterating(state):
-            """Exit condition: if all iterations complete, proceed to deep research."""
-            controller_result = state.results.get("iteration_controller")
-            if not controller_result:
-                return False
+            refinement_ids = frozenset(refinement_names)
             
-            try:
-                # The result should be a MultiAgentResult with the state updates
-                result_obj = controller_result.result
-                if hasattr(result_obj, 'results') and 'iteration_controller' in result_obj.results:
-                    node_result = result_obj.results['iteration_controller']
-                    if hasattr(node_result, 'state'):
-                        return node_result.state.get("is_finished", False)
-                
-                # Fallback: check the result message
-                result_text = str(result_obj)
-                return "Proceeding to deep research" in result_text or "All" in result_text and "iterations complete" in result_text
-            except (AttributeError, KeyError):
-                return False
-        
-        # Build the graph edges - SEQUENTIAL chain of all models with per-model judges
-        # Entry point is iteration controller (like the for loop condition check)
-        builder.set_entry_point("iteration_controller")
-        
-        # From iteration controller: if iterations remain, go to chaos generator
-        builder.add_edge("iteration_controller", "chaos_generator", condition=should_continue_iterating)
-        
-        # From iteration controller: if done, go to deep research
-        builder.add_edge("iteration_controller", "deep_research", condition=is_done_iterating)
-        
-        # Build the sequential chain: chaos -> A_creative -> A_refinement -> A_judge -> B_creative -> B_refinement -> B_judge -> ... -> iteration_controller
-        previous_node = "chaos_generator"
-        for i, (creative_name, refinement_name, judge_name) in enumerate(agent_chain):
-            builder.add_edge(previous_node, creative_name)
-            builder.add_edge(creative_name, refinement_name)
-            builder.add_edge(refinement_name, judge_name)
-            previous_node = judge_name
-        
-        # Connect last judge/refinement back to iteration controller for the next condition check
-        builder.add_edge(previous_node, "iteration_controller")
+            def all_refinements_done(state) -> bool:
+                done = {node.node_id for node in chain(state.completed_nodes, state.failed_nodes)}
+                return refinement_ids <= done
+            
+            # Join: the judge waits until every model chain has finished refinement
+            for refinement_name in refinement_names:
+                builder.add_edge(refinement_name, "judge", condition=all_refinements_done)
+            nodes_per_iteration += 1
         
-        # Graph execution settings for cyclic graphs
-        # Each iteration: chaos + (3 nodes per model: creative + refinement + judge) + controller
-        num_models = len(self.config.models)
-        nodes_per_iteration = 1 + (num_models * 3) + 1  # chaos + models(creative+refinement+judge) + controller
-        builder.set_max_node_executions(self.config.iterations * nodes_per_iteration + 10)
-        builder.set_execution_timeout(600)  # 10 minutes max
-        builder.reset_on_revisit(False)  # Keep state across iterations
+        # Each invocation is a fresh acyclic pass: every node runs at most once
+        builder.set_max_node_executions(nodes_per_iteration + 2)
+        builder.reset_on_revisit(True)
+        builder.set_execution_timeout(600)  # 10 minutes max per iteration
         
         return builder.build()
     
     def run(self, user_prompt: str) -> str:
         """Run the creativity flow graph for multiple iterations.
         
-        The graph operates like a for loop:
-        - iteration_controller checks if iterations remain (entry point)
-        - If yes: chaos_generator -> creative -> refinement -> judge -> back to controller
-        - If no: proceed to deep_research
+        The iteration loop is an explicit Python for loop:
+        - Each iteration invokes the acyclic graph once
+          (chaos_generator -> parallel creative -> refinement -> judge chains)
+        - After the last iteration, deep_research is invoked once
         
         The user_prompt flows through ExecutionState to all nodes with full type safety.
         """
-        logger.info(f"Starting graph-based creativity flow for {self.config.iterations} iterations")
-        logger.info(f"Original prompt: {user_prompt}\n")
-        
-        # Start observability
-        if self.observability:
-            self.observability.start_run(
+        try:
+            logger.info(f"Starting graph-based creativity flow for {self.config.iterations} iterations")
+            logger.info(f"Original prompt: {user_prompt}\n")
+            
+            # Start observability
+            if self.observability:
+                self.observability.start_run(
+                    run_id=self.run_id,
+                    original_prompt=user_prompt,
+                    config_iterations=self.config.iterations,
+                    chaos_seeds_per_iteration=self.chaos_seeds_per_iteration,
+                    semantic_backend="auto"
+                )
+            
+            # Create typed ExecutionState for graph execution
+            initial_state = ExecutionState(
+                original_prompt=user_prompt,
+                iteration=0,
                 run_id=self.run_id,
+                run_dir=str(self.run_dir),
+                max_iterations=self.config.iterations,
+                start_time=datetime.now().isoformat()
+            )
+            
+            # Run the graph once per iteration with typed state.
+            # Only running totals and the last result are kept, so each iteration's
+            # node results can be freed once the next one starts.
+            iterations_run = 0
+            last_result: Optional[GraphResult] = None
+            execution_order = []
+            completed_nodes = failed_nodes = execution_time = 0
+            token_usage = {}
+            all_completed = True
+            state = initial_state
+            converged = False
+            try:
+                for iteration in range(self.config.iterations):
+                    logger.info(f"Starting iteration {iteration + 1}/{self.config.iterations}...")
+                    self.shared_state.set_iteration(iteration)
+                    state = initial_state.with_updates(iteration=iteration)
+                    result = self.graph(
+                        user_prompt,
+                        invocation_state=state.to_dict()
+                    )
+                    iterations_run += 1
+                    last_result = result
+                    execution_order.extend(node.node_id for node in result.execution_order)
+                    completed_nodes += result.completed_nodes
+                    failed_nodes += result.failed_nodes
+                    execution_time += result.execution_time
+                    for key, value in result.accumulated_usage.items():
+                        token_usage[key] = token_usage.get(key, 0) + value
+                    all_completed = all_completed and result.status == Status.COMPLETED
+                    
+                    self._record_iteration_quality(result)
+                    early_stop = self.config.early_stop
+                    if early_stop and early_stop.check_convergence(
+                        self.shared_state.quality_history,
+                        self.shared_state.accepted_history
+                    ):
+                        converged = True
+                        logger.info(
+                            f"Judge scores converged after {iteration + 1} iterations "
+                            f"(quality history: {self.shared_state.quality_history}). Stopping early."
+                        )
+                        break
+            finally:
+                # Nothing more to prefetch once the loop ends, normally or not
+                if isinstance(self.chaos_node, ChaosGeneratorNode):
+                    self.chaos_node.cancel_prefetch()
+            
+            logger.info(f"{iterations_run}/{self.config.iterations} iterations complete. Proceeding to deep research...")
+            
+            # Deep research runs once on the final iteration's results
+            final_output = None
+            deep_research_succeeded = False
+            deep_research_start = time.time()
+            try:
+                final_output = self._run_deep_research(
+                    user_prompt,
+                    last_result,
+                    state.with_updates(is_finished=True, should_continue=False)
+                )
+                deep_research_succeeded = True
+            except Exception as e:
+                logger.error(f"Deep research failed: {e}")
+            deep_research_time = int((time.time() - deep_research_start) * 1000)
+            
+            # Print execution summary (built up front and written in one call)
+            if deep_research_succeeded:
+                execution_order.append("deep_research")
+            summary = ["\n" + _SEP80, "GRAPH EXECUTION SUMMARY", _SEP80, "\n--- Execution Order ---"]
+            summary.extend(f"{i}. {node_id}" for i, node_id in enumerate(execution_order, 1))
+            summary.extend([
+                "\n--- Performance Metrics ---",
+                f"Iterations run: {iterations_run}",
+                f"Total nodes in graph: {last_result.total_nodes if last_result else 0} (+ deep_research)",
+                f"Completed nodes: {completed_nodes + int(deep_research_succeeded)}",
+                f"Failed nodes: {failed_nodes + int(not deep_research_succeeded)}",
+                f"Execution time: {execution_time + deep_research_time}ms",
+                f"Token usage: {token_usage}",
+                _SEP80 + "\n"
+            ])
+            print("\n".join(summary))
+            
+            # Fallback to last judge output if deep_research didn't produce output
+            if final_output is None and last_result is not None:
+                # Judge nodes cache their parsed JSON output on shared_state
+                judge_results = self.shared_state.judge_results.get(state.iteration)
+                if judge_results:
+                    final_output = "\n\n".join(
+                        self._format_judge_output_as_summary(judge_data)
+                        for judge_data in judge_results.values()
+                    )
+                else:
+                    # Last resort: check for any refinement output
+                    refinement_results = [k for k in last_result.results.keys() if 'refinement' in k]
+                    if refinement_results:
+                        last_refinement = refinement_results[-1]
+                        final_output = str(last_result.results[last_refinement].result)
+            
+            # End observability
+            if self.observability:
+                final_stats = IdeaStatistics(
+                    total_ideas=0,
+                    unique_ideas=0,
+                    duplicate_ideas=0,
+                    accepted_ideas=0,
+                    rejected_ideas=0
+                )
+                self.observability.end_run(
+                    final_idea_statistics=final_stats,
+                    success=deep_research_succeeded and all_completed,
+                    converged=converged,
+                    iterations_completed=iterations_run
+                )
+            
+            # Save final output with formatting
+            if final_output is None:
+                final_output = "No final output generated"
+                logger.warning("No final output was generated by the graph")
+            
+            if self.memory_manager:
+                self.memory_manager.save_memory()
+            
+            from creativity_agent.utilities import save_formatted_output
+            output_file = self.run_dir / "final_output.txt"
+            save_formatted_output(
+                output_path=output_file,
+                result=final_output,
                 original_prompt=user_prompt,
-                config_iterations=self.config.iterations,
-                chaos_seeds_per_iteration=self.chaos_seeds_per_iteration,
-                semantic_backend="auto"
+                iteration_count=iterations_run,
+                is_mock=self.mock_mode
             )
+            logger.info(f"Saved final output to {output_file}")
+            logger.info("Graph-based creativity flow completed successfully")
+            
+            return final_output
+        finally:
+            # Make sure all node outputs are on disk, even when the run fails
+            self.output_writer.flush()
+    
+    def close(self) -> None:
+        """
+        Release resources held across runs: the chaos prefetch executor, the
+        output writer, the web and response cache connections, the memory
+        journal and the ES indexer.
+        """
+        if isinstance(self.chaos_node, ChaosGeneratorNode):
+            self.chaos_node.close()
+        self.output_writer.close()
+        self.global_web_cache.close()
+        if self.response_cache:
+            self.response_cache.close()
+        if self.memory_manager:
+            self.memory_manager.close()
+        # observability is a cached_property: don't create a tracker just to close it
+        observability = self.__dict__.get('observability')
+        if observability:
+            observability.close()
+    
+    def _record_iteration_quality(self, result: GraphResult) -> None:
+        """
+        Record the mean accepted quality score and accepted count for an iteration.
         
-        # Create typed ExecutionState for graph execution
-        initial_state = ExecutionState(
-            original_prompt=user_prompt,
-            iteration=0,
-            run_id=self.run_id,
-            run_dir=str(self.run_dir),
-            max_iterations=self.config.iterations,
-            start_time=datetime.now().isoformat()
-        )
-        
-        # Run the entire graph once with typed state
-        # The iteration_controller and conditional edges will handle the loop internally
-        logger.info("Executing graph with iteration control and typed state...")
-        result = self.graph(
-            user_prompt,
-            invocation_state=initial_state.to_dict()
-        )
+        Reads the judge evaluations each judge node placed in its result state.
         
-        # Print execution summary
-        print("\n" + "="*80)
-        print("GRAPH EXECUTION SUMMARY")
-        print("="*80)
-        print("\n--- Execution Order ---")
-        for i, node in enumerate(result.execution_order, 1):
-            print(f"{i}. {node.node_id}")
-        
-        print(f"\n--- Performance Metrics ---")
-        print(f"Total nodes in graph: {result.total_nodes}")
-        print(f"Completed nodes: {result.completed_nodes}")
-        print(f"Failed nodes: {result.failed_nodes}")
-        print(f"Execution time: {result.execution_time}ms")
-        print(f"Token usage: {result.accumulated_usage}")
-        print("="*80 + "\n")
-        
-        # Extract final output
-        final_output = None
-        
-        # Prefer deep_research output (final step)
-        if "deep_research" in result.results:
-            final_output = str(result.results['deep_research'].result)
-        else:
-            # Fallback to last judge output if deep_research wasn't executed
-            judge_results = [k for k in result.results.keys() if 'judge' in k]
-            if judge_results:
-                last_judge = judge_results[-1]
-                judge_raw_output = str(result.results[last_judge].result)
-                # Format judge JSON output as a readable summary
-                final_output = self._format_judge_output_as_summary(judge_raw_output)
-            else:
-                # Last resort: check for any refinement output
-                refinement_results = [k for k in result.results.keys() if 'refinement' in k]
-                if refinement_results:
-                    last_refinement = refinement_results[-1]
-                    final_output = str(result.results[last_refinement].result)
-        
-        # End observability
-        if self.observability:
-            final_stats = IdeaStatistics(
-                total_ideas=0,
-                unique_ideas=0,
-                duplicate_ideas=0,
-                accepted_ideas=0,
-                rejected_ideas=0
-            )
-            self.observability.end_run(
-                final_idea_statistics=final_stats,
-                success=result.status.value == "COMPLETED"
-            )
+        Args:
+            result: Graph result of the completed iteration
+        """
+        accepted_scores = []
+        for node_id, node_result in result.results.items():
+            if 'judge' not in node_id:
+                continue
+            # Judge nodes return a MultiAgentResult; their state is on the nested AgentResults
+            for agent_result in node_result.get_agent_results():
+                judge_state = agent_result.state or {}
+                for evaluation in judge_state.get('judge_evaluations') or []:
+                    if evaluation.get('accepted'):
+                        accepted_scores.append(float(evaluation.get('overall_quality_score', 0.0)))
+        
+        mean_quality = sum(accepted_scores) / len(accepted_scores) if accepted_scores else 0.0
+        self.shared_state.record_iteration_quality(mean_quality, len(accepted_scores))
+        logger.info(f"Iteration quality: mean={mean_quality:.2f}, accepted={len(accepted_scores)}")
+    
+    def _run_deep_research(
+        self,
+        user_prompt: str,
+        last_result: Optional[GraphResult],
+        state: ExecutionState
+    ) -> str:
+        """
+        Invoke the deep research agent once after all iterations complete.
         
-        # Save final output with formatting
-        if final_output is None:
-            final_output = "No final output generated"
-            logger.warning("No final output was generated by the graph")
-        
-        from creativity_agent.utilities import save_formatted_output
-        output_file = self.run_dir / "final_output.txt"
-        save_formatted_output(
-            output_path=output_file,
-            result=final_output,
-            original_prompt=user_prompt,
-            iteration_count=self.config.iterations,
-            is_mock=self.mock_mode
-        )
-        logger.info(f"Saved final output to {output_file}")
-        logger.info("Graph-based creativity flow completed successfully")
+        The task mirrors what the graph would hand a downstream node: the original
+        task followed by the outputs of the final iteration's judges.
         
-        return final_output
+        Args:
+            user_prompt: Original user prompt
+            last_result: Graph result of the final iteration (None if no iterations ran)
+            state: Execution state after the final iteration
+            
+        Returns:
+            Deep research output text
+        """
+        task = user_prompt
+        if last_result is not None:
+            judge_outputs = [
+                f"\nFrom {node_id}:\n  - Agent: {node_result.result}"
+                for node_id, node_result in last_result.results.items()
+                if 'judge' in node_id
+            ]
+            if judge_outputs:
+                task = f"Original Task: {user_prompt}\n\nInputs from previous nodes:\n" + "\n".join(judge_outputs)
+        
+        if isinstance(self.deep_research_agent, Agent):
+            return str(self.deep_research_agent(task))
+        
+        # Mock deep research is a graph node (MultiAgentBase), invoked standalone
+        result = self.deep_research_agent(task, invocation_state=state.to_dict())
+        return str(result.results["deep_research"].result)
     
-    def _format_judge_output_as_summary(self, judge_output: str) -> str:
+    def _format_judge_output_as_summary(self, judge_data: dict) -> str:
         """
-        Convert judge JSON output to a readable summary report.
+        Convert parsed judge output to a readable summary report.
         
         Args:
-            judge_output: Judge output (either JSON or already formatted)
+            judge_data: Judge output dict as parsed by JudgeNode
             
         Returns:
             Formatted summary text
         """
-        import json
+        # Build formatted summary
+        lines = []
+        lines.append(_SEP80)
+        lines.append("JUDGE EVALUATION SUMMARY")
+        lines.append(_SEP80)
+        
+        # Accepted ideas
+        accepted = judge_data.get('accepted_ideas', [])
+        if accepted:
+            lines.append(f"\nACCEPTED IDEAS ({len(accepted)} total):")
+            lines.append(_DASH80)
+            for i, idea in enumerate(accepted, 1):
+                fields = defaultdict(lambda: 'N/A', idea)
+                fields.setdefault('idea_name', 'Unknown')
+                lines.append(f"\n{i}. " + _ACCEPTED_IDEA_BLOCK.format_map(fields))
+                
+                if idea.get('key_points'):
+                    lines.append("   Key Points:")
+                    for point in idea['key_points'][:3]:
+                        lines.append(f"     - {point}")
+                
+                if idea.get('implementation_path'):
+                    lines.append(f"   Implementation: {idea['implementation_path'][:100]}...")
+        
+        # Rejected ideas
+        rejected = judge_data.get('rejected_ideas', [])
+        if rejected:
+            lines.append(f"\n\nREJECTED IDEAS ({len(rejected)} total):")
+            lines.append(_DASH80)
+            for i, idea in enumerate(rejected, 1):
+                lines.append(
+                    f"\n{i}. {idea.get('idea_name', 'Unknown')}\n"
+                    f"   Reason: {idea.get('rejection_reason', 'No details provided')}"
+                )
         
-        try:
-            # Try to parse as JSON
-            judge_data = None
-            
-            # First try direct JSON parse
-            try:
-                judge_data = json.loads(judge_output)
-            except json.JSONDecodeError:
-                # Try to extract JSON from text if it contains markdown
-                if '```json' in judge_output:
-                    start = judge_output.find('{')
-                    end = judge_output.rfind('}') + 1
-                    if start >= 0 and end > start:
-                        judge_data = json.loads(judge_output[start:end])
-                elif '{' in judge_output:
-                    start = judge_output.find('{')
-                    end = judge_output.rfind('}') + 1
-                    if start >= 0 and end > start:
-                        judge_data = json.loads(judge_output[start:end])
-            
-            if judge_data is None:
-                # Could not parse, return as-is
-                return judge_output
-            
-            # Build formatted summary
-            lines = []
-            lines.append("=" * 80)
-            lines.append("JUDGE EVALUATION SUMMARY")
-            lines.append("=" * 80)
-            
-            # Accepted ideas
-            accepted = judge_data.get('accepted_ideas', [])
-            if accepted:
-                lines.append(f"\nACCEPTED IDEAS ({len(accepted)} total):")
-                lines.append("-" * 80)
-                for i, idea in enumerate(accepted, 1):
-                    lines.append(f"\n{i}. {idea.get('idea_name', 'Unknown')}")
-                    lines.append(f"   Quality Score: {idea.get('quality_score', 'N/A')}/10")
-                    lines.append(f"   Feasibility: {idea.get('feasibility_score', 'N/A')}/10")
-                    lines.append(f"   Impact: {idea.get('impact_score', 'N/A')}/10")
-                    lines.append(f"   Originality: {idea.get('originality_score', 'N/A')}/10")
-                    
-                    if idea.get('key_points'):
-                        lines.append("   Key Points:")
-                        for point in idea['key_points'][:3]:
-                            lines.append(f"     - {point}")
-                    
-                    if idea.get('implementation_path'):
-                        lines.append(f"   Implementation: {idea['implementation_path'][:100]}...")
-            
-            # Rejected ideas
-            rejected = judge_data.get('rejected_ideas', [])
-            if rejected:
-                lines.append(f"\n\nREJECTED IDEAS ({len(rejected)} total):")
-                lines.append("-" * 80)
-                for i, idea in enumerate(rejected, 1):
-                    lines.append(f"\n{i}. {idea.get('idea_name', 'Unknown')}")
-                    lines.append(f"   Reason: {idea.get('rejection_reason', 'No details provided')}")
-            
-            # Synthesis
-            synthesis = judge_data.get('synthesis')
-            if synthesis:
-                lines.append(f"\n\nSYNTHESIS:")
-                lines.append("-" * 80)
-                lines.append(synthesis)
-            
-            # Top recommendations
-            recommendations = judge_data.get('top_recommendations', [])
-            if recommendations:
-                lines.append(f"\n\nTOP RECOMMENDATIONS:")
-                lines.append("-" * 80)
-                for i, rec in enumerate(recommendations, 1):
-                    lines.append(f"{i}. {rec}")
-            
-            # Strategic insights
-            insights = judge_data.get('strategic_insights', [])
-            if insights:
-                lines.append(f"\n\nSTRATEGIC INSIGHTS:")
-                lines.append("-" * 80)
-                for i, insight in enumerate(insights, 1):
-                    lines.append(f"{i}. {insight}")
-            
-            # Unresolved questions
-            questions = judge_data.get('unresolved_questions', [])
-            if questions:
-                lines.append(f"\n\nUNRESOLVED QUESTIONS:")
-                lines.append("-" * 80)
-                for i, question in enumerate(questions, 1):
-                    lines.append(f"{i}. {question}")
-            
-            lines.append("\n" + "=" * 80)
-            return "\n".join(lines)
-            
-        except Exception as e:
-            logger.error(f"Error formatting judge output: {e}")
-            return judge_output
-
+        # Synthesis
+        synthesis = judge_data.get('synthesis')
+        if synthesis:
+            lines.append(f"\n\nSYNTHESIS:")
+            lines.append(_DASH80)
+            lines.append(synthesis)
+        
+        # Top recommendations
+        recommendations = judge_data.get('top_recommendations', [])
+        if recommendations:
+            lines.append(f"\n\nTOP RECOMMENDATIONS:")
+            lines.append(_DASH80)
+            for i, rec in enumerate(recommendations, 1):
+                lines.append(f"{i}. {rec}")
+        
+        # Strategic insights
+        insights = judge_data.get('strategic_insights', [])
+        if insights:
+            lines.append(f"\n\nSTRATEGIC INSIGHTS:")
+            lines.append(_DASH80)
+            for i, insight in enumerate(insights, 1):
+                lines.append(f"{i}. {insight}")
+        
+        # Unresolved questions
+        questions = judge_data.get('unresolved_questions', [])
+        if questions:
+            lines.append(f"\n\nUNRESOLVED QUESTIONS:")
+            lines.append(_DASH80)
+            for i, question in enumerate(questions, 1):
+                lines.append(f"{i}. {question}")
+        
+        lines.append("\n" + _SEP80)
+        return "\n".join(lines)
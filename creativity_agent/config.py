@@ -1,7 +1,24 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, model_validator
 from pathlib import Path
+from functools import lru_cache
 import json
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
+@lru_cache(maxsize=None)
+def _read_prompt(path: Path) -> str:
+    """Read a prompt file once; prompts don't change during a run."""
+    return path.read_text()
+
+@lru_cache(maxsize=16)
+def _load_config_data(json_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; keyed on mtime so edited files are re-read."""
+    raw = json_path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 class ModelConfig(BaseModel):
     model_id: str
@@ -21,6 +38,7 @@ class JudgeConfig(BaseModel):
     temperature: float
     timeout: int
     streaming: bool = True  # Default to True for backward compatibility
+    batch_models: bool = False  # Judge all models' outputs in one request instead of one judge per model
 
 class ChaosGeneratorConfig(BaseModel):
     model_id: str
@@ -29,6 +47,24 @@ class ChaosGeneratorConfig(BaseModel):
     timeout_per_seed: int
     streaming: bool = True  # Default to True for backward compatibility
 
+class EarlyStopConfig(BaseModel):
+    ftol: float = 0.01  # Minimum change in mean accepted quality score to keep going
+    patience: int = 2  # Consecutive stalled iterations before stopping
+    min_iterations: int = 2  # Never stop before this many iterations
+    
+    def check_convergence(self, quality_history: List[float], accepted_history: List[int]) -> bool:
+        """Return True when judge results have plateaued for `patience` iterations.
+        
+        Stalled means the mean accepted quality score moved less than `ftol`,
+        or the iteration produced no new accepted ideas.
+        """
+        if len(quality_history) < max(self.min_iterations, self.patience + 1):
+            return False
+        recent = range(len(quality_history) - self.patience, len(quality_history))
+        if all(abs(quality_history[i] - quality_history[i - 1]) < self.ftol for i in recent):
+            return True
+        return all(accepted_history[i] == 0 for i in recent)
+
 class FlowConfig(BaseModel):
     iterations: int
     models: Dict[str, ModelConfig]
@@ -37,20 +73,29 @@ class FlowConfig(BaseModel):
     final_step: str
     judge: JudgeConfig
     chaos_generator: ChaosGeneratorConfig
+    early_stop: Optional[EarlyStopConfig] = None
+    cache_refinement: bool = False  # Reuse refinement outputs for prompts already answered in earlier runs
+    
+    _step_index: Dict[str, StepConfig] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode='after')
+    def _index_steps(self) -> 'FlowConfig':
+        self._step_index = {s.id: s for s in self.steps}
+        return self
     
     @classmethod
     def from_json(cls, json_path: Path) -> 'FlowConfig':
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        return cls(**data)
+        json_path = Path(json_path)
+        data = _load_config_data(json_path, json_path.stat().st_mtime_ns)
+        # Validate a fresh instance each call; callers may mutate their config
+        return cls.model_validate(data)
     
     def get_prompt_path(self, step_id: str) -> Path:
-        step = next(s for s in self.steps if s.id == step_id)
-        return Path(__file__).parent / "prompts" / step.prompt_file
+        return Path(__file__).parent / "prompts" / self._step_index[step_id].prompt_file
     
     def load_prompt(self, step_id: str) -> str:
         path = self.get_prompt_path(step_id)
         if path.exists():
-            return path.read_text()
+            return _read_prompt(path)
         else:
             return f"Default prompt for {step_id}"
\ No newline at end of file
@@ -5,14 +5,17 @@ Enhanced with memory, chaos, independent judge, and observability.
 """
 
 from pathlib import Path
-from creativity_agent.config import FlowConfig
-from creativity_agent.agent_flow_graph import CreativityAgentFlowGraph
+from functools import lru_cache
+from typing import List, Optional
 import argparse
 import os
 
+_CONFIG_PATH = Path(__file__).parent / "flow_config.json"
 
-def main():
-    # Parse command-line arguments
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; repeated main() calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Super Creativity: Graph-based multi-agent creative ideation system"
     )
@@ -61,12 +64,46 @@ def main():
         default=os.getenv('ELASTICSEARCH_API_KEY'),
         help='ElasticSearch API key (default: from ELASTICSEARCH_API_KEY env var)'
     )
+    return parser
+
+
+def _build_models(enable_memory: bool, enable_observability: bool) -> None:
+    """
+    Build the validators of the (defer_build) models this run will use.
+    
+    Models are declared with defer_build=True so importing them is cheap;
+    building the ones a run needs up front keeps that cost out of the first
+    node invocation. Models for disabled features are never built.
+    """
+    from creativity_agent.models import (
+        ExecutionState, SharedState, ChaosInput, TangentialConcept,
+        IdeaMemory, ExploredIdea, RejectedIdea,
+        JudgeEvaluation, IdeaStatistics, RunMetrics, IterationMetrics, StepMetrics, TokenUtilization
+    )
+    
+    models = [ExecutionState, SharedState, ChaosInput, TangentialConcept,
+              JudgeEvaluation, IdeaStatistics]
+    if enable_memory:
+        models += [IdeaMemory, ExploredIdea, RejectedIdea]
+    if enable_observability:
+        models += [RunMetrics, IterationMetrics, StepMetrics, TokenUtilization]
+    for model in models:
+        model.model_rebuild()
+
+
+def main(argv: Optional[List[str]] = None):
+    # Parse command-line arguments
+    args = _build_parser().parse_args(argv)
+    
+    # Heavy imports (Strands, boto3, ...) are deferred until arguments are valid,
+    # so --help and usage errors return immediately
+    from creativity_agent.config import FlowConfig
+    from creativity_agent.agent_flow_graph import CreativityAgentFlowGraph
     
-    args = parser.parse_args()
+    _build_models(enable_memory=not args.no_memory, enable_observability=not args.no_observability)
     
-    # Load config
-    config_path = Path(__file__).parent / "flow_config.json"
-    config = FlowConfig.from_json(config_path)
+    # Load config (FlowConfig.from_json caches the parsed file until it changes)
+    config = FlowConfig.from_json(_CONFIG_PATH)
 
     flow = CreativityAgentFlowGraph(
         config,
@@ -105,35 +142,47 @@ def main():
     print("=" * 80)
     print()
     
-    # Run flow
-    print("Starting creativity flow...")
-    result = run_method(user_prompt)
-    
-    print("\n" + "=" * 80)
-    print("Flow completed!")
-    print("=" * 80)
-    print(f"Check the {flow.run_dir}/ directory for all results from this run.")
-    if not args.no_memory:
-        print(f"Memory state saved to {flow.run_dir}/memory/idea_memory.json")
-    if not args.no_observability and args.es_uri:
-        print(f"Metrics indexed to ElasticSearch (index: super-creativity)")
-    
-    # Print web cache statistics
-    print("\n" + "=" * 80)
-    print("WEB CACHE STATISTICS")
-    print("=" * 80)
-    cache_stats = flow.global_web_cache.get_cache_stats()
-    print(f"URL Cache: {cache_stats['url_cache']['total_urls_cached']} URLs cached, {cache_stats['url_cache']['total_hits']} total hits ({cache_stats['url_cache']['total_size_bytes']} bytes)")
-    if cache_stats['url_cache']['top_urls']:
-        print("\nTop Cached URLs:")
-        for url_info in cache_stats['url_cache']['top_urls']:
-            print(f"  - {url_info['url']}: {url_info['hits']} hits")
-    print(f"\nQuery Tracking: {cache_stats['query_mappings']['total_unique_queries']} unique queries tracked")
-    if cache_stats['url_cache']['top_domains']:
-        print("\nTop Domains:")
-        for domain_info in cache_stats['url_cache']['top_domains']:
-            print(f"  - {domain_info['domain']}: {domain_info['count']} URLs, {domain_info['hits']} total hits")
-
+    try:
+        # Run flow
+        print("Starting creativity flow...")
+        result = run_method(user_prompt)
+        
+        print("\n" + "=" * 80)
+        print("Flow completed!")
+        print("=" * 80)
+        print(f"Check the {flow.run_dir}/ directory for all results from this run.")
+        if not args.no_memory:
+            print(f"Memory state saved to {flow.run_dir}/memory/idea_memory.jsonl")
+        if not args.no_observability and args.es_uri:
+            print(f"Metrics indexed to ElasticSearch (index: super-creativity)")
+        
+        # Print web cache statistics (built up front and written in one call)
+        cache_stats = flow.global_web_cache.get_cache_stats()
+        uc = cache_stats['url_cache']
+        qm = cache_stats['query_mappings']
+        lines = [
+            "\n" + "=" * 80,
+            "WEB CACHE STATISTICS",
+            "=" * 80,
+            f"URL Cache: {uc['total_urls_cached']} URLs cached, {uc['total_hits']} total hits ({uc['total_size_bytes']} bytes)"
+        ]
+        top_urls = uc.get('top_urls')
+        if top_urls:
+            lines.append("\nTop Cached URLs:")
+            lines.extend(f"  - {url_info['url']}: {url_info['hits']} hits" for url_info in top_urls)
+        lines.append(f"\nQuery Tracking: {qm['total_unique_queries']} unique queries tracked")
+        top_domains = uc.get('top_domains')
+        if top_domains:
+            lines.append("\nTop Domains:")
+            lines.extend(
+                f"  - {domain_info['domain']}: {domain_info['count']} URLs, {domain_info['hits']} total hits"
+                for domain_info in top_domains
+            )
+        print("\n".join(lines))
+    finally:
+        # Close the memory journal and wait for queued run metrics to reach
+        # ElasticSearch, even if the run or the summary failed
+        flow.close()
 
 
 if __name__ == "__main__":
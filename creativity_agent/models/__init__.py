@@ -3,24 +3,35 @@ Data models for the creativity agent system.
 """
 
 from .memory_models import IdeaMemory, ExploredIdea, RejectedIdea
-from .chaos_models import ChaosInput, TangentialConcept
+from .chaos_models import ChaosInput, ChaosSeed, TangentialConcept
 from .observability_models import (
     RunMetrics, IterationMetrics, StepMetrics, IdeaStatistics,
-    TokenUtilization, JudgeEvaluation, ModelType, TemperatureType, StepType
+    TokenUtilization, JudgeEvaluation, ModelType, TemperatureType, StepType,
+    BreakdownColumns
 )
 from .workflow_models import (
     NodeType, InvocationState, NodeOutput,
-    IdeaEvaluation, RunSummary, NodeConfiguration
+    IdeaEvaluation
 )
 from .execution_state import ExecutionState, NodeInput
 from .shared_state import SharedState
 
+
+def __getattr__(name: str):
+    # Summary-only workflow models are created on first access
+    if name in ('RunSummary', 'NodeConfiguration'):
+        from . import workflow_models
+        return getattr(workflow_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'IdeaMemory',
     'ExploredIdea', 
     'RejectedIdea',
     'ChaosInput',
     'TangentialConcept',
+    'ChaosSeed',
     'RunMetrics',
     'IterationMetrics',
     'StepMetrics',
@@ -30,6 +41,7 @@ __all__ = [
     'ModelType',
     'TemperatureType',
     'StepType',
+    'BreakdownColumns',
     # Workflow models
     'NodeType',
     'InvocationState',
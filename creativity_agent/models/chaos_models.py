@@ -2,8 +2,19 @@
 Pydantic models for the chaos generator system.
 """
 
-from pydantic import BaseModel, Field
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+# One tangential concept in the chaos summary, followed by a blank line
+_CONCEPT_BLOCK = "• {term}\n  Context: {context}\n  Potential connection: {relevance_note}\n"
+
+
+class ChaosSeed(NamedTuple):
+    """One chaos seed carried in execution state (a tuple, not a model: seeds are built per iteration)."""
+    
+    concept: str
+    context: str
+    relevance: str
 
 
 class TangentialConcept(BaseModel):
@@ -14,6 +25,8 @@ class TangentialConcept(BaseModel):
     relevance_note: str = Field(
         description="How this tangent might relate to the original prompt"
     )
+    
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
 
 
 class ChaosInput(BaseModel):
@@ -32,11 +45,35 @@ class ChaosInput(BaseModel):
         default_factory=list
     )
     
+    # Fields are never reassigned (concepts are appended to the list as researched)
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+    
+    # Last summary and the list state it was built from (see _summary_key)
+    _cached_summary: Optional[str] = PrivateAttr(default=None)
+    _cache_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+    
+    def _summary_key(self) -> Tuple[Any, ...]:
+        """Cheap fingerprint of the lists, which are only ever appended to."""
+        concepts = self.tangential_concepts
+        return (len(concepts), concepts[-1] if concepts else None, len(self.random_seeds))
+    
     def get_chaos_summary(self) -> str:
         """
         Generate a formatted summary of chaos input for prompt injection.
         Returns a string that can be prepended to creative agent prompts.
+        
+        The summary is cached until another concept or seed is added.
         """
+        key = self._summary_key()
+        cached_key = self._cache_key
+        if cached_key is not None and cached_key[0] == key[0] and cached_key[1] is key[1] and cached_key[2] == key[2]:
+            return self._cached_summary
+        summary = self._build_chaos_summary()
+        self._cached_summary = summary
+        self._cache_key = key
+        return summary
+    
+    def _build_chaos_summary(self) -> str:
         if not self.tangential_concepts:
             # Still provide seeds even if research failed
             if self.random_seeds:
@@ -47,15 +84,12 @@ class ChaosInput(BaseModel):
                 )
             return ""
         
-        lines = [
-            "DIVERGENT EXPLORATION SEEDS (use these to inspire unexpected creative directions):",
-            ""
-        ]
-        
-        for concept in self.tangential_concepts:
-            lines.append(f"• {concept.term}")
-            lines.append(f"  Context: {concept.context}")
-            lines.append(f"  Potential connection: {concept.relevance_note}")
-            lines.append("")
-        
-        return "\n".join(lines)
+        concepts = "\n".join(
+            _CONCEPT_BLOCK.format(
+                term=concept.term,
+                context=concept.context,
+                relevance_note=concept.relevance_note
+            )
+            for concept in self.tangential_concepts
+        )
+        return "DIVERGENT EXPLORATION SEEDS (use these to inspire unexpected creative directions):\n\n" + concepts
@@ -8,9 +8,21 @@ Provides a Pydantic-based state object that:
 4. Passes original prompt and metadata through the graph
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, Any, Dict, List
+from dataclasses import dataclass
 from datetime import datetime
+from creativity_agent.models.chaos_models import ChaosSeed
+from creativity_agent.models.observability_models import JudgeEvaluation
+import os
+
+# State dicts come from our own graph code, so they are trusted and rebuilt without
+# validation. Set CREATIVITY_VALIDATE_STATE=1 to validate them while debugging.
+_VALIDATE_STATE = os.getenv('CREATIVITY_VALIDATE_STATE') == '1'
+
+# Validators for the opaque list fields, applied only when read through their getters
+_CHAOS_SEEDS_ADAPTER = TypeAdapter(List[ChaosSeed], config=ConfigDict(defer_build=True))
+_JUDGE_EVALUATIONS_ADAPTER = TypeAdapter(List[JudgeEvaluation], config=ConfigDict(defer_build=True))
 
 
 class ExecutionState(BaseModel):
@@ -59,9 +71,9 @@ class ExecutionState(BaseModel):
         default=None,
         description="Chaos context/prompt built from tangential concepts"
     )
-    chaos_seeds: Optional[List[Dict[str, str]]] = Field(
+    chaos_seeds: Any = Field(
         default=None,
-        description="List of chaos seeds with concept, context, relevance"
+        description="List of ChaosSeed (concept, context, relevance) (unvalidated, see get_chaos_seeds)"
     )
     chaos_seeds_count: int = Field(
         default=0,
@@ -89,9 +101,9 @@ class ExecutionState(BaseModel):
     )
     
     # Judge state
-    judge_evaluations: Optional[List[Dict[str, Any]]] = Field(
+    judge_evaluations: Any = Field(
         default=None,
-        description="Judge evaluations for ideas"
+        description="Judge evaluation dicts for ideas (unvalidated, see get_judge_evaluations)"
     )
     idea_statistics: Optional[Dict[str, Any]] = Field(
         default=None,
@@ -118,10 +130,8 @@ class ExecutionState(BaseModel):
         description="Whether current step succeeded"
     )
     
-    class Config:
-        """Pydantic config for execution state."""
-        arbitrary_types_allowed = True
-        validate_assignment = True
+    # Nodes derive new states via with_updates(); instances are never mutated
+    model_config = ConfigDict(defer_build=True, arbitrary_types_allowed=True, frozen=True)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -130,7 +140,11 @@ class ExecutionState(BaseModel):
         Returns:
             Dictionary representation of state
         """
-        return self.model_dump(exclude_none=False)
+        # Every field is a primitive or plain list/dict, so a shallow copy of the
+        # field dict equals model_dump() without walking the schema. Nested values
+        # are shared, not copied: state is never mutated in place. The copy itself
+        # stays distinct because NodeInput.from_strands fills in missing keys.
+        return dict(self.__dict__)
     
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'ExecutionState':
@@ -144,8 +158,16 @@ class ExecutionState(BaseModel):
             ExecutionState instance
             
         Raises:
-            ValueError: If required fields are missing
+            ValueError: If required fields are missing (field values are only
+                validated when CREATIVITY_VALIDATE_STATE=1)
         """
+        if not _VALIDATE_STATE:
+            missing = _REQUIRED_STATE_FIELDS.difference(data)
+            if missing:
+                raise ValueError(
+                    f"Failed to create ExecutionState from dict: missing required fields {sorted(missing)}"
+                )
+            return ExecutionState.model_construct(**data)
         try:
             return ExecutionState(**data)
         except Exception as e:
@@ -155,31 +177,68 @@ class ExecutionState(BaseModel):
         """
         Create a new ExecutionState with specified updates.
         
+        The copy is shallow: fields not in `updates`, including lists and
+        dicts, are shared with this state rather than copied.
+        
         Args:
             **updates: Fields to update
             
         Returns:
             New ExecutionState with updates applied
         """
-        return self.model_copy(update=updates)
+        if _VALIDATE_STATE:
+            return ExecutionState(**{**self.__dict__, **updates})
+        # Updates come from our own nodes and are applied as-is, without
+        # revalidating the rest of the state
+        return ExecutionState.model_construct(
+            _fields_set=self.__pydantic_fields_set__ | updates.keys(),
+            **{**self.__dict__, **updates}
+        )
+    
+    def get_chaos_seeds(self) -> List[ChaosSeed]:
+        """
+        Validated chaos seeds.
+        
+        chaos_seeds is typed Any so the seed list isn't walked on every state
+        hop; it's only checked here, when a caller asks for typed access.
+        
+        Returns:
+            List of ChaosSeed (empty if none); seed dicts are converted
+        """
+        return _CHAOS_SEEDS_ADAPTER.validate_python(self.chaos_seeds or [])
+    
+    def get_judge_evaluations(self) -> List[JudgeEvaluation]:
+        """
+        Judge evaluations as JudgeEvaluation models, validated on read.
+        
+        Returns:
+            List of JudgeEvaluation (empty if none)
+        """
+        return _JUDGE_EVALUATIONS_ADAPTER.validate_python(self.judge_evaluations or [])
+
 
+# Checked by from_dict before its unvalidated model_construct
+_REQUIRED_STATE_FIELDS = frozenset(
+    name for name, field in ExecutionState.model_fields.items() if field.is_required()
+)
 
-class NodeInput(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class NodeInput:
     """
     Type-safe input for node execution.
     
-    Wraps the task input and execution state.
+    Wraps the task input and execution state. A plain dataclass rather than a
+    Pydantic model: it is built once per node hop from trusted graph data and
+    never serialized, so there is nothing for a validator to do.
     """
     
-    task: str = Field(
-        description="Input task/prompt for this node"
-    )
-    state: ExecutionState = Field(
-        description="Current execution state"
-    )
+    task: str                # Input task/prompt for this node
+    state: ExecutionState    # Current execution state
     
-    @staticmethod
+    @classmethod
     def from_strands(
+        cls,
         task: Any,
         invocation_state: Optional[Dict[str, Any]] = None
     ) -> 'NodeInput':
@@ -204,5 +263,4 @@ class NodeInput(BaseModel):
         if 'run_dir' not in state_dict:
             state_dict['run_dir'] = '.'
         
-        state = ExecutionState.from_dict(state_dict)
-        return NodeInput(task=task_str, state=state)
+        return cls(task=task_str, state=ExecutionState.from_dict(state_dict))
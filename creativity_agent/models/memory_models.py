@@ -2,12 +2,53 @@
 Pydantic models for tracking idea memory and exploration history.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, computed_field, model_validator
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 from datetime import datetime
+from pathlib import Path
+import heapq
+import logging
+import os
+import time
 
+logger = logging.getLogger(__name__)
 
-class ExploredIdea(BaseModel):
+
+class _TimestampedRecord(BaseModel):
+    """
+    Base for memory records stamped with their creation time.
+    
+    The time is kept as integer nanoseconds since the epoch (cheap to take and
+    to compare); `timestamp` exposes it as a datetime and is still written to
+    saved memory, so older files that only have `timestamp` load correctly.
+    """
+    
+    timestamp_ns: int = Field(
+        description="Creation time in nanoseconds since the epoch",
+        default_factory=time.time_ns
+    )
+    
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+    
+    @model_validator(mode='before')
+    @classmethod
+    def _timestamp_ns_from_timestamp(cls, data: Any) -> Any:
+        """Fill timestamp_ns from a saved `timestamp` when it's the only time given."""
+        if isinstance(data, dict) and 'timestamp_ns' not in data and data.get('timestamp') is not None:
+            timestamp = data['timestamp']
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            data = {**data, 'timestamp_ns': int(timestamp.timestamp() * 1_000_000_000)}
+        return data
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
+
+class ExploredIdea(_TimestampedRecord):
     """Represents an idea that has been explored and refined."""
     
     concept: str = Field(description="Core concept or theme of the idea")
@@ -16,26 +57,30 @@ class ExploredIdea(BaseModel):
         default_factory=list
     )
     iteration: int = Field(description="Iteration number when this was explored")
-    timestamp: datetime = Field(
-        description="When this idea was explored",
-        default_factory=datetime.now
-    )
     quality_score: Optional[float] = Field(
         description="Quality/feasibility score if assessed (0-1)",
         default=None
     )
+    
+    # This idea's entry in IdeaMemory.get_memory_summary (concept + top 3 key points)
+    _summary_line: str = PrivateAttr(default="")
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Built once per idea (records are frozen) instead of on every summary
+        self._summary_line = f"- {self.concept}\n" + "".join(f"  • {point}\n" for point in self.key_points[:3])
 
 
-class RejectedIdea(BaseModel):
+class RejectedIdea(_TimestampedRecord):
     """Represents an idea that was rejected and should not be regenerated."""
     
     concept: str = Field(description="Core concept that was rejected")
     reason: str = Field(description="Why this idea was rejected")
     iteration: int = Field(description="Iteration number when this was rejected")
-    timestamp: datetime = Field(
-        description="When this idea was rejected",
-        default_factory=datetime.now
-    )
+
+
+# Shared validators for loading saved memory, built once per process on first use
+_EXPLORED_ADAPTER = TypeAdapter(List[ExploredIdea], config=ConfigDict(defer_build=True))
+_REJECTED_ADAPTER = TypeAdapter(List[RejectedIdea], config=ConfigDict(defer_build=True))
 
 
 class IdeaMemory(BaseModel):
@@ -43,6 +88,8 @@ class IdeaMemory(BaseModel):
     Memory system for tracking explored and rejected ideas across iterations.
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     explored_ideas: List[ExploredIdea] = Field(
         description="List of ideas that have been explored",
         default_factory=list
@@ -52,6 +99,105 @@ class IdeaMemory(BaseModel):
         default_factory=list
     )
     
+    # Last summary and the list state it was built from (see _summary_key)
+    _cached_summary: Optional[str] = PrivateAttr(default=None)
+    _cache_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+    
+    # Append-only journal each added idea is written to (see open_journal)
+    _journal: Optional[TextIO] = PrivateAttr(default=None)
+    
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'IdeaMemory':
+        """
+        Build memory from a full JSON dump (the legacy idea_memory.json format).
+        
+        Args:
+            data: Parsed idea_memory.json contents
+            
+        Returns:
+            IdeaMemory with validated explored and rejected ideas
+        """
+        return cls.model_construct(
+            explored_ideas=_EXPLORED_ADAPTER.validate_python(data.get('explored_ideas', [])),
+            rejected_ideas=_REJECTED_ADAPTER.validate_python(data.get('rejected_ideas', []))
+        )
+    
+    @classmethod
+    def load_jsonl(cls, path: Path) -> 'IdeaMemory':
+        """
+        Rebuild memory from a journal written via open_journal, one line at a time.
+        
+        A torn last line (from an interrupted write) is skipped. Unreadable
+        lines elsewhere are skipped with a warning: a run that crashed mid-write
+        leaves one behind when the journal is reopened and appended to.
+        
+        Args:
+            path: Journal file ("explored" or "rejected", a tab, then the idea's JSON per line)
+            
+        Returns:
+            IdeaMemory with the journaled ideas in the order they were added
+        """
+        explored_ideas = []
+        rejected_ideas = []
+        bad_line = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                if bad_line is not None:
+                    logger.warning("Skipping unreadable line %d in memory journal %s", bad_line, path)
+                    bad_line = None
+                kind, _, record = line.partition('\t')
+                try:
+                    if kind == 'explored':
+                        explored_ideas.append(ExploredIdea.model_validate_json(record))
+                    elif kind == 'rejected':
+                        rejected_ideas.append(RejectedIdea.model_validate_json(record))
+                    else:
+                        raise ValueError(f"unknown record kind {kind!r}")
+                except ValueError:
+                    bad_line = line_number
+        if bad_line is not None:
+            logger.debug("Ignoring torn last line %d in memory journal %s", bad_line, path)
+        return cls.model_construct(explored_ideas=explored_ideas, rejected_ideas=rejected_ideas)
+    
+    def open_journal(self, path: Path, rewrite: bool = False) -> None:
+        """
+        Append every idea added from now on to a JSONL journal.
+        
+        Each addition costs one appended line, however large memory grows.
+        Lines are buffered; call sync_journal() to make them durable.
+        
+        Args:
+            path: Journal file
+            rewrite: Start the file over with the ideas already in memory
+                (instead of appending to what's there)
+        """
+        self.close_journal()
+        self._journal = open(path, 'w' if rewrite else 'a', encoding='utf-8')
+        if not rewrite and self._journal.tell() > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    # Terminate a torn last line so the next record starts on its own line
+                    self._journal.write('\n')
+        if rewrite:
+            self._journal.writelines(f"explored\t{idea.model_dump_json()}\n" for idea in self.explored_ideas)
+            self._journal.writelines(f"rejected\t{idea.model_dump_json()}\n" for idea in self.rejected_ideas)
+    
+    def sync_journal(self) -> None:
+        """Flush the journal and fsync it to disk."""
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+    
+    def close_journal(self) -> None:
+        """Sync and close the journal, if one is open."""
+        if self._journal is not None:
+            self.sync_journal()
+            self._journal.close()
+            self._journal = None
+    
     def add_explored_idea(
         self, 
         concept: str, 
@@ -67,6 +213,8 @@ class IdeaMemory(BaseModel):
             quality_score=quality_score
         )
         self.explored_ideas.append(idea)
+        if self._journal is not None:
+            self._journal.write(f"explored\t{idea.model_dump_json()}\n")
     
     def add_rejected_idea(
         self,
@@ -81,36 +229,54 @@ class IdeaMemory(BaseModel):
             iteration=iteration
         )
         self.rejected_ideas.append(idea)
+        if self._journal is not None:
+            self._journal.write(f"rejected\t{idea.model_dump_json()}\n")
+    
+    def _summary_key(self) -> Tuple[Any, ...]:
+        """Cheap fingerprint of the idea lists, which are only ever appended to."""
+        explored = self.explored_ideas
+        rejected = self.rejected_ideas
+        return (
+            len(explored), explored[-1] if explored else None,
+            len(rejected), rejected[-1] if rejected else None
+        )
     
     def get_memory_summary(self) -> str:
         """
         Generate a formatted summary of memory for prompt injection.
         Returns a string that can be prepended to agent prompts.
+        
+        The summary is cached until another idea is added.
         """
-        lines = []
+        key = self._summary_key()
+        cached_key = self._cache_key
+        if (
+            cached_key is not None
+            and cached_key[0] == key[0] and cached_key[1] is key[1]
+            and cached_key[2] == key[2] and cached_key[3] is key[3]
+        ):
+            return self._cached_summary
+        summary = self._build_memory_summary()
+        self._cached_summary = summary
+        self._cache_key = key
+        return summary
+    
+    def _build_memory_summary(self) -> str:
+        sections = []
         
         if self.explored_ideas:
-            lines.append("PREVIOUSLY EXPLORED IDEAS (do not regenerate these exact concepts):")
-            for idea in self.explored_ideas:
-                lines.append(f"- {idea.concept}")
-                if idea.key_points:
-                    for point in idea.key_points[:3]:  # Limit to top 3 points
-                        lines.append(f"  • {point}")
-            lines.append("")
+            # Each idea's line (with up to its top 3 key points) is prebuilt
+            explored = "".join(idea._summary_line for idea in self.explored_ideas)
+            sections.append(f"PREVIOUSLY EXPLORED IDEAS (do not regenerate these exact concepts):\n{explored}")
         
         if self.rejected_ideas:
-            lines.append("REJECTED IDEAS (avoid these directions entirely):")
-            for idea in self.rejected_ideas:
-                lines.append(f"- {idea.concept}: {idea.reason}")
-            lines.append("")
+            rejected = "\n".join(f"- {idea.concept}: {idea.reason}" for idea in self.rejected_ideas)
+            sections.append(f"REJECTED IDEAS (avoid these directions entirely):\n{rejected}\n")
         
-        return "\n".join(lines) if lines else ""
+        return "\n".join(sections)
     
     def get_recent_concepts(self, limit: int = 10) -> List[str]:
         """Get the most recent explored concepts."""
-        sorted_ideas = sorted(
-            self.explored_ideas,
-            key=lambda x: x.timestamp,
-            reverse=True
-        )
-        return [idea.concept for idea in sorted_ideas[:limit]]
+        # Top-K selection; same order as sorted(..., reverse=True)[:limit]
+        recent_ideas = heapq.nlargest(limit, self.explored_ideas, key=lambda x: x.timestamp_ns)
+        return [idea.concept for idea in recent_ideas]
@@ -1,10 +1,26 @@
 """
 Observability and metrics tracking models for comprehensive monitoring.
 """
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 from enum import Enum
+import sys
+import time
+
+
+def epoch_ms() -> int:
+    """Current time in milliseconds since the epoch (ElasticSearch date fields accept it as-is)."""
+    return time.time_ns() // 1_000_000
+
+
+def _to_epoch_ms(value: Any) -> Any:
+    """Convert a datetime (or ISO string) to epoch milliseconds; other values pass through."""
+    if isinstance(value, str) and not value.lstrip('-').isdigit():
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return value
 
 
 class ModelType(str, Enum):
@@ -39,9 +55,14 @@ class IdeaStatistics(BaseModel):
     median_quality_score: Optional[float] = Field(default=None, description="Median quality score across all ideas")
     mean_quality_score: Optional[float] = Field(default=None, description="Mean quality score across all ideas")
 
+    # Computed once per evaluation and never updated
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class TokenUtilization(BaseModel):
     """Token usage tracking for model invocations."""
+    model_config = ConfigDict(defer_build=True)
+
     input_tokens: int = Field(description="Number of input tokens consumed")
     output_tokens: int = Field(description="Number of output tokens generated")
     total_tokens: int = Field(description="Total tokens (input + output)")
@@ -50,6 +71,8 @@ class TokenUtilization(BaseModel):
 
 class StepMetrics(BaseModel):
     """Metrics for a single agent step execution."""
+    model_config = ConfigDict(defer_build=True)
+
     step_id: str = Field(description="Step identifier (e.g., 'ah', 'al', 'bh', 'bl')")
     model_id: str = Field(description="AWS Bedrock model ID used")
     model_type: ModelType = Field(description="Model type for aggregation")
@@ -68,10 +91,19 @@ class StepMetrics(BaseModel):
     
     error: Optional[str] = Field(default=None, description="Error message if step failed")
     success: bool = Field(default=True, description="Whether step completed successfully")
+    
+    @field_validator('step_id', 'model_id', 'prompt_file', mode='before')
+    @classmethod
+    def _intern_repeated_strings(cls, value: Any) -> Any:
+        # The same few ids and prompt files repeat across every step of a run;
+        # interning shares one string object between all of them
+        return sys.intern(value) if isinstance(value, str) else value
 
 
 class IterationMetrics(BaseModel):
     """Metrics for a complete iteration through the agent flow."""
+    model_config = ConfigDict(defer_build=True)
+
     iteration_number: int = Field(description="Iteration number (0-indexed)")
     steps: List[StepMetrics] = Field(description="Metrics for each step in iteration")
     
@@ -83,10 +115,76 @@ class IterationMetrics(BaseModel):
     total_token_usage: TokenUtilization = Field(description="Total token usage for iteration")
 
 
+class BreakdownColumns(BaseModel):
+    """
+    Per-group step totals stored column-wise (one list per metric).
+    
+    Row i of every column belongs to keys[i]. Aggregation only appends to or
+    adds into flat lists; the dict-per-group form RunMetrics stores is built
+    once at the end by to_breakdown().
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    keys: List[str] = Field(default_factory=list, description="Group key of each row (model type or temperature type)")
+    durations: List[float] = Field(default_factory=list, description="Total step duration per group")
+    tokens: List[int] = Field(default_factory=list, description="Total tokens per group")
+    ideas: List[int] = Field(default_factory=list, description="Total ideas generated per group")
+    step_counts: List[int] = Field(default_factory=list, description="Number of steps per group")
+    
+    @classmethod
+    def from_steps(cls, steps: Iterable[StepMetrics], group_by: str) -> 'BreakdownColumns':
+        """
+        Total steps per value of an enum attribute.
+        
+        Args:
+            steps: Steps to aggregate
+            group_by: StepMetrics attribute to group on ('model_type' or 'temperature_type')
+        
+        Returns:
+            Columns with one row per group, in first-seen order
+        """
+        columns = cls.model_construct(keys=[], durations=[], tokens=[], ideas=[], step_counts=[])
+        keys, durations, tokens, ideas, step_counts = (
+            columns.keys, columns.durations, columns.tokens, columns.ideas, columns.step_counts
+        )
+        row_of: Dict[str, int] = {}
+        for step in steps:
+            key = getattr(step, group_by).value
+            row = row_of.get(key)
+            if row is None:
+                row = row_of[key] = len(keys)
+                keys.append(key)
+                durations.append(0.0)
+                tokens.append(0)
+                ideas.append(0)
+                step_counts.append(0)
+            durations[row] += step.duration_seconds
+            tokens[row] += step.token_usage.total_tokens
+            ideas[row] += step.ideas_generated
+            step_counts[row] += 1
+        return columns
+    
+    def to_breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """Reshape into the {key: {metric: total}} form stored on RunMetrics."""
+        return {
+            key: {
+                "total_duration_seconds": duration,
+                "total_tokens": token_count,
+                "total_ideas": idea_count,
+                "step_count": step_count
+            }
+            for key, duration, token_count, idea_count, step_count in zip(
+                self.keys, self.durations, self.tokens, self.ideas, self.step_counts
+            )
+        }
+
+
 class RunMetrics(BaseModel):
     """Complete metrics for an entire run (all iterations)."""
+    model_config = ConfigDict(defer_build=True)
+
     run_id: str = Field(description="Unique run identifier (timestamp-based)")
-    run_timestamp: datetime = Field(description="Start time of the run")
+    run_timestamp: int = Field(default_factory=epoch_ms, description="Start time of the run (epoch ms)")
     
     original_prompt: str = Field(description="Original user prompt")
     config_iterations: int = Field(description="Number of iterations configured")
@@ -112,14 +210,85 @@ class RunMetrics(BaseModel):
     
     success: bool = Field(default=True, description="Whether run completed successfully")
     error: Optional[str] = Field(default=None, description="Error message if run failed")
+    converged: bool = Field(default=False, description="Whether the run stopped early because judge scores converged")
+    iterations_completed: Optional[int] = Field(default=None, description="Number of iterations actually run")
     
     # ElasticSearch metadata
     index_name: str = Field(default="super-creativity", description="ElasticSearch index name")
-    indexed_at: Optional[datetime] = Field(default=None, description="When this was indexed to ES")
+    indexed_at: Optional[int] = Field(default=None, description="When this was indexed to ES (epoch ms)")
+    
+    @field_validator('run_timestamp', 'indexed_at', mode='before')
+    @classmethod
+    def _timestamps_to_epoch_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value)
+
+    @classmethod
+    def bulk_index(
+        cls,
+        metrics: List['RunMetrics'],
+        es_client: Any,
+        chunk_size: int = 500,
+        thread_count: int = 4,
+        refresh_disable_threshold: int = 1000
+    ) -> int:
+        """
+        Index many runs with parallel bulk requests.
+
+        For large batches, refresh is disabled on the target indices for the
+        duration of the write and restored afterwards. Small batches (the usual
+        end-of-run flush) leave the shared index settings alone, so concurrent
+        runs can't leave refresh disabled. Documents are keyed by run_id, so
+        re-indexing the same run overwrites it.
+
+        Args:
+            metrics: Runs to index
+            es_client: Elasticsearch client
+            chunk_size: Documents per bulk request
+            thread_count: Concurrent bulk requests
+            refresh_disable_threshold: Minimum batch size that disables refresh
+
+        Returns:
+            Number of documents indexed successfully
+        """
+        from elasticsearch.helpers import parallel_bulk
+
+        if not metrics:
+            return 0
+
+        index_names = sorted({m.index_name for m in metrics})
+        previous_intervals = {}
+        for index_name in (index_names if len(metrics) >= refresh_disable_threshold else ()):
+            settings = es_client.indices.get_settings(index=index_name, name="index.refresh_interval")
+            previous_intervals[index_name] = (
+                settings.get(index_name, {}).get("settings", {}).get("index", {}).get("refresh_interval")
+            )
+            es_client.indices.put_settings(index=index_name, settings={"index": {"refresh_interval": "-1"}})
+
+        actions = (
+            {"_index": m.index_name, "_id": m.run_id, "_source": m.model_dump(mode='json')}
+            for m in metrics
+        )
+        indexed = 0
+        try:
+            for ok, _ in parallel_bulk(
+                es_client,
+                actions,
+                chunk_size=chunk_size,
+                thread_count=thread_count
+            ):
+                indexed += ok
+        finally:
+            for index_name, interval in previous_intervals.items():
+                # None resets the setting to the index default
+                es_client.indices.put_settings(index=index_name, settings={"index": {"refresh_interval": interval}})
+
+        return indexed
 
 
 class JudgeEvaluation(BaseModel):
     """Evaluation from the independent judge."""
+    model_config = ConfigDict(defer_build=True)
+
     idea_id: str = Field(description="Unique identifier for the idea")
     idea_name: str = Field(description="Name/title of the idea")
     
@@ -138,5 +307,10 @@ class JudgeEvaluation(BaseModel):
     temperature: float = Field(description="Temperature used when generating idea")
     iteration: int = Field(description="Iteration in which idea was generated")
     
-    evaluation_timestamp: datetime = Field(description="When this evaluation was performed")
+    evaluation_timestamp: int = Field(default_factory=epoch_ms, description="When this evaluation was performed (epoch ms)")
     judge_model: str = Field(description="Judge model used for evaluation")
+    
+    @field_validator('evaluation_timestamp', mode='before')
+    @classmethod
+    def _timestamp_to_epoch_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value)
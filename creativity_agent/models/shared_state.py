@@ -9,8 +9,10 @@ and share mutable state across the graph execution.
 All fields are type-safe with Pydantic validation.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from typing import Optional, Dict, Any, List
+from collections import Counter
+import threading
 
 
 class SharedState(BaseModel):
@@ -41,20 +43,48 @@ class SharedState(BaseModel):
     
     # Execution tracking
     nodes_executed: Dict[str, int] = Field(
-        default_factory=dict,
+        default_factory=Counter,
         description="Count of how many times each node has executed"
     )
     
+    # Judge quality tracking (one entry per completed iteration)
+    quality_history: List[float] = Field(
+        default_factory=list,
+        description="Mean quality score of accepted ideas for each iteration"
+    )
+    accepted_history: List[int] = Field(
+        default_factory=list,
+        description="Number of ideas accepted in each iteration"
+    )
+    
+    # Parsed judge output, keyed by iteration then model key
+    judge_results: Dict[int, Dict[str, Dict[str, Any]]] = Field(
+        default_factory=dict,
+        description="Parsed judge JSON output for each iteration and model"
+    )
+    
     # Custom shared data
     custom_data: Dict[str, Any] = Field(
         default_factory=dict,
         description="Custom key-value store for node communication"
     )
     
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-        validate_assignment = True
+    # Guards read-modify-write updates from nodes running in parallel
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    
+    # Nodes set fields on every hop; they're trusted, so assignments aren't re-validated
+    model_config = ConfigDict(defer_build=True, arbitrary_types_allowed=True, validate_assignment=False)
+    
+    @field_validator('nodes_executed')
+    @classmethod
+    def _as_counter(cls, value: Dict[str, int]) -> Counter:
+        """Keep execution counts in a Counter so recording is a single increment."""
+        return Counter(value)
+    
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock for compound updates made by concurrently executing nodes."""
+        return self._lock
     
     def increment_iteration(self) -> int:
         """Increment iteration and return new value."""
@@ -72,9 +102,19 @@ class SharedState(BaseModel):
     
     def record_node_execution(self, node_name: str):
         """Record that a node has executed."""
-        if node_name not in self.nodes_executed:
-            self.nodes_executed[node_name] = 0
-        self.nodes_executed[node_name] += 1
+        with self._lock:
+            self.nodes_executed[node_name] += 1
+    
+    def record_iteration_quality(self, mean_quality: float, accepted_count: int):
+        """Record judge results for a completed iteration."""
+        with self._lock:
+            self.quality_history.append(mean_quality)
+            self.accepted_history.append(accepted_count)
+    
+    def record_judge_result(self, iteration: int, model_key: str, judge_data: Dict[str, Any]):
+        """Cache a judge's parsed output for an iteration."""
+        with self._lock:
+            self.judge_results.setdefault(iteration, {})[model_key] = judge_data
     
     def get_node_execution_count(self, node_name: str) -> int:
         """Get how many times a node has executed."""
@@ -0,0 +1,43 @@
+"""
+Strict Pydantic models for all data structures in the creativity agent system.
+
+Core models are imported eagerly; the summary-only models in _extras are
+imported on first attribute access (PEP 562).
+"""
+
+from ._core import (
+    NodeType,
+    NodeTypeValue,
+    TemperatureType,
+    InvocationState,
+    NodeOutput,
+    ChaosInput,
+    IdeaEvaluation,
+    ExploredIdea,
+    RejectedIdea,
+)
+
+_EXTRAS = frozenset({'IterationMetrics', 'RunSummary', 'NodeConfiguration'})
+
+
+def __getattr__(name: str):
+    if name in _EXTRAS:
+        from . import _extras
+        return getattr(_extras, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'NodeType',
+    'NodeTypeValue',
+    'TemperatureType',
+    'InvocationState',
+    'NodeOutput',
+    'ChaosInput',
+    'IdeaEvaluation',
+    'ExploredIdea',
+    'RejectedIdea',
+    'IterationMetrics',
+    'RunSummary',
+    'NodeConfiguration',
+]
@@ -0,0 +1,250 @@
+"""
+Core workflow models, imported with the package.
+
+Eliminates duck typing and ensures type safety throughout the codebase.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from typing import Any, List, Dict, Literal, Optional, Union, get_args
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+import time
+
+# Shared by every model here: unknown fields are dropped, and instances are
+# mutable but never re-validated on assignment
+_MODEL_CONFIG = ConfigDict(defer_build=True, extra='ignore', frozen=False, validate_assignment=False)
+
+
+class _Timestamped(BaseModel):
+    """
+    Base for Pydantic models stamped with their creation time.
+    
+    The time is taken as integer nanoseconds (time.time_ns, no datetime
+    allocated); `timestamp` derives the datetime only when read or dumped.
+    """
+    
+    model_config = _MODEL_CONFIG
+    
+    timestamp_ns: int = Field(default_factory=time.time_ns)  # Creation time, ns since the epoch
+    
+    @model_validator(mode='before')
+    @classmethod
+    def _timestamp_ns_from_timestamp(cls, data: Any) -> Any:
+        """Fill timestamp_ns from an explicit `timestamp` when it's the only time given."""
+        if isinstance(data, dict) and 'timestamp_ns' not in data and data.get('timestamp') is not None:
+            timestamp = data['timestamp']
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            data = {**data, 'timestamp_ns': int(timestamp.timestamp() * 1_000_000_000)}
+        return data
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
+
+class NodeType(str, Enum):
+    """Types of nodes in the graph."""
+    CHAOS_GENERATOR = "chaos_generator"
+    CREATIVE_AGENT = "creative_agent"
+    REFINEMENT_AGENT = "refinement_agent"
+    JUDGE = "judge"
+
+
+# NodeType's values as a Literal (kept in sync by the check below). pydantic-core matches a
+# Literal with a set lookup and returns the interned literal string, where an
+# Enum field goes through Enum coercion. NodeType members still validate and
+# compare equal, being str subclasses.
+NodeTypeValue = Literal["chaos_generator", "creative_agent", "refinement_agent", "judge"]
+# Explicit check rather than assert, so it still runs under python -O
+if set(get_args(NodeTypeValue)) != {member.value for member in NodeType}:
+    raise RuntimeError("NodeTypeValue is out of sync with NodeType")
+
+
+class TemperatureType(str, Enum):
+    """Temperature settings for agent execution."""
+    HIGH = "high"  # Divergent thinking
+    LOW = "low"    # Refinement/convergence
+
+
+class InvocationState(BaseModel):
+    """Strict type definition for graph invocation state."""
+    
+    model_config = _MODEL_CONFIG
+    
+    iteration: int = Field(ge=0)
+    original_prompt: str
+    
+    # Chaos context for divergent thinking: seeds and tangential concepts
+    chaos_context: Optional[str] = ""
+    chaos_seeds_count: int = 0
+    
+    # Memory context: summary of previously explored ideas
+    memory_context: Optional[str] = ""
+    
+    # Refinement output for judge evaluation
+    refinement_output: Optional[str] = ""
+    
+    # Judge evaluation results
+    idea_statistics: Optional[Dict[str, Union[int, float]]] = None
+    evaluations: List[Dict] = Field(default_factory=list)
+    accepted_ideas_count: int = 0
+    
+    # Iteration control
+    should_continue: bool = True
+    is_finished: bool = False  # All iterations are complete
+    
+    # Run metadata: directory for run outputs
+    run_dir: Optional[str] = None
+    
+    # Model ID and temperature used in the current step
+    step_model_id: Optional[str] = None
+    step_temp: float = 0.7
+    
+    # Status tracking for the current step
+    success: bool = True
+    error: Optional[str] = None
+
+
+class NodeOutput(_Timestamped):
+    """Strict output structure from node execution."""
+    
+    model_config = _MODEL_CONFIG
+    
+    node_name: str
+    node_type: NodeTypeValue
+    
+    status: str  # COMPLETED, FAILED, etc
+    message: str
+    
+    execution_time: int = Field(ge=0)  # Seconds
+    execution_time_us: int = Field(default=0, ge=0)  # Microseconds, for sub-second nodes
+    
+    state_updates: InvocationState
+    
+    output_content: Optional[str] = None
+    error_details: Optional[str] = None  # Set if execution failed
+
+
+@dataclass(slots=True)
+class ChaosInput:
+    """
+    Structured chaos generation input.
+    
+    A plain dataclass: it is built only from trusted chaos generator output,
+    so it skips Pydantic validation.
+    """
+    
+    original_prompt: str
+    tangential_concepts: List[str]  # Tangential concepts for divergent thinking
+    iteration: int
+    
+    def get_chaos_summary(self) -> str:
+        """Get a formatted summary of chaos input."""
+        header = (
+            f"Original Request: {self.original_prompt}\n"
+            f"Iteration: {self.iteration}\n"
+            "\nTangential Concepts for Exploration:"
+        )
+        if not self.tangential_concepts:
+            return header
+        return header + "\n" + "\n".join(
+            f"  {i}. {concept}" for i, concept in enumerate(self.tangential_concepts, 1)
+        )
+
+
+_SUB_SCORES = ('originality_score', 'feasibility_score', 'impact_score', 'substance_score')
+
+
+class IdeaEvaluation(_Timestamped):
+    """Structured idea evaluation from judge. Scores are on a 0-10 scale."""
+    
+    model_config = _MODEL_CONFIG
+    
+    idea_id: str
+    idea_name: str
+    
+    originality_score: float = Field(ge=0, le=10)
+    feasibility_score: float = Field(ge=0, le=10)
+    impact_score: float = Field(ge=0, le=10)
+    substance_score: float = Field(ge=0, le=10)
+    
+    accepted: bool
+    rejection_reasons: List[str] = Field(default_factory=list)
+    key_points: List[str] = Field(default_factory=list)
+    
+    model_id: str  # Model that generated the idea
+    temperature: float
+    iteration: int = Field(ge=0)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def _sub_scores_from_overall(cls, data: Any) -> Any:
+        """Use a judge-supplied overall_quality_score for any missing sub-score."""
+        if isinstance(data, dict) and data.get('overall_quality_score') is not None:
+            overall = data['overall_quality_score']
+            data = {**data}
+            for name in _SUB_SCORES:
+                data.setdefault(name, overall)
+        return data
+    
+    @computed_field
+    @property
+    def overall_quality_score(self) -> float:
+        """Mean of the four sub-scores."""
+        return (
+            self.originality_score + self.feasibility_score
+            + self.impact_score + self.substance_score
+        ) / 4.0
+
+
+@dataclass(slots=True)
+class ExploredIdea:
+    """
+    Structured record of an explored idea in memory.
+    
+    A plain dataclass, like RejectedIdea: both are built from the memory
+    tracker's own data and are not validated.
+    """
+    
+    concept: str
+    iteration: int  # Iteration discovered
+    key_points: List[str] = field(default_factory=list)
+    quality_score: float = 5.0  # 0-10, if evaluated
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
+
+@dataclass(slots=True)
+class RejectedIdea:
+    """Structured record of a rejected idea."""
+    
+    concept: str
+    reason: str  # Why it was rejected
+    iteration: int  # Iteration rejected
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
+
+__all__ = [
+    'NodeType',
+    'NodeTypeValue',
+    'TemperatureType',
+    'InvocationState',
+    'NodeOutput',
+    'ChaosInput',
+    'IdeaEvaluation',
+    'ExploredIdea',
+    'RejectedIdea',
+]
@@ -0,0 +1,93 @@
+"""
+Run summary and configuration models, imported on first access.
+
+Only run summaries and node configuration use these, so the package defers
+creating them (see workflow_models.__getattr__).
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Union
+from datetime import datetime
+
+from ._core import _MODEL_CONFIG, _Timestamped, NodeType
+
+
+class IterationMetrics(_Timestamped):
+    """Metrics for a single iteration."""
+    
+    model_config = _MODEL_CONFIG
+    
+    iteration: int = Field(ge=0)
+    
+    ideas_generated: int = Field(default=0, ge=0)
+    ideas_evaluated: int = Field(default=0, ge=0)
+    ideas_accepted: int = Field(default=0, ge=0)
+    ideas_rejected: int = Field(default=0, ge=0)
+    
+    execution_time_seconds: int = Field(default=0, ge=0)
+    
+    chaos_seeds_generated: int = Field(default=0, ge=0)
+
+
+class RunSummary(BaseModel):
+    """Summary of a complete run."""
+    
+    model_config = _MODEL_CONFIG
+    
+    run_id: str = Field(description="Unique run identifier")
+    original_prompt: str = Field(description="Original user prompt")
+    
+    total_iterations: int = Field(description="Total iterations completed", ge=0)
+    total_ideas_explored: int = Field(default=0, ge=0)
+    total_ideas_evaluated: int = Field(default=0, ge=0)
+    total_accepted: int = Field(default=0, ge=0)
+    total_rejected: int = Field(default=0, ge=0)
+    
+    iteration_metrics: List[IterationMetrics] = Field(
+        default_factory=list,
+        description="Per-iteration metrics"
+    )
+    
+    success: bool = Field(description="Whether run succeeded")
+    error_message: Optional[str] = Field(default=None)
+    
+    start_time: datetime = Field(description="Run start time")
+    end_time: Optional[datetime] = Field(default=None)
+    total_duration_seconds: int = Field(default=0, ge=0)
+    
+    output_file_path: Optional[str] = Field(default=None)
+
+
+class NodeConfiguration(BaseModel):
+    """Configuration for a specific node."""
+    
+    model_config = _MODEL_CONFIG
+    
+    node_name: str = Field(description="Node identifier")
+    node_type: NodeType = Field(description="Type of node")
+    
+    enabled: bool = Field(default=True)
+    
+    # Optional parameters by type
+    temperature: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=2,
+        description="Temperature for agent execution"
+    )
+    model_id: Optional[str] = Field(default=None)
+    max_iterations: Optional[int] = Field(default=None, ge=1)
+    timeout_seconds: Optional[int] = Field(default=None, ge=1)
+    
+    # Custom parameters
+    custom_params: Dict[str, Union[str, int, float, bool]] = Field(
+        default_factory=dict,
+        description="Additional node-specific parameters"
+    )
+
+
+__all__ = [
+    'IterationMetrics',
+    'RunSummary',
+    'NodeConfiguration',
+]
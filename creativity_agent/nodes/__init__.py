@@ -6,8 +6,8 @@ Exports all node types for clean imports.
 
 from creativity_agent.nodes.base_node import BaseNode
 from creativity_agent.nodes.chaos_generator_node import ChaosGeneratorNode
-from creativity_agent.nodes.iteration_controller_node import IterationControllerNode
 from creativity_agent.nodes.judge_node import JudgeNode
+from creativity_agent.nodes.batch_judge_node import BatchJudgeNode
 from creativity_agent.nodes.mock_agent import MockAgent, MockChaosNode, MockJudgeNode
 from creativity_agent.nodes.creative_agent_node import CreativeAgentNode
 from creativity_agent.nodes.refinement_agent_node import RefinementAgentNode
@@ -15,8 +15,8 @@ from creativity_agent.nodes.refinement_agent_node import RefinementAgentNode
 __all__ = [
     'BaseNode',
     'ChaosGeneratorNode',
-    'IterationControllerNode',
     'JudgeNode',
+    'BatchJudgeNode',
     'MockAgent',
     'MockChaosNode',
     'MockJudgeNode',
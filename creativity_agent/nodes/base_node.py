@@ -16,12 +16,42 @@ from strands.agent.agent_result import AgentResult
 from strands.types.content import ContentBlock, Message
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
+from functools import lru_cache, partial
 from creativity_agent.models import ExecutionState, NodeInput, SharedState
+from creativity_agent.utilities import BufferedOutputWriter, write_file
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _read_prompt(path: str) -> str:
+    """Read a prompt file once; missing files raise and are not cached."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _iter_text(content_blocks):
+    """Yield the text of dict or object content blocks, skipping tool_use blocks."""
+    for block in content_blocks:
+        if isinstance(block, dict):
+            if block.get('type') != 'tool_use':
+                text = block.get('text')
+                if text:
+                    yield text
+        elif getattr(block, 'type', None) != 'tool_use':
+            text = getattr(block, 'text', None)
+            if text:
+                yield str(text)
+
+
+def _content_to_text(task: Union[str, list[ContentBlock]]) -> str:
+    """Return a node's task as plain text, joining the text of its content blocks."""
+    if isinstance(task, str):
+        return task
+    return "\n".join(_iter_text(task))
+
+
 class BaseNode(MultiAgentBase, ABC):
     """
     Base class for all creativity flow nodes.
@@ -41,7 +71,8 @@ class BaseNode(MultiAgentBase, ABC):
         node_name: str,
         shared_state: SharedState,
         prompts_dir: Optional[Path] = None,
-        outputs_dir: Optional[Path] = None
+        outputs_dir: Optional[Path] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
     ):
         """
         Initialize base node.
@@ -51,12 +82,14 @@ class BaseNode(MultiAgentBase, ABC):
             shared_state: SharedState instance for node coordination
             prompts_dir: Directory containing prompt templates
             outputs_dir: Directory for saving node outputs
+            output_writer: Optional background writer for output files (writes synchronously if None)
         """
         super().__init__()
         self.name = node_name
         self.shared_state = shared_state
         self.prompts_dir = prompts_dir or Path(__file__).parent.parent / "prompts"
         self.outputs_dir = outputs_dir
+        self.output_writer = output_writer
     
     def _get_typed_input(
         self,
@@ -79,7 +112,7 @@ class BaseNode(MultiAgentBase, ABC):
         try:
             return NodeInput.from_strands(task, invocation_state)
         except Exception as e:
-            logger.error(f"Failed to parse input for {self.name}: {e}")
+            logger.error("Failed to parse input for %s: %s", self.name, e)
             raise
     
     def load_prompt(self, prompt_name: str) -> str:
@@ -94,38 +127,72 @@ class BaseNode(MultiAgentBase, ABC):
         """
         prompt_file = self.prompts_dir / f"{prompt_name}.txt"
         
-        if prompt_file.exists():
-            return prompt_file.read_text(encoding='utf-8')
-        else:
-            logger.warning(f"Prompt file not found: {prompt_file}")
+        try:
+            return _read_prompt(str(prompt_file.resolve()))
+        except FileNotFoundError:
+            logger.warning("Prompt file not found: %s", prompt_file)
             return ""
     
     def save_output(self, filename: str, content: str) -> Optional[Path]:
         """
         Save node output to file.
         
+        The write goes to output_writer when configured; otherwise it runs in
+        the default executor when called from a running event loop, and a
+        failure is logged when the write completes.
+        
         Args:
             filename: Output filename
             content: Content to save
             
         Returns:
-            Path to saved file or None if no outputs_dir
+            Path to the saved (or queued) file; None if no outputs_dir, the
+            write failed, or it is still running in the executor
         """
         if not self.outputs_dir:
-            logger.warning(f"No outputs_dir configured for {self.name}")
+            logger.warning("No outputs_dir configured for %s", self.name)
             return None
         
         output_file = self.outputs_dir / filename
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        logger.info(f"Saved {self.name} output to {output_file}")
+        if self.output_writer:
+            self.output_writer.submit(output_file, content)
+            logger.info("Queued %s output for %s", self.name, output_file)
+            return output_file
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            # Called from invoke_async: keep the disk write off the event loop
+            future = loop.run_in_executor(None, write_file, output_file, content)
+            future.add_done_callback(partial(self._on_background_write_done, output_file))
+            logger.info("Writing %s output to %s in the background", self.name, output_file)
+            return None
+
+        try:
+            write_file(output_file, content)
+        except Exception as e:
+            logger.error("Failed to write output file %s: %s", output_file, e)
+            return None
+        logger.info("Saved %s output to %s", self.name, output_file)
         return output_file
+
+    def _on_background_write_done(self, output_file: Path, future: asyncio.Future) -> None:
+        """Log the outcome of a save_output write that ran in the executor."""
+        if future.cancelled():
+            logger.warning("Write of output file %s was cancelled", output_file)
+        elif future.exception() is not None:
+            logger.error("Failed to write output file %s: %s", output_file, future.exception())
+        else:
+            logger.info("Saved %s output to %s", self.name, output_file)
     
     def create_result(
         self,
         message: str,
         state: ExecutionState,
-        execution_time: int = 1,
+        execution_time_us: int = 0,
         status: Status = Status.COMPLETED
     ) -> MultiAgentResult:
         """
@@ -134,7 +201,7 @@ class BaseNode(MultiAgentBase, ABC):
         Args:
             message: Result message
             state: Updated ExecutionState
-            execution_time: Node execution time in seconds
+            execution_time_us: Node execution time in microseconds
             status: Execution status
             
         Returns:
@@ -146,6 +213,8 @@ class BaseNode(MultiAgentBase, ABC):
             state=state.to_dict(),
             metrics=None # type: ignore
         )
+        # Strands reports execution times in milliseconds
+        execution_time = execution_time_us // 1000
 
         return MultiAgentResult(
             status=status,
@@ -170,7 +239,9 @@ class BaseNode(MultiAgentBase, ABC):
             Error result
         """
         error_msg = f"Error in {self.name}: {str(error)}"
-        logger.error(error_msg, exc_info=True)
+        logger.error("Error in %s: %s", self.name, error)
+        # Formatting the traceback walks frames and reads source files; only do it when debugging
+        logger.debug("Traceback for %s error", self.name, exc_info=error)
         
         # Update state to indicate failure
         error_state = state.with_updates(
@@ -203,48 +274,20 @@ class BaseNode(MultiAgentBase, ABC):
         str_result = ""
         
         try:
-            # Try to access message content via structured attributes
-            if hasattr(agent_result, 'message') and agent_result.message:
-                message = agent_result.message
-                
-                # Try dict-style access first (TypedDict)
-                try:
-                    if 'content' in message:
-                        content_list = message['content']
-                        for content_block in content_list:
-                            # Skip tool use blocks, only collect text
-                            if isinstance(content_block, dict):
-                                # Filter out tool_use and tool_result blocks
-                                if 'text' in content_block and content_block.get('type') != 'tool_use':
-                                    str_result += content_block['text']
-                                elif 'text' in content_block and 'type' not in content_block:
-                                    # Plain text dict
-                                    str_result += content_block['text']
-                            elif not isinstance(content_block, dict) and hasattr(content_block, 'text'):
-                                # Object with text attribute - check if it's not a tool block
-                                if not hasattr(content_block, 'type') or content_block.type != 'tool_use':
-                                    str_result += str(content_block.text)
-                except (TypeError, KeyError):
-                    # If dict access fails, try attribute access
-                    if hasattr(message, 'content'):
-                        content_list = message.content
-                        for content_block in content_list:
-                            # Skip tool use blocks, only collect text
-                            if isinstance(content_block, dict):
-                                if 'text' in content_block and content_block.get('type') != 'tool_use':
-                                    str_result += content_block['text']
-                                elif 'text' in content_block and 'type' not in content_block:
-                                    str_result += content_block['text']
-                            elif not isinstance(content_block, dict) and hasattr(content_block, 'text'):
-                                if not hasattr(content_block, 'type') or content_block.type != 'tool_use':
-                                    str_result += str(content_block.text)
+            message = getattr(agent_result, 'message', None)
+            if message:
+                if isinstance(message, dict):
+                    content_list = message.get('content')
+                else:
+                    content_list = getattr(message, 'content', None)
+                str_result = "".join(_iter_text(content_list or ()))
         except Exception as e:
-            logger.debug(f"Failed to extract structured message content: {e}")
+            logger.debug("Failed to extract structured message content: %s", e)
         
         # Fallback: if no structured result, convert to string
         if not str_result:
             str_result = str(agent_result)
-            logger.debug(f"Using fallback string conversion for agent result")
+            logger.debug("Using fallback string conversion for agent result")
         
         return str_result
     
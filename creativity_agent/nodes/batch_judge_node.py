@@ -0,0 +1,181 @@
+"""
+Batch Judge Node - Evaluates every model's refinement output in one judge request.
+
+Replaces the per-model judge nodes when judge.batch_models is enabled, trading
+N judge round-trips per iteration for one larger request.
+"""
+
+from creativity_agent.nodes.judge_node import JudgeNode, _JUDGE_EVALUATIONS_ADAPTER
+from creativity_agent.models import ExecutionState, SharedState
+from strands.multiagent import MultiAgentResult
+from creativity_agent.utilities import IndependentJudge, ObservabilityTracker, BufferedOutputWriter
+from creativity_agent.utilities.jinja_prompt_builder import JudgePromptContext
+from pathlib import Path
+from typing import Optional, Union, Dict, Any
+from strands.types.content import ContentBlock
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Key under which a judge response without a per-model breakdown is recorded
+_BATCH_KEY = "batch"
+
+
+class BatchJudgeNode(JudgeNode):
+    """Node that evaluates all models' refinement outputs with a single judge call."""
+
+    def __init__(
+        self,
+        shared_state: SharedState,
+        judge: IndependentJudge,
+        observability: Optional[ObservabilityTracker],
+        outputs_dir: Path,
+        refinement_nodes: Dict[str, str],
+        prompts_dir: Optional[Path] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
+    ):
+        """
+        Args:
+            refinement_nodes: Maps refinement node id -> model key
+        """
+        super().__init__(
+            shared_state=shared_state,
+            judge=judge,
+            observability=observability,
+            outputs_dir=outputs_dir,
+            prompts_dir=prompts_dir,
+            output_writer=output_writer
+        )
+        self.refinement_nodes = refinement_nodes
+
+    async def invoke_async(
+        self,
+        task: Union[str, list[ContentBlock]],
+        invocation_state: Optional[dict] = None,
+        **kwargs
+    ) -> MultiAgentResult:
+        """Evaluate ideas from every model's refinement output."""
+        try:
+            start_ns = time.monotonic_ns()
+
+            node_input = self._get_typed_input(task, invocation_state)
+            state = node_input.state
+
+            model_outputs = self._split_model_outputs(task)
+            per_model = await self._evaluate_model_outputs(model_outputs, state)
+
+            judge_evaluations = []
+            accepted_ideas = []
+            rejected_ideas = []
+            for model_key, evaluations_data in per_model.items():
+                evaluations, accepted, rejected = self._process_judge_data(state, model_key, evaluations_data)
+                judge_evaluations.extend(evaluations)
+                accepted_ideas.extend(accepted)
+                rejected_ideas.extend(rejected)
+
+            # Save judge evaluations
+            self._save_evaluations(state.iteration, judge_evaluations)
+
+            # Calculate statistics
+            idea_stats = self._calculate_idea_statistics_from_judge_data(accepted_ideas, rejected_ideas) if judge_evaluations else None
+
+            accepted_count = len(accepted_ideas)
+            result_msg = (
+                f"Evaluated {len(judge_evaluations)} ideas from {len(model_outputs)} models. "
+                f"Accepted: {accepted_count}"
+            )
+
+            updated_state = state.with_updates(
+                judge_evaluations=_JUDGE_EVALUATIONS_ADAPTER.dump_python(judge_evaluations),
+                idea_statistics=idea_stats.model_dump() if idea_stats else None,
+                accepted_ideas_count=accepted_count,
+                success=True
+            )
+
+            execution_time_us = (time.monotonic_ns() - start_ns) // 1000
+
+            return self.create_result(
+                message=result_msg,
+                state=updated_state,
+                execution_time_us=execution_time_us
+            )
+
+        except Exception as e:
+            error_state = ExecutionState(
+                original_prompt=invocation_state.get('original_prompt', '') if invocation_state else '',
+                iteration=invocation_state.get('iteration', 0) if invocation_state else 0,
+                run_id=invocation_state.get('run_id', 'unknown') if invocation_state else 'unknown',
+                run_dir=invocation_state.get('run_dir', '.') if invocation_state else '.'
+            )
+            return self.handle_error(e, error_state)
+
+    def _split_model_outputs(self, task: Union[str, list[ContentBlock]]) -> Dict[str, str]:
+        """
+        Group the graph's combined node input by upstream refinement node.
+
+        The graph lists each dependency as a "From <node_id>:" block followed
+        by "  - <agent>: <text>" blocks.
+
+        Returns:
+            Dict mapping model key -> refinement output text
+        """
+        if isinstance(task, str):
+            blocks = [task]
+        else:
+            blocks = [block.get('text', '') for block in task]
+
+        outputs: Dict[str, list] = {}
+        current_key = None
+        for text in blocks:
+            stripped = text.strip()
+            if stripped.startswith("From ") and stripped.endswith(":"):
+                current_key = self.refinement_nodes.get(stripped[5:-1])
+                if current_key is not None:
+                    outputs.setdefault(current_key, [])
+                continue
+            if current_key is not None and text.startswith("  - "):
+                _, _, output = text[4:].partition(": ")
+                outputs[current_key].append(output)
+
+        return {key: "\n".join(parts) for key, parts in outputs.items()}
+
+    async def _evaluate_model_outputs(
+        self,
+        model_outputs: Dict[str, str],
+        state: ExecutionState
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Send all models' refinement outputs to the judge in one request.
+
+        Returns:
+            Dict mapping model key -> parsed judge output for that model. If the
+            judge gave no per-model breakdown, its whole response is returned
+            once under the "batch" key, so each idea is only recorded once.
+        """
+        judge_context = JudgePromptContext(
+            model_outputs=model_outputs,
+            evaluation_criteria={
+                "originality": "How novel and creative?",
+                "feasibility": "How practical and implementable?",
+                "impact": "What value/benefit would it create?",
+                "substance": "How well-developed and substantial?"
+            },
+            acceptance_threshold=6.0
+        )
+
+        prompt = self.judge.jinja_builder.build_judge_prompt(judge_context)
+        evaluations_data = await self._invoke_judge(prompt)
+
+        per_model = evaluations_data.get('per_model')
+        if isinstance(per_model, dict):
+            return {
+                model_key: per_model.get(model_key) or self._error_evaluation(
+                    "Missing Evaluation", f"Judge returned no evaluation for model {model_key}"
+                )
+                for model_key in model_outputs
+            }
+
+        # Judge failed or ignored the per-model structure: record its output once
+        logger.warning("Batch judge response has no per_model section; recording it under '%s'", _BATCH_KEY)
+        return {_BATCH_KEY: evaluations_data}
@@ -5,12 +5,14 @@ Uses typed ExecutionState for proper state management throughout the graph.
 """
 
 from creativity_agent.nodes.base_node import BaseNode
-from creativity_agent.models import ExecutionState, SharedState
+from creativity_agent.models import ChaosInput, ChaosSeed, ExecutionState, SharedState
 from strands.multiagent import MultiAgentResult
-from creativity_agent.utilities import ChaosGenerator, JinjaPromptBuilder, ChaosPromptContext
+from creativity_agent.utilities import ChaosGenerator, JinjaPromptBuilder, default_jinja_builder, BufferedOutputWriter
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 from strands.types.content import ContentBlock
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
 import logging
 import time
 
@@ -27,17 +29,26 @@ class ChaosGeneratorNode(BaseNode):
         chaos_seeds_per_iteration: int,
         outputs_dir: Path,
         prompts_dir: Optional[Path] = None,
-        jinja_builder: Optional[JinjaPromptBuilder] = None
+        jinja_builder: Optional[JinjaPromptBuilder] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
     ):
         super().__init__(
             node_name="chaos_generator",
             shared_state=shared_state,
             prompts_dir=prompts_dir,
-            outputs_dir=outputs_dir
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
         )
         self.chaos_generator = chaos_generator
         self.chaos_seeds_per_iteration = chaos_seeds_per_iteration
-        self.jinja_builder = jinja_builder or JinjaPromptBuilder()
+        self.jinja_builder = jinja_builder or default_jinja_builder()
+        # Rendered directly each iteration (the chaos template takes three plain values)
+        self._chaos_template = self.jinja_builder.get_compiled('chaos')
+        
+        # Chaos input only depends on the original prompt, so the next iteration's
+        # seeds are researched in the background while this iteration's chains run
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chaos_prefetch")
+        self._prefetched: Dict[int, Future] = {}
         
     async def invoke_async(
         self,
@@ -56,32 +67,32 @@ class ChaosGeneratorNode(BaseNode):
             
             logger.info(f"Generating chaos seeds for iteration {iteration}")
             
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             
-            # Generate chaos seeds from original prompt
-            chaos_input = self.chaos_generator.generate_chaos_input(
-                state.original_prompt,
-                num_seeds=self.chaos_seeds_per_iteration
-            )
+            # Generate chaos seeds from original prompt (prefetched after the previous iteration)
+            chaos_input = await self._get_chaos_input(iteration, state.original_prompt)
+            
+            # Start researching the next iteration's seeds while the model chains run
+            if iteration + 1 < self.shared_state.max_iterations:
+                self._prefetched[iteration + 1] = self._prefetch_executor.submit(
+                    self.chaos_generator.generate_chaos_input,
+                    state.original_prompt,
+                    num_seeds=self.chaos_seeds_per_iteration
+                )
             
             # Extract seeds for state and Jinja2 template
             chaos_seeds = [
-                {
-                    'concept': concept.term,
-                    'context': concept.context,
-                    'relevance': concept.relevance_note
-                }
+                ChaosSeed(concept.term, concept.context, concept.relevance_note)
                 for concept in chaos_input.tangential_concepts
             ]
             
             # Build chaos summary using Jinja2
-            related_concepts_list = [s['concept'] for s in chaos_seeds]
-            context = ChaosPromptContext(
+            related_concepts_list = [seed.concept for seed in chaos_seeds]
+            chaos_summary = self._chaos_template.render(
                 original_prompt=state.original_prompt,
                 concept_word=', '.join(related_concepts_list),
                 related_concepts=related_concepts_list
             )
-            chaos_summary = self.jinja_builder.build_chaos_prompt(context)
             
             logger.debug(f"Built chaos prompt ({len(chaos_summary)} chars) with {len(chaos_seeds)} seeds")
             
@@ -98,12 +109,12 @@ class ChaosGeneratorNode(BaseNode):
                 success=True
             )
             
-            execution_time = int(time.time() - start_time)
+            execution_time_us = (time.monotonic_ns() - start_ns) // 1000
             
             return self.create_result(
                 message=chaos_summary,
                 state=updated_state,
-                execution_time=execution_time
+                execution_time_us=execution_time_us
             )
             
         except Exception as e:
@@ -115,3 +126,34 @@ class ChaosGeneratorNode(BaseNode):
                 run_dir=invocation_state.get('run_dir', '.') if invocation_state else '.'
             )
             return self.handle_error(e, error_state)
+    
+    def cancel_prefetch(self) -> None:
+        """
+        Drop pending prefetches (e.g. when the run stops early).
+        
+        The executor stays usable, so the node can serve another run.
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+    
+    def close(self) -> None:
+        """Drop pending prefetches and shut the prefetch executor down."""
+        self.cancel_prefetch()
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _get_chaos_input(self, iteration: int, original_prompt: str) -> ChaosInput:
+        """Return the prefetched chaos input for an iteration, generating it if absent."""
+        prefetched = self._prefetched.pop(iteration, None)
+        if prefetched is not None:
+            try:
+                return await asyncio.wrap_future(prefetched)
+            except Exception as e:
+                logger.warning(f"Prefetched chaos input for iteration {iteration} failed, regenerating: {e}")
+        
+        # Blocking (model call + web searches): keep it off the event loop
+        return await asyncio.to_thread(
+            self.chaos_generator.generate_chaos_input,
+            original_prompt,
+            num_seeds=self.chaos_seeds_per_iteration
+        )
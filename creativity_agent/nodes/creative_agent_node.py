@@ -10,8 +10,8 @@ from pathlib import Path
 import logging
 import time
 
-from creativity_agent.nodes.base_node import BaseNode
-from creativity_agent.utilities import JinjaPromptBuilder, CreativeAgentPromptContext
+from creativity_agent.nodes.base_node import BaseNode, _content_to_text
+from creativity_agent.utilities import JinjaPromptBuilder, default_jinja_builder, CreativeAgentPromptContext, BufferedOutputWriter
 from creativity_agent.models import ExecutionState, SharedState
 
 logger = logging.getLogger(__name__)
@@ -32,7 +32,8 @@ class CreativeAgentNode(BaseNode):
         node_name: str,
         outputs_dir: Path,
         memory_manager: Optional[object] = None,
-        jinja_builder: Optional[JinjaPromptBuilder] = None
+        jinja_builder: Optional[JinjaPromptBuilder] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
     ):
         """
         Initialize creative agent node.
@@ -43,12 +44,18 @@ class CreativeAgentNode(BaseNode):
             node_name: Node identifier
             outputs_dir: Directory for saving outputs
             memory_manager: Optional memory manager for concept extraction
-            jinja_builder: Optional Jinja2 prompt builder (will be created if not provided)
+            jinja_builder: Optional Jinja2 prompt builder (shared default builder if not provided)
+            output_writer: Optional background writer for output files
         """
-        super().__init__(node_name=node_name, shared_state=shared_state, outputs_dir=outputs_dir)
+        super().__init__(
+            node_name=node_name,
+            shared_state=shared_state,
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
+        )
         self.agent = agent
         self.memory_manager = memory_manager
-        self.jinja_builder = jinja_builder or JinjaPromptBuilder()
+        self.jinja_builder = jinja_builder or default_jinja_builder()
         
     async def invoke_async(
         self,
@@ -70,32 +77,27 @@ class CreativeAgentNode(BaseNode):
         logger.info("task: %s", task)
         logger.info("invocation_state: %s", invocation_state)
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Parse typed input
             node_input = self._get_typed_input(task, invocation_state)
             state = node_input.state  # Type: ExecutionState
             
-            result = task if isinstance(task, str) else str(task)
+            # Get current content (from previous step or task)
+            current_content = _content_to_text(task)
 
             # Extract context from typed state
             original_prompt = state.original_prompt
             iteration = state.iteration
             
-            # Get current content (from previous step or task)
-            if isinstance(task, list):
-                current_content = '\n'.join([block['text'] for block in task if isinstance(block, dict) and 'text' in block])
-            else:
-                current_content = str(task)
-            
             logger.info(f"Creative agent '{self.name}' executing (iteration: {iteration})")
             
             # Build sophisticated prompt using Jinja2
             context = CreativeAgentPromptContext(
                 original_prompt=original_prompt,
                 content=current_content,
-                chaos_seeds=result,
+                chaos_seeds=current_content,
                 memory_context='',  # Can be enhanced later
                 iteration=iteration
             )
@@ -112,13 +114,9 @@ class CreativeAgentNode(BaseNode):
             
             # Save raw output to file
             if self.outputs_dir:
-                output_file = self.outputs_dir / f"{self.name}_iteration_{iteration}.txt"
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(str_result)
-                logger.info(f"Saved creative output to {output_file}")
+                self.save_output(f"{self.name}_iteration_{iteration}.txt", str_result)
             
-            execution_time = int(time.time() - start_time)
+            execution_time_us = (time.monotonic_ns() - start_ns) // 1000
             
             # Create updated state with creative output
             updated_state = state.with_updates(
@@ -131,12 +129,11 @@ class CreativeAgentNode(BaseNode):
             return self.create_result(
                 message=str_result,
                 state=updated_state,
-                execution_time=execution_time
+                execution_time_us=execution_time_us
             )
             
         except Exception as e:
-            logger.error(f"Error in creative agent '{self.name}': {e}", exc_info=True)
-            
+            # handle_error logs the error (traceback at DEBUG level)
             # Create error state preserving context
             error_state = ExecutionState(
                 original_prompt=f"Critical error occured: {e}",
@@ -145,5 +142,4 @@ class CreativeAgentNode(BaseNode):
                 run_dir=invocation_state.get('run_dir', '.') if invocation_state else '.'
             )
             
-            execution_time = int(time.time() - start_time)
             return self.handle_error(e, error_state)
@@ -4,20 +4,52 @@ Judge Node - Evaluates ideas using independent Claude judge.
 Uses typed ExecutionState for proper state management throughout the graph.
 """
 
-from creativity_agent.nodes.base_node import BaseNode
+from creativity_agent.nodes.base_node import BaseNode, _content_to_text
 from creativity_agent.models import IdeaStatistics, JudgeEvaluation, ExecutionState, SharedState
 from strands.multiagent import MultiAgentResult
-from creativity_agent.utilities import IndependentJudge, ObservabilityTracker, JsonExtractor
+from creativity_agent.utilities import IndependentJudge, ObservabilityTracker, JsonExtractor, BufferedOutputWriter, ensure_dir, write_file
+from creativity_agent.utilities.jinja_prompt_builder import JudgePromptContext
+from pydantic import ConfigDict, TypeAdapter
 from pathlib import Path
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Tuple
 from strands.types.content import ContentBlock
 import logging
+import os
+import re
+import statistics
 import time
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Dumps a whole evaluation list in one pydantic-core call
+_JUDGE_EVALUATIONS_ADAPTER = TypeAdapter(List[JudgeEvaluation], config=ConfigDict(defer_build=True))
+
+
+def _score_summary(scores: List[float]) -> Tuple[int, int, float, float]:
+    """Ideas scoring >= 8 and >= 5, median and mean of scores, with one pass for the sums."""
+    if not scores:
+        return 0, 0, 0.0, 0.0
+    above_8 = above_5 = 0
+    total = 0.0
+    for score in scores:
+        total += score
+        if score >= 5.0:
+            above_5 += 1
+            if score >= 8.0:
+                above_8 += 1
+    return above_8, above_5, statistics.median(scores), total / len(scores)
+
+
+# Markdown code fence (optionally tagged json) wrapping the whole response
+_FENCE_RE = re.compile(r'\A\s*```(?:json)?\s*|\s*```\s*\Z')
+
 
 class JudgeNode(BaseNode):
     """Node that evaluates ideas using independent judge."""
@@ -28,16 +60,23 @@ class JudgeNode(BaseNode):
         judge: IndependentJudge,
         observability: Optional[ObservabilityTracker],
         outputs_dir: Path,
-        prompts_dir: Optional[Path] = None
+        prompts_dir: Optional[Path] = None,
+        model_key: Optional[str] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
     ):
         super().__init__(
             node_name="judge",
             shared_state=shared_state,
             prompts_dir=prompts_dir,
-            outputs_dir=outputs_dir
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
         )
         self.judge = judge
         self.observability = observability
+        # Key under which parsed judge output is cached on shared_state
+        self.model_key = model_key or self.name
+        # Dedicated agent so judge nodes of parallel model chains don't contend
+        self.agent = judge.create_agent()
         
     async def invoke_async(
         self,
@@ -48,8 +87,8 @@ class JudgeNode(BaseNode):
         """Evaluate ideas from refinement output."""
         try:
             # Parse typed input
-            result = task if isinstance(task, str) else str(task)
-            start_time = time.time()
+            result = _content_to_text(task)
+            start_ns = time.monotonic_ns()
             
             logger.info("\njudge_input\n")
             logger.info(result)
@@ -58,48 +97,23 @@ class JudgeNode(BaseNode):
             node_input = self._get_typed_input(task, invocation_state)
             state = node_input.state
 
-            # Pass the entire refinement output to the judge for parsing and evaluation
-            evaluations_data = self._evaluate_refinement_output(result, state)
-            
-            # Extract accepted/rejected ideas from the judge's response
-            accepted_ideas = evaluations_data.get('accepted_ideas', [])
-            rejected_ideas = evaluations_data.get('rejected_ideas', [])
-            
-            # Convert to JudgeEvaluation objects for compatibility
-            judge_evaluations = []
-            for idea in accepted_ideas + rejected_ideas:
-                # Create a JudgeEvaluation for each idea
-                eval_obj = JudgeEvaluation(
-                    idea_id=f"{state.run_id}_{state.iteration}_{idea.get('idea_name', 'unknown').replace(' ', '_')}",
-                    idea_name=idea.get('idea_name', 'Unknown Idea'),
-                    originality_score=idea.get('originality_score', idea.get('quality_score', 5.0)),
-                    feasibility_score=idea.get('feasibility_score', 5.0),
-                    impact_score=idea.get('impact_score', 5.0),
-                    substance_score=idea.get('substance_score', idea.get('quality_score', 5.0)),
-                    overall_quality_score=idea.get('quality_score', 5.0),
-                    accepted=idea in accepted_ideas,
-                    rejection_reasons=[idea.get('rejection_reason', '')] if idea in rejected_ideas else [],
-                    key_points=idea.get('key_points', []),
-                    model_id=state.refinement_model or 'unknown',
-                    temperature=0.1,  # Judge temperature
-                    iteration=state.iteration,
-                    evaluation_timestamp=datetime.now(),
-                    judge_model=self.judge.judge_model_id
-                )
-                judge_evaluations.append(eval_obj)
+            # Pass the entire refinement output to the judge for parsing and evaluation.
+            # Building the prompt is synchronous; only the judge call is awaited.
+            try:
+                prompt = self._build_refinement_prompt(result)
+            except Exception as e:
+                logger.error(f"Error in judge evaluation: {e}")
+                evaluations_data = self._error_evaluation("Evaluation Error", f"Judge evaluation failed: {str(e)}")
+            else:
+                evaluations_data = await self._invoke_judge(prompt)
+            
+            judge_evaluations, accepted_ideas, rejected_ideas = self._process_judge_data(
+                state, self.model_key, evaluations_data
+            )
             
             # Save judge evaluations
             self._save_evaluations(state.iteration, judge_evaluations)
             
-            # Record to observability
-            if self.observability:
-                for eval_result in judge_evaluations:
-                    self.observability.record_judge_evaluation(eval_result)
-            
-            # Save accepted ideas to memory and update shared_state
-            memory_data = self._save_accepted_ideas_to_memory(accepted_ideas, state.iteration)
-            self._update_shared_state_with_judge_results(state, accepted_ideas, rejected_ideas, memory_data)
-            
             # Calculate statistics
             idea_stats = self._calculate_idea_statistics_from_judge_data(accepted_ideas, rejected_ideas) if judge_evaluations else None
             
@@ -108,18 +122,18 @@ class JudgeNode(BaseNode):
             
             # Update state with judge output
             updated_state = state.with_updates(
-                judge_evaluations=[e.model_dump() for e in judge_evaluations],
+                judge_evaluations=_JUDGE_EVALUATIONS_ADAPTER.dump_python(judge_evaluations),
                 idea_statistics=idea_stats.model_dump() if idea_stats else None,
                 accepted_ideas_count=accepted_count,
                 success=True
             )
             
-            execution_time = int(time.time() - start_time)
+            execution_time_us = (time.monotonic_ns() - start_ns) // 1000
             
             return self.create_result(
                 message=result_msg,
                 state=updated_state,
-                execution_time=execution_time
+                execution_time_us=execution_time_us
             )
             
         except Exception as e:
@@ -132,6 +146,82 @@ class JudgeNode(BaseNode):
             )
             return self.handle_error(e, error_state)
     
+    def _process_judge_data(
+        self,
+        state: ExecutionState,
+        model_key: str,
+        evaluations_data: Dict[str, Any]
+    ) -> Tuple[List[JudgeEvaluation], List[Dict], List[Dict]]:
+        """
+        Record one model's parsed judge output.
+        
+        Caches the parsed output on shared_state, converts ideas to JudgeEvaluation
+        objects, reports them to observability and saves accepted ideas to memory.
+        
+        Args:
+            state: Current execution state
+            model_key: Model whose refinement output was judged
+            evaluations_data: Parsed judge JSON for that model
+            
+        Returns:
+            Tuple of (judge evaluations, accepted ideas, rejected ideas)
+        """
+        # Cache the parsed output so downstream consumers don't re-parse it
+        self.shared_state.record_judge_result(state.iteration, model_key, evaluations_data)
+        
+        # Extract accepted/rejected ideas from the judge's response
+        accepted_ideas = evaluations_data.get('accepted_ideas', [])
+        rejected_ideas = evaluations_data.get('rejected_ideas', [])
+        
+        # Convert to JudgeEvaluation objects for compatibility: accepted ideas
+        # first, then rejected, each list in its own pass
+        judge_evaluations = [
+            self._to_judge_evaluation(state, model_key, idea, accepted=True)
+            for idea in accepted_ideas
+        ]
+        judge_evaluations.extend(
+            self._to_judge_evaluation(state, model_key, idea, accepted=False)
+            for idea in rejected_ideas
+        )
+        
+        # Record to observability
+        if self.observability:
+            for eval_result in judge_evaluations:
+                self.observability.record_judge_evaluation(eval_result)
+        
+        # Save accepted ideas to memory and update shared_state
+        # (other model chains' judges may be running concurrently)
+        with self.shared_state.lock:
+            memory_data = self._save_accepted_ideas_to_memory(accepted_ideas, state.iteration)
+            self._update_shared_state_with_judge_results(state, accepted_ideas, rejected_ideas, memory_data)
+        
+        return judge_evaluations, accepted_ideas, rejected_ideas
+    
+    def _to_judge_evaluation(
+        self,
+        state: ExecutionState,
+        model_key: str,
+        idea: Dict[str, Any],
+        accepted: bool
+    ) -> JudgeEvaluation:
+        """Create a JudgeEvaluation from one idea in the judge's output."""
+        return JudgeEvaluation(
+            idea_id=f"{state.run_id}_{state.iteration}_{idea.get('idea_name', 'unknown').replace(' ', '_')}",
+            idea_name=idea.get('idea_name', 'Unknown Idea'),
+            originality_score=idea.get('originality_score', idea.get('quality_score', 5.0)),
+            feasibility_score=idea.get('feasibility_score', 5.0),
+            impact_score=idea.get('impact_score', 5.0),
+            substance_score=idea.get('substance_score', idea.get('quality_score', 5.0)),
+            overall_quality_score=idea.get('quality_score', 5.0),
+            accepted=accepted,
+            rejection_reasons=[] if accepted else [idea.get('rejection_reason', '')],
+            key_points=idea.get('key_points', []),
+            model_id=state.refinement_model or model_key,
+            temperature=0.1,  # Judge temperature
+            iteration=state.iteration,
+            judge_model=self.judge.judge_model_id
+        )
+    
     def _extract_ideas_from_content(self, content: str) -> List[str]:
         """Extract individual ideas from agent output (JSON or text format)."""
         return JsonExtractor.extract_ideas_from_any_format(content)
@@ -146,13 +236,10 @@ class JudgeNode(BaseNode):
         unique_ideas = len(set(str(i) for i in ideas))
         duplicate_ideas = total_ideas - unique_ideas
         accepted_ideas = sum(1 for e in evaluations if e.accepted)
-        rejected_ideas = sum(1 for e in evaluations if not e.accepted)
-        ideas_above_8 = sum(1 for e in evaluations if e.overall_quality_score >= 8.0)
-        ideas_above_5 = sum(1 for e in evaluations if e.overall_quality_score >= 5.0)
+        rejected_ideas = len(evaluations) - accepted_ideas
         
         scores = [e.overall_quality_score for e in evaluations]
-        median_score = sorted(scores)[len(scores) // 2] if scores else 0.0
-        mean_score = sum(scores) / len(scores) if scores else 0.0
+        ideas_above_8, ideas_above_5, median_score, mean_score = _score_summary(scores)
         
         return IdeaStatistics(
             total_ideas=total_ideas,
@@ -168,108 +255,71 @@ class JudgeNode(BaseNode):
     
     def _save_evaluations(self, iteration: int, evaluations: List[JudgeEvaluation]) -> None:
         """Save judge evaluations to file."""
-        content_lines = []
-        content_lines.append(f"INDEPENDENT JUDGE EVALUATION - Iteration {iteration}\n")
-        content_lines.append(f"Total Ideas Evaluated: {len(evaluations)}\n")
-        content_lines.append(f"Accepted: {sum(1 for e in evaluations if e.accepted)}\n")
-        content_lines.append(f"Rejected: {sum(1 for e in evaluations if not e.accepted)}\n\n")
-        
-        for eval_result in evaluations:
-            content_lines.append(f"{'='*80}\n")
-            content_lines.append(f"Idea: {eval_result.idea_name}\n")
-            content_lines.append(f"Originality: {eval_result.originality_score}/10\n")
-            content_lines.append(f"Feasibility: {eval_result.feasibility_score}/10\n")
-            content_lines.append(f"Impact: {eval_result.impact_score}/10\n")
-            content_lines.append(f"Substance: {eval_result.substance_score}/10\n")
-            content_lines.append(f"Overall Quality: {eval_result.overall_quality_score}/10\n")
-            content_lines.append(f"Decision: {'ACCEPTED' if eval_result.accepted else 'REJECTED'}\n")
-            
-            if eval_result.key_points:
-                content_lines.append(f"Key Points: {', '.join(eval_result.key_points)}\n")
-            if eval_result.rejection_reasons:
-                content_lines.append(f"Rejection Reasons: {', '.join(eval_result.rejection_reasons)}\n")
-            content_lines.append("\n")
-        
-        content = ''.join(content_lines)
+        accepted = sum(1 for e in evaluations if e.accepted)
+        content = self.judge.jinja_builder.get_compiled('judge_report').render(
+            iteration=iteration,
+            evaluations=evaluations,
+            accepted=accepted,
+            rejected=len(evaluations) - accepted
+        )
         filename = f"judge_evaluations_iteration_{iteration}.txt"
         self.save_output(filename, content)
     
-    def _evaluate_refinement_output(self, refinement_result: str, state: ExecutionState) -> Dict[str, Any]:
-        """Send the refinement output to the judge for parsing and evaluation."""
+    def _build_refinement_prompt(self, refinement_result: str) -> str:
+        """Build the judge prompt asking it to parse and evaluate a refinement output."""
+        judge_context = JudgePromptContext(
+            refinement_output=refinement_result,
+            evaluation_criteria={
+                "originality": "How novel and creative?",
+                "feasibility": "How practical and implementable?",
+                "impact": "What value/benefit would it create?",
+                "substance": "How well-developed and substantial?"
+            },
+            acceptance_threshold=6.0
+        )
+        
+        return self.judge.jinja_builder.build_judge_prompt(judge_context)
+    
+    async def _invoke_judge(self, prompt: str) -> Dict[str, Any]:
+        """Send a prompt to the judge agent and parse its JSON response."""
         try:
-            # Build the judge prompt using Jinja2 builder
-            from creativity_agent.utilities.jinja_prompt_builder import JudgePromptContext
-            
-            judge_context = JudgePromptContext(
-                refinement_output=refinement_result,
-                evaluation_criteria={
-                    "originality": "How novel and creative?",
-                    "feasibility": "How practical and implementable?",
-                    "impact": "What value/benefit would it create?",
-                    "substance": "How well-developed and substantial?"
-                },
-                acceptance_threshold=6.0
-            )
-            
-            prompt = self.judge.jinja_builder.build_judge_prompt(judge_context)
-            
             # Get evaluation from judge
-            agent_result = self.judge.agent(prompt)
+            agent_result = await self.agent.invoke_async(prompt)
             response_content = agent_result.message['content']
             response_text = response_content[0].get('text', '') if response_content else ''
             
-            # Parse the JSON response - extract and validate JSON
+            # Parse the JSON response, stripping a markdown fence if present
             try:
-                response_text = response_text.strip()
-                logger.debug(f"Raw judge response (first 200 chars): {response_text[:200]}")
+                logger.debug("Raw judge response (first 200 chars): %.200s", response_text)
                 
-                # Method 1: Try direct JSON parse first
-                try:
-                    evaluations_data = json.loads(response_text)
-                    logger.info(f"Judge returned {len(evaluations_data.get('accepted_ideas', []))} accepted and {len(evaluations_data.get('rejected_ideas', []))} rejected ideas")
-                    return evaluations_data
-                except json.JSONDecodeError:
-                    # Method 2: Try to strip markdown code blocks
-                    cleaned = response_text
-                    
-                    # Remove various markdown patterns
-                    if cleaned.startswith('```json'):
-                        cleaned = cleaned[7:].lstrip()
-                    elif cleaned.startswith('```'):
-                        cleaned = cleaned[3:].lstrip()
-                    
-                    if cleaned.endswith('```'):
-                        cleaned = cleaned[:-3].rstrip()
-                    
-                    # Try parsing cleaned response
-                    evaluations_data = json.loads(cleaned)
-                    logger.info(f"Judge returned {len(evaluations_data.get('accepted_ideas', []))} accepted and {len(evaluations_data.get('rejected_ideas', []))} rejected ideas (after markdown stripping)")
-                    return evaluations_data
+                cleaned = _FENCE_RE.sub('', response_text, count=2)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                evaluations_data = orjson.loads(cleaned) if orjson else json.loads(cleaned)
+                logger.info(f"Judge returned {len(evaluations_data.get('accepted_ideas', []))} accepted and {len(evaluations_data.get('rejected_ideas', []))} rejected ideas")
+                return evaluations_data
                     
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse judge JSON response: {e}")
-                logger.error(f"Raw response first 500 chars: {response_text[:500]}")
+                logger.error("Raw response first 500 chars: %.500s", response_text)
                 logger.error(f"Raw response last 200 chars: {response_text[-200:]}")
                 # Return empty structure as fallback
-                return {
-                    "accepted_ideas": [],
-                    "rejected_ideas": [{"idea_name": "Parse Error", "rejection_reason": f"Failed to parse judge response: {str(e)}"}],
-                    "synthesis": "Error in judge evaluation",
-                    "top_recommendations": [],
-                    "strategic_insights": [],
-                    "unresolved_questions": []
-                }
+                return self._error_evaluation("Parse Error", f"Failed to parse judge response: {str(e)}")
             
         except Exception as e:
             logger.error(f"Error in judge evaluation: {e}")
-            return {
-                "accepted_ideas": [],
-                "rejected_ideas": [{"idea_name": "Evaluation Error", "rejection_reason": f"Judge evaluation failed: {str(e)}"}],
-                "synthesis": "Error in judge evaluation",
-                "top_recommendations": [],
-                "strategic_insights": [],
-                "unresolved_questions": []
-            }
+            return self._error_evaluation("Evaluation Error", f"Judge evaluation failed: {str(e)}")
+    
+    @staticmethod
+    def _error_evaluation(idea_name: str, reason: str) -> Dict[str, Any]:
+        """Empty judge output recording why evaluation failed."""
+        return {
+            "accepted_ideas": [],
+            "rejected_ideas": [{"idea_name": idea_name, "rejection_reason": reason}],
+            "synthesis": "Error in judge evaluation",
+            "top_recommendations": [],
+            "strategic_insights": [],
+            "unresolved_questions": []
+        }
     
     def _calculate_idea_statistics_from_judge_data(
         self,
@@ -282,27 +332,15 @@ class JudgeNode(BaseNode):
         if total_ideas == 0:
             return None
             
-        # Extract scores from accepted ideas
-        scores = []
-        for idea in accepted_ideas:
-            score = idea.get('quality_score', idea.get('overall_quality_score', 5.0))
-            scores.append(score)
-        
-        # For rejected ideas, assume lower scores
-        for idea in rejected_ideas:
-            score = idea.get('quality_score', 3.0)  # Default lower score for rejected
-            scores.append(score)
+        # Scores from accepted ideas; rejected ideas default to a lower score
+        scores = [idea.get('quality_score', idea.get('overall_quality_score', 5.0)) for idea in accepted_ideas]
+        scores.extend(idea.get('quality_score', 3.0) for idea in rejected_ideas)
         
         unique_ideas = total_ideas  # Assume all are unique for now
         duplicate_ideas = 0
         accepted_count = len(accepted_ideas)
         rejected_count = len(rejected_ideas)
-        ideas_above_8 = sum(1 for s in scores if s >= 8.0)
-        ideas_above_5 = sum(1 for s in scores if s >= 5.0)
-        
-        
-        median_score = sorted(scores)[len(scores) // 2] if scores else 0.0
-        mean_score = sum(scores) / len(scores) if scores else 0.0
+        ideas_above_8, ideas_above_5, median_score, mean_score = _score_summary(scores)
         
         return IdeaStatistics(
             total_ideas=total_ideas,
@@ -325,6 +363,10 @@ class JudgeNode(BaseNode):
         Save accepted ideas to a memory file (ideas.json) for future iterations.
         Returns the saved data for updating shared_state.
         
+        The running list is kept in shared_state.custom_data, so the file is
+        only read once per run (to pick up ideas from an earlier run) and is
+        then rewritten, never re-parsed.
+        
         Args:
             accepted_ideas: List of accepted idea dictionaries from judge
             iteration: Current iteration number
@@ -336,37 +378,47 @@ class JudgeNode(BaseNode):
             # Use run_dir from shared_state if outputs_dir is not available
             output_base = self.outputs_dir or Path(self.shared_state.run_dir)
             memory_file = output_base / "memory" / "ideas.json"
-            memory_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Load existing ideas if file exists
-            existing_ideas = []
-            if memory_file.exists():
-                try:
-                    with open(memory_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+            ensure_dir(memory_file.parent)
+            
+            existing_ideas = self.shared_state.custom_data.get('accepted_ideas_memory')
+            if existing_ideas is None:
+                # First save this run: load existing ideas if file exists
+                existing_ideas = []
+                if memory_file.exists():
+                    try:
+                        raw = memory_file.read_bytes()
+                        data = orjson.loads(raw) if orjson else json.loads(raw)
                         existing_ideas = data.get('accepted_ideas', [])
-                except Exception as e:
-                    logger.warning(f"Could not load existing ideas.json: {e}")
+                    except Exception as e:
+                        logger.warning(f"Could not load existing ideas.json: {e}")
+                self.shared_state.custom_data['accepted_ideas_memory'] = existing_ideas
             
-            # Add new accepted ideas with metadata
+            # Add new accepted ideas with metadata; one timestamp for the whole save
+            now_iso = datetime.now().isoformat()
             for idea in accepted_ideas:
                 idea_record = {
                     **idea,
                     'discovered_in_iteration': iteration,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso
                 }
                 existing_ideas.append(idea_record)
             
             # Save updated ideas to file
             memory_data = {
                 'accepted_ideas': existing_ideas,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': now_iso,
                 'total_accepted': len(existing_ideas),
                 'iterations_run': iteration + 1
             }
             
-            with open(memory_file, 'w', encoding='utf-8') as f:
-                json.dump(memory_data, f, indent=2, default=str)
+            if orjson:
+                payload = orjson.dumps(memory_data, default=str, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(memory_data, indent=2, default=str).encode('utf-8')
+            # Write a sibling file and swap it in, so readers never see a partial file
+            tmp_file = memory_file.with_name(memory_file.name + '.tmp')
+            write_file(tmp_file, payload)
+            os.replace(tmp_file, memory_file)
             
             logger.info(f"Saved {len(accepted_ideas)} accepted ideas to {memory_file}")
             
@@ -404,7 +456,7 @@ class JudgeNode(BaseNode):
                 'accepted_count': len(accepted_ideas),
                 'rejected_count': len(rejected_ideas),
                 'accepted_ideas_names': [idea.get('idea_name', 'unknown') for idea in accepted_ideas],
-                'timestamp': datetime.now().isoformat()
+                'timestamp': memory_data.get('last_updated') or datetime.now().isoformat()
             }
             
             # Store reference to memory file
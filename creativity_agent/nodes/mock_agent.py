@@ -1,13 +1,146 @@
 from creativity_agent.nodes.base_node import BaseNode
-from creativity_agent.models import ExecutionState, SharedState
+from creativity_agent.models import ChaosSeed, ExecutionState, SharedState
+from creativity_agent.utilities import BufferedOutputWriter
 from strands.multiagent import MultiAgentResult
 from typing import Optional, Union
 from strands.types.content import ContentBlock
 from pathlib import Path
+from functools import lru_cache
+import asyncio
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# MockAgent responses by agent type ({name} and {iteration} are filled per call)
+_CREATIVE_TMPL = """[MOCK {name} - CREATIVE MODE]
+Iteration: {iteration}
+
+Generated 5 creative ideas:
+1. Idea Alpha - A novel approach using quantum mechanics
+2. Idea Beta - Innovative combination of AI and blockchain
+3. Idea Gamma - Revolutionary user interface paradigm
+4. Idea Delta - Sustainable solution using bio-inspired algorithms
+5. Idea Epsilon - Cross-domain synthesis of disparate technologies
+
+(This is a mock response for graph structure debugging)
+"""
+
+_REFINEMENT_TMPL = """[MOCK {name} - REFINEMENT MODE]
+Iteration: {iteration}
+
+REFINED IDEAS (Top 3):
+
+**Idea Alpha** (Score: 8.5/10)
+- Originality: High
+- Feasibility: Medium-High
+- Impact: Significant
+- Implementation: 6-12 months
+
+**Idea Beta** (Score: 7.8/10)
+- Originality: Medium-High
+- Feasibility: High
+- Impact: Moderate
+- Implementation: 3-6 months
+
+**Idea Gamma** (Score: 8.2/10)
+- Originality: Very High
+- Feasibility: Medium
+- Impact: High
+- Implementation: 12-18 months
+
+(This is a mock response for graph structure debugging)
+"""
+
+_FINAL_TMPL = """[MOCK {name} - DEEP RESEARCH MODE]
+
+# COMPREHENSIVE INNOVATION ANALYSIS
+
+## EXECUTIVE SUMMARY
+After {iteration} iterations of creative exploration, we identified 3 breakthrough concepts with high potential for impact and feasibility.
+
+## TOP IDEAS IDENTIFIED
+1. Idea Alpha - Quantum-inspired computational approach
+2. Idea Beta - AI-blockchain hybrid system
+3. Idea Gamma - Revolutionary interface paradigm
+
+## DETAILED ANALYSIS
+[Mock deep research analysis would appear here with citations and implementation roadmap]
+
+## STRATEGIC RECOMMENDATIONS
+- Priority 1: Begin with Idea Beta (highest feasibility)
+- Resource Requirements: 2-3 person team, 6 months
+- Risk Mitigation: Phased rollout with MVP validation
+
+(This is a mock response for graph structure debugging)
+"""
+
+_GENERIC_TMPL = """[MOCK {name}]
+Iteration: {iteration}
+Processed task successfully.
+
+(This is a mock response for graph structure debugging)
+"""
+
+# Fixed mock chaos seeds and judge evaluations, shared by every call (never mutated)
+_MOCK_SEED_CONCEPTS = ("quantum", "fractal", "emergence", "paradox", "synthesis")
+_MOCK_CHAOS_SEEDS = [
+    ChaosSeed(seed, f'Context for {seed}', 'Medium tangential relevance')
+    for seed in _MOCK_SEED_CONCEPTS
+]
+_MOCK_JUDGE_EVALUATIONS = [
+    {
+        "idea": "Quantum Approach",
+        "originality": 8,
+        "feasibility": 7,
+        "impact": 9,
+        "decision": "ACCEPTED"
+    },
+    {
+        "idea": "Hybrid System",
+        "originality": 7,
+        "feasibility": 8,
+        "impact": 7,
+        "decision": "ACCEPTED"
+    },
+    {
+        "idea": "Interface Paradigm",
+        "originality": 6,
+        "feasibility": 5,
+        "impact": 6,
+        "decision": "REJECTED"
+    }
+]
+
+
+@lru_cache(maxsize=128)
+def _fetch_seed(seed: str) -> str:
+    """
+    Search the web for a mock seed and fetch its first result; returns the results text.
+    
+    Memoized because mock seeds are fixed: the web cache is exercised on the
+    first iteration, later iterations reuse the result. Failures aren't cached:
+    search_web reports errors as an empty list, so that raises instead.
+    """
+    # Import here to avoid circular imports
+    from creativity_agent.tools import search_web, get_url_content
+    
+    logger.info(f"Mock chaos: searching web for '{seed}' to test caching...")
+    results_text = search_web(f"what is {seed}", max_results=2)
+    
+    # search_web returns a JSON array of URLs
+    urls = json.loads(results_text)
+    if not urls:
+        raise ValueError("no search results")
+    
+    # Fetch content from first URL to test cache
+    first_url = urls[0]
+    logger.info(f"Mock chaos: fetching content from {first_url[:60]}... to test cache")
+    content = get_url_content(first_url)
+    if content:
+        logger.info(f"Mock chaos: fetched {len(content)} bytes from {first_url[:60]}...")
+    return results_text
+
 
 class MockAgent(BaseNode):
     """
@@ -20,7 +153,8 @@ class MockAgent(BaseNode):
         shared_state: SharedState,
         name: str,
         agent_type: str = "generic",
-        outputs_dir: Optional[Path] = None
+        outputs_dir: Optional[Path] = None,
+        output_writer: Optional[BufferedOutputWriter] = None
     ):
         """
         Initialize mock agent.
@@ -30,11 +164,13 @@ class MockAgent(BaseNode):
             name: Agent identifier
             agent_type: Type of agent ("creative", "refinement", "final")
             outputs_dir: Directory to save outputs (optional)
+            output_writer: Optional background writer for output files
         """
         super().__init__(
             node_name=name,
             shared_state=shared_state,
-            outputs_dir=outputs_dir
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
         )
         self.agent_type = agent_type
         
@@ -55,19 +191,9 @@ class MockAgent(BaseNode):
             iteration = state.iteration
             
             # Generate mock response based on agent type
+            values = {"name": self.name, "iteration": iteration}
             if self.agent_type == "creative":
-                message = f"""[MOCK {self.name} - CREATIVE MODE]
-Iteration: {iteration}
-
-Generated 5 creative ideas:
-1. Idea Alpha - A novel approach using quantum mechanics
-2. Idea Beta - Innovative combination of AI and blockchain
-3. Idea Gamma - Revolutionary user interface paradigm
-4. Idea Delta - Sustainable solution using bio-inspired algorithms
-5. Idea Epsilon - Cross-domain synthesis of disparate technologies
-
-(This is a mock response for graph structure debugging)
-"""
+                message = _CREATIVE_TMPL.format_map(values)
                 # Update state with mock creative output
                 updated_state = state.with_updates(
                     creative_output=message,
@@ -75,31 +201,7 @@ Generated 5 creative ideas:
                     success=True
                 )
             elif self.agent_type == "refinement":
-                message = f"""[MOCK {self.name} - REFINEMENT MODE]
-Iteration: {iteration}
-
-REFINED IDEAS (Top 3):
-
-**Idea Alpha** (Score: 8.5/10)
-- Originality: High
-- Feasibility: Medium-High
-- Impact: Significant
-- Implementation: 6-12 months
-
-**Idea Beta** (Score: 7.8/10)
-- Originality: Medium-High
-- Feasibility: High
-- Impact: Moderate
-- Implementation: 3-6 months
-
-**Idea Gamma** (Score: 8.2/10)
-- Originality: Very High
-- Feasibility: Medium
-- Impact: High
-- Implementation: 12-18 months
-
-(This is a mock response for graph structure debugging)
-"""
+                message = _REFINEMENT_TMPL.format_map(values)
                 # Update state with mock refinement output
                 updated_state = state.with_updates(
                     refinement_output=message,
@@ -107,28 +209,7 @@ REFINED IDEAS (Top 3):
                     success=True
                 )
             elif self.agent_type == "final":
-                message = f"""[MOCK {self.name} - DEEP RESEARCH MODE]
-
-# COMPREHENSIVE INNOVATION ANALYSIS
-
-## EXECUTIVE SUMMARY
-After {iteration} iterations of creative exploration, we identified 3 breakthrough concepts with high potential for impact and feasibility.
-
-## TOP IDEAS IDENTIFIED
-1. Idea Alpha - Quantum-inspired computational approach
-2. Idea Beta - AI-blockchain hybrid system
-3. Idea Gamma - Revolutionary interface paradigm
-
-## DETAILED ANALYSIS
-[Mock deep research analysis would appear here with citations and implementation roadmap]
-
-## STRATEGIC RECOMMENDATIONS
-- Priority 1: Begin with Idea Beta (highest feasibility)
-- Resource Requirements: 2-3 person team, 6 months
-- Risk Mitigation: Phased rollout with MVP validation
-
-(This is a mock response for graph structure debugging)
-"""
+                message = _FINAL_TMPL.format_map(values)
                 # Update state with mock final research output
                 updated_state = state.with_updates(
                     final_research_output=message,
@@ -136,27 +217,20 @@ After {iteration} iterations of creative exploration, we identified 3 breakthrou
                     success=True
                 )
             else:
-                message = f"""[MOCK {self.name}]
-Iteration: {iteration}
-Processed task successfully.
-
-(This is a mock response for graph structure debugging)
-"""
+                message = _GENERIC_TMPL.format_map(values)
                 updated_state = state.with_updates(success=True)
             
             logger.info(f"🎭 Mock agent '{self.name}' executed (type: {self.agent_type}, iteration: {iteration})")
             
             # Save output file if outputs_dir is provided
             if self.outputs_dir:
-                output_file = self.outputs_dir / f"{self.name}_iteration_{iteration}.txt"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(message)
-                logger.info(f"🎭 Mock agent saved output to {output_file}")
+                output_file = self.save_output(f"{self.name}_iteration_{iteration}.txt", message)
+                if output_file:
+                    logger.info(f"🎭 Mock agent saved output to {output_file}")
             
             return self.create_result(
                 message=message,
-                state=updated_state,
-                execution_time=1
+                state=updated_state
             )
             
         except Exception as e:
@@ -174,11 +248,18 @@ Processed task successfully.
 class MockChaosNode(BaseNode):
     """Mock chaos generator for fast debugging with typed state."""
     
-    def __init__(self, shared_state: SharedState, chaos_seeds_per_iteration: int, outputs_dir: Path):
+    def __init__(
+        self,
+        shared_state: SharedState,
+        chaos_seeds_per_iteration: int,
+        outputs_dir: Path,
+        output_writer: Optional[BufferedOutputWriter] = None
+    ):
         super().__init__(
             node_name="chaos_generator",
             shared_state=shared_state,
-            outputs_dir=outputs_dir
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
         )
         self.chaos_seeds_per_iteration = chaos_seeds_per_iteration
         
@@ -196,35 +277,12 @@ class MockChaosNode(BaseNode):
             iteration = state.iteration
             
             # Generate fake chaos seeds
-            fake_seeds = ["quantum", "fractal", "emergence", "paradox", "synthesis"][:self.chaos_seeds_per_iteration]
+            fake_seeds = _MOCK_SEED_CONCEPTS[:self.chaos_seeds_per_iteration]
             
-            # Import here to avoid circular imports
-            from creativity_agent.tools import search_web, get_url_content
-            import re
-            
-            # Call real web search for each seed to test caching
-            search_results = {}
-            for seed in fake_seeds:
-                try:
-                    logger.info(f"Mock chaos: searching web for '{seed}' to test caching...")
-                    results_text = search_web(f"what is {seed}", max_results=2, output_format="list")
-                    search_results[seed] = results_text
-                    
-                    # Extract URLs from the formatted results using regex
-                    # Format is: "   URL: https://..."
-                    url_pattern = r'URL:\s*(https?://[^\s\n]+)'
-                    urls = re.findall(url_pattern, results_text)
-                    
-                    # Fetch content from first URL to test cache
-                    if urls and len(urls) > 0:
-                        first_url = urls[0]
-                        logger.info(f"Mock chaos: fetching content from {first_url[:60]}... to test cache")
-                        content = get_url_content(first_url)
-                        if content:
-                            logger.info(f"Mock chaos: fetched {len(content)} bytes from {first_url[:60]}...")
-                except Exception as e:
-                    logger.warning(f"Mock chaos: web search for '{seed}' failed: {e}")
-                    search_results[seed] = ""
+            # Call real web search for each seed to test caching; seeds are
+            # independent, so their searches run concurrently
+            results = await asyncio.gather(*(self._search_seed(seed) for seed in fake_seeds))
+            search_results = dict(zip(fake_seeds, results))
             
             chaos_context = f"""[MOCK CHAOS GENERATOR]
 Iteration: {iteration}
@@ -240,33 +298,21 @@ WEB SEARCH RESULTS (for cache testing):
             
             # Save to file
             if self.outputs_dir:
-                chaos_file = self.outputs_dir / f"chaos_input_iteration_{iteration}.txt"
-                with open(chaos_file, 'w', encoding='utf-8') as f:
-                    f.write(chaos_context)
-                logger.info(f"🎭 Mock chaos generator created {chaos_file}")
-            
-            # Convert chaos_seeds to proper format: List[Dict[str, str]]
-            chaos_seeds_dicts = [
-                {
-                    'concept': seed,
-                    'context': f'Context for {seed}',
-                    'relevance': 'Medium tangential relevance'
-                }
-                for seed in fake_seeds
-            ]
+                chaos_file = self.save_output(f"chaos_input_iteration_{iteration}.txt", chaos_context)
+                if chaos_file:
+                    logger.info(f"🎭 Mock chaos generator created {chaos_file}")
             
             # Update state with chaos output
             updated_state = state.with_updates(
                 chaos_context=chaos_context,
-                chaos_seeds=chaos_seeds_dicts,
+                chaos_seeds=_MOCK_CHAOS_SEEDS[:len(fake_seeds)],
                 chaos_seeds_count=len(fake_seeds),
                 success=True
             )
             
             return self.create_result(
                 message=f"Generated {len(fake_seeds)} mock chaos seeds",
-                state=updated_state,
-                execution_time=1
+                state=updated_state
             )
             
         except Exception as e:
@@ -278,17 +324,32 @@ WEB SEARCH RESULTS (for cache testing):
                 run_dir=invocation_state.get('run_dir', '.') if invocation_state else '.'
             )
             return self.handle_error(e, error_state)
+    
+    async def _search_seed(self, seed: str) -> str:
+        """Search the web for one seed and fetch its first result; returns the results text."""
+        try:
+            # The tools are blocking; run them in a thread so seeds overlap
+            return await asyncio.to_thread(_fetch_seed, seed)
+        except Exception as e:
+            logger.warning(f"Mock chaos: web search for '{seed}' failed: {e}")
+            return ""
 
 
 
 class MockJudgeNode(BaseNode):
     """Mock judge for fast debugging with typed state."""
     
-    def __init__(self, shared_state: SharedState, outputs_dir: Path):
+    def __init__(
+        self,
+        shared_state: SharedState,
+        outputs_dir: Path,
+        output_writer: Optional[BufferedOutputWriter] = None
+    ):
         super().__init__(
             node_name="judge",
             shared_state=shared_state,
-            outputs_dir=outputs_dir
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
         )
         
     async def invoke_async(
@@ -334,44 +395,20 @@ IDEA 3: Interface Paradigm
             
             # Save to file
             if self.outputs_dir:
-                judge_file = self.outputs_dir / f"judge_evaluations_iteration_{iteration}.txt"
-                with open(judge_file, 'w', encoding='utf-8') as f:
-                    f.write(evaluation_text)
-                logger.info(f"🎭 Mock judge created {judge_file}")
+                judge_file = self.save_output(f"judge_evaluations_iteration_{iteration}.txt", evaluation_text)
+                if judge_file:
+                    logger.info(f"🎭 Mock judge created {judge_file}")
             
             # Update state with judge output
             updated_state = state.with_updates(
-                judge_evaluations=[
-                    {
-                        "idea": "Quantum Approach",
-                        "originality": 8,
-                        "feasibility": 7,
-                        "impact": 9,
-                        "decision": "ACCEPTED"
-                    },
-                    {
-                        "idea": "Hybrid System",
-                        "originality": 7,
-                        "feasibility": 8,
-                        "impact": 7,
-                        "decision": "ACCEPTED"
-                    },
-                    {
-                        "idea": "Interface Paradigm",
-                        "originality": 6,
-                        "feasibility": 5,
-                        "impact": 6,
-                        "decision": "REJECTED"
-                    }
-                ],
+                judge_evaluations=_MOCK_JUDGE_EVALUATIONS,
                 accepted_ideas_count=2,
                 success=True
             )
             
             return self.create_result(
                 message="Evaluated 3 mock ideas",
-                state=updated_state,
-                execution_time=1
+                state=updated_state
             )
             
         except Exception as e:
@@ -7,11 +7,12 @@ from strands.multiagent import MultiAgentResult
 from strands.types.content import ContentBlock
 from typing import Optional, Union
 from pathlib import Path
+import json
 import logging
 import time
 
-from creativity_agent.nodes.base_node import BaseNode
-from creativity_agent.utilities import JinjaPromptBuilder, RefinementPromptContext
+from creativity_agent.nodes.base_node import BaseNode, _content_to_text
+from creativity_agent.utilities import JinjaPromptBuilder, default_jinja_builder, RefinementPromptContext, BufferedOutputWriter, ResponseCache
 from creativity_agent.models import ExecutionState, SharedState
 
 logger = logging.getLogger(__name__)
@@ -32,7 +33,9 @@ class RefinementAgentNode(BaseNode):
         node_name: str,
         outputs_dir: Path,
         memory_manager: Optional[object] = None,
-        jinja_builder: Optional[JinjaPromptBuilder] = None
+        jinja_builder: Optional[JinjaPromptBuilder] = None,
+        output_writer: Optional[BufferedOutputWriter] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize refinement agent node.
@@ -43,12 +46,20 @@ class RefinementAgentNode(BaseNode):
             node_name: Node identifier
             outputs_dir: Directory for saving outputs
             memory_manager: Optional memory manager for concept extraction
-            jinja_builder: Optional Jinja2 prompt builder (will be created if not provided)
+            jinja_builder: Optional Jinja2 prompt builder (shared default builder if not provided)
+            output_writer: Optional background writer for output files
+            response_cache: Optional cross-run cache of responses by prompt
         """
-        super().__init__(node_name=node_name, shared_state=shared_state, outputs_dir=outputs_dir)
+        super().__init__(
+            node_name=node_name,
+            shared_state=shared_state,
+            outputs_dir=outputs_dir,
+            output_writer=output_writer
+        )
         self.agent = agent
         self.memory_manager = memory_manager
-        self.jinja_builder = jinja_builder or JinjaPromptBuilder()
+        self.jinja_builder = jinja_builder or default_jinja_builder()
+        self.response_cache = response_cache
         
     async def invoke_async(
         self,
@@ -67,7 +78,7 @@ class RefinementAgentNode(BaseNode):
         Returns:
             MultiAgentResult with agent output and typed state updates
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Parse typed input
@@ -78,7 +89,7 @@ class RefinementAgentNode(BaseNode):
             original_prompt = state.original_prompt
             iteration = state.iteration
             
-            input_content = task if isinstance(task, str) else str(task)
+            input_content = _content_to_text(task)
 
             logger.info(f"Refinement agent '{self.name}' executing (iteration: {iteration})")
             
@@ -98,18 +109,30 @@ class RefinementAgentNode(BaseNode):
             
             logger.debug(f"Built refinement agent prompt ({len(enhanced_prompt)} chars)")
             
-            # Invoke the actual agent
-            result = await self.agent.invoke_async(enhanced_prompt)
-            str_result = self.extract_message_content(result)
+            # Reuse an earlier run's response to the same prompt and model settings
+            cache_key = None
+            str_result = None
+            if self.response_cache:
+                cache_key = self.response_cache.make_key(
+                    json.dumps(self.agent.model.get_config(), sort_keys=True, default=str),
+                    self.agent.system_prompt or "",
+                    enhanced_prompt
+                )
+                str_result = self.response_cache.get(cache_key)
+            
+            if str_result is None:
+                # Invoke the actual agent
+                result = await self.agent.invoke_async(enhanced_prompt)
+                str_result = self.extract_message_content(result)
+                if cache_key and str_result:
+                    self.response_cache.put(cache_key, str_result)
+            else:
+                logger.info(f"Refinement agent '{self.name}' reused cached response (iteration: {iteration})")
             # Save output to file
             if self.outputs_dir:
-                output_file = self.outputs_dir / f"{self.name}_iteration_{iteration}.txt"
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(str_result)
-                logger.info(f"Saved refinement output to {output_file}")
+                self.save_output(f"{self.name}_iteration_{iteration}.txt", str_result)
             
-            execution_time = int(time.time() - start_time)
+            execution_time_us = (time.monotonic_ns() - start_ns) // 1000
             
             # Create updated state with refinement output
             updated_state = state.with_updates(
@@ -122,12 +145,11 @@ class RefinementAgentNode(BaseNode):
             return self.create_result(
                 message=str_result,
                 state=updated_state,
-                execution_time=execution_time
+                execution_time_us=execution_time_us
             )
             
         except Exception as e:
-            logger.error(f"Error in refinement agent '{self.name}': {e}", exc_info=True)
-            
+            # handle_error logs the error (traceback at DEBUG level)
             # Create error state preserving context
             error_state = ExecutionState(
                 original_prompt=invocation_state.get('original_prompt', '') if invocation_state else '',
@@ -136,5 +158,4 @@ class RefinementAgentNode(BaseNode):
                 run_dir=invocation_state.get('run_dir', '.') if invocation_state else '.'
             )
             
-            execution_time = int(time.time() - start_time)
             return self.handle_error(e, error_state)
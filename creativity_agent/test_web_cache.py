@@ -1,40 +1,91 @@
 #!/usr/bin/env python3
 """
-Quick test to verify web cache is working.
+Quick test to verify web cache is working under concurrent use.
+
+Fires identical searches in parallel (they should share one DDGS search),
+then checks that fetched content and repeated queries are served from the
+cache, and that a cache hit is fast.
+Requires network access.
 """
 
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from utilities.global_web_cache import GlobalWebCache
-from tools import search_web, set_web_cache
-
-# Create cache
-cache_dir = Path(__file__).parent / "outputs" / "test_cache"
-cache = GlobalWebCache(cache_dir)
-set_web_cache(cache)
-
-# First search - should be MISS and cache it
-print("[TEST 1] First search - should MISS and cache")
-result1 = search_web("python programming", max_results=3)
-print(f"Result length: {len(result1)} chars\n")
-
-# Second search - should be HIT from cache
-print("[TEST 2] Same search again - should HIT from cache")
-result2 = search_web("python programming", max_results=3)
-print(f"Result length: {len(result2)} chars\n")
-
-# Third search - different query - should be MISS
-print("[TEST 3] Different search - should MISS and cache")
-result3 = search_web("machine learning", max_results=3)
-print(f"Result length: {len(result3)} chars\n")
-
-# Print cache stats
-print("=" * 80)
-print("CACHE STATISTICS")
-print("=" * 80)
-stats = cache.get_cache_stats()
-print(f"Search Cache: {stats['search_cache']['total_entries']} entries, {stats['search_cache']['total_hits']} hits")
-print(f"Content Cache: {stats['content_cache']['total_entries']} entries, {stats['content_cache']['total_hits']} hits")
-
-print("\nTop Queries:")
-for q in stats['search_cache']['top_queries']:
-    print(f"  - {q['query']}: {q['hits']} hits")
+from tempfile import TemporaryDirectory
+
+from creativity_agent import tools
+from creativity_agent.tools import get_url_content, search_web, set_web_cache
+from creativity_agent.utilities.global_web_cache import GlobalWebCache
+
+QUERY = "python programming"
+PARALLEL_SEARCHES = 32
+MAX_HIT_LATENCY_NS = 5_000_000  # 5ms
+
+
+async def main():
+    # Count searches that actually reach DDGS
+    upstream_calls = 0
+    ddgs = tools.DDGS
+
+    def counting_ddgs(*args, **kwargs):
+        nonlocal upstream_calls
+        upstream_calls += 1
+        return ddgs(*args, **kwargs)
+
+    tools.DDGS = counting_ddgs
+
+    try:
+        with TemporaryDirectory() as tmpdir:
+            cache = GlobalWebCache(Path(tmpdir))
+            set_web_cache(cache)
+
+            # Parallel identical searches - should be coalesced into a single MISS
+            print(f"[TEST 1] {PARALLEL_SEARCHES} parallel identical searches - should run one search")
+            loop = asyncio.get_running_loop()
+            # One thread per search so all of them land in the same batching window
+            with ThreadPoolExecutor(max_workers=PARALLEL_SEARCHES) as executor:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, search_web, QUERY, 3) for _ in range(PARALLEL_SEARCHES))
+                )
+            urls = json.loads(results[0])
+            print(f"Found {len(urls)} URLs, upstream searches: {upstream_calls}\n")
+            assert urls, "search returned no URLs (network unavailable?)"
+            assert all(result == results[0] for result in results)
+            assert upstream_calls == 1, f"expected 1 upstream search, got {upstream_calls}"
+
+            # Fetch the first URL - should MISS and cache its content
+            print("[TEST 2] Fetch first URL twice - second fetch should HIT from cache")
+            content = get_url_content(urls[0])
+            t0 = time.perf_counter_ns()
+            cached = get_url_content(urls[0])
+            t1 = time.perf_counter_ns()
+            print(f"Content: {len(content)} chars, cache hit in {(t1 - t0) / 1e6:.2f}ms\n")
+            assert cached == content
+            assert (t1 - t0) < MAX_HIT_LATENCY_NS, f"cache hit took {(t1 - t0) / 1e6:.2f}ms"
+
+            # Repeated query - its cached URL should HIT without another DDGS search
+            print("[TEST 3] Same query again - should HIT from cache")
+            repeat_urls = json.loads(search_web(QUERY, 3))
+            print(f"Found {len(repeat_urls)} URLs, upstream searches: {upstream_calls}\n")
+            assert urls[0] in repeat_urls
+            assert upstream_calls == 1, f"expected no new upstream search, got {upstream_calls - 1}"
+
+            # Print cache stats
+            print("=" * 80)
+            print("CACHE STATISTICS")
+            print("=" * 80)
+            stats = cache.get_cache_stats()
+            print(f"URL Cache: {stats['url_cache']['total_urls_cached']} URLs, {stats['url_cache']['total_hits']} hits")
+            print(f"Query Mappings: {stats['query_mappings']['total_unique_queries']} queries")
+
+            cache.close()
+    finally:
+        # Restore the patched globals even when a check fails
+        tools.DDGS = ddgs
+        set_web_cache(None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,8 +1,10 @@
 from strands import tool
 from ddgs import DDGS
-from typing import Literal, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Tuple
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,91 @@ def set_web_cache(cache):
     _web_cache = cache
 
 
+def _search_urls(query: str, max_results: int, backend: str) -> List[str]:
+    """Return URLs for a query, from the query cache or a DDGS search."""
+    # Limit max_results
+    max_results = min(max_results, 20)
+    
+    # Check if we have URLs cached for this query
+    if _web_cache:
+        cached_urls = _web_cache.get_urls_for_query(query)
+        if cached_urls:
+            # Return cached URLs (sorted by hit count, take top max_results)
+            urls = [url for url, hits in cached_urls[:max_results]]
+            logger.info(f"Query cache HIT for '{query}': {len(urls)} URLs")
+            return urls
+    
+    # Cache miss - perform DDGS search
+    logger.info(f"Query cache MISS for '{query}': performing DDGS search")
+    
+    with DDGS() as ddgs:
+        if backend == "news":
+            results = list(ddgs.news(query, max_results=max_results))
+        else:
+            results = list(ddgs.text(query, max_results=max_results))
+    
+    # Extract URLs from results
+    urls = []
+    for result in results or []:
+        url = result.get('href', result.get('link', ''))
+        if url:
+            urls.append(url)
+    
+    # Cache the query -> URLs mapping
+    if _web_cache and urls:
+        _web_cache.link_query_to_urls(query, urls, f"ddgs-{backend}")
+        logger.info(f"Cached query->URLs mapping: '{query}' -> {len(urls)} URLs")
+    
+    return urls
+
+
+class _SearchBatcher:
+    """
+    Coalesces searches submitted by concurrent agent chains.
+    
+    Searches submitted within `window_s` of each other are collected into one
+    batch; identical (query, max_results, backend) requests share a single
+    backend search, and the unique ones run concurrently on a shared pool.
+    """
+    
+    def __init__(self, window_s: float = 0.05, max_workers: int = 4):
+        self.window_s = window_s
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, int, str], Future] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="web_search")
+    
+    def submit(self, query: str, max_results: int, backend: str) -> Future:
+        """Queue a search and return a future resolving to its URL list."""
+        key = (query, max_results, backend)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window_s, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+            return future
+    
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending, self._timer = self._pending, {}, None
+        logger.debug(f"Executing batch of {len(batch)} coalesced web searches")
+        for key, future in batch.items():
+            self._executor.submit(self._run, key, future)
+    
+    @staticmethod
+    def _run(key: Tuple[str, int, str], future: Future) -> None:
+        try:
+            future.set_result(_search_urls(*key))
+        except Exception as e:
+            future.set_exception(e)
+
+
+_search_batcher = _SearchBatcher()
+
+
 @tool
 def search_web(
     query: str,
@@ -46,43 +133,7 @@ def search_web(
         - News URLs: search_web("latest tech news", backend="news")
     """
     try:
-        # Limit max_results
-        max_results = min(max_results, 20)
-        
-        # Check if we have URLs cached for this query
-        if _web_cache:
-            cached_urls = _web_cache.get_urls_for_query(query)
-            if cached_urls:
-                # Return cached URLs (sorted by hit count, take top max_results)
-                urls = [url for url, hits in cached_urls[:max_results]]
-                logger.info(f"Query cache HIT for '{query}': {len(urls)} URLs")
-                return json.dumps(urls)
-        
-        # Cache miss - perform DDGS search
-        logger.info(f"Query cache MISS for '{query}': performing DDGS search")
-        
-        with DDGS() as ddgs:
-            if backend == "news":
-                results = list(ddgs.news(query, max_results=max_results))
-            else:
-                results = list(ddgs.text(query, max_results=max_results))
-        
-        if not results:
-            return json.dumps([])
-        
-        # Extract URLs from results
-        urls = []
-        for result in results:
-            url = result.get('href', result.get('link', ''))
-            if url:
-                urls.append(url)
-        
-        # Cache the query -> URLs mapping
-        if _web_cache and urls:
-            _web_cache.link_query_to_urls(query, urls, f"ddgs-{backend}")
-            logger.info(f"Cached query->URLs mapping: '{query}' -> {len(urls)} URLs")
-        
-        return json.dumps(urls)
+        return json.dumps(_search_batcher.submit(query, max_results, backend).result())
         
     except Exception as e:
         logger.error(f"Error during web search: {e}")
@@ -259,6 +310,7 @@ def bulk_search_web(
     Note:
         URLs found in search results are linked to queries for cache analytics.
         Individual URL content will be cached when accessed via get_url_content.
+        Queries are coalesced with concurrent searches from other agents.
         
     Examples:
         bulk_search_web("LLM optimization, attention mechanisms, transformer architectures", max_results=3)
@@ -286,18 +338,21 @@ def bulk_search_web(
         
         results = {}
         
+        # Submit every query before waiting so they join one coalesced batch,
+        # together with searches from other agents issued in the same window
+        futures = {}
         for query in query_list:
             if not isinstance(query, str):
-                results[query] = {"error": "Query must be a string"}
+                results[str(query)] = {"error": "Query must be a string"}
                 continue
-            
-            # Use the updated search_web function
-            urls_json = search_web(query, max_results, backend)
+            futures[query] = _search_batcher.submit(query, max_results, backend)
+        
+        for query, future in futures.items():
             try:
-                urls = json.loads(urls_json)
-                results[query] = urls
-            except json.JSONDecodeError:
-                results[query] = {"error": "Failed to parse search results"}
+                results[query] = future.result()
+            except Exception as e:
+                logger.error(f"Error during web search for '{query}': {e}")
+                results[query] = []
         
         return json.dumps(results, indent=2)
         
@@ -7,6 +7,7 @@ from .chaos_generator import ChaosGenerator
 from .prompt_builder import PromptBuilder
 from .jinja_prompt_builder import (
     JinjaPromptBuilder,
+    default_jinja_builder,
     CreativeAgentPromptContext,
     JudgePromptContext,
     RefinementPromptContext,
@@ -15,17 +16,20 @@ from .jinja_prompt_builder import (
 )
 from .dynamic_semantic_discovery import DynamicSemanticWordDiscovery
 from .global_web_cache import GlobalWebCache
+from .response_cache import ResponseCache
 from .independent_judge import IndependentJudge
 from .observability_tracker import ObservabilityTracker
 from .output_formatter import FinalOutputFormatter, save_formatted_output
 from .model_capabilities import supports_streaming_tools, supports_tools, get_model_info
 from .json_extractor import JsonExtractor
+from .buffered_output_writer import BufferedOutputWriter, ensure_dir, write_file
 
 __all__ = [
     'MemoryManager',
     'ChaosGenerator',
     'PromptBuilder',
     'JinjaPromptBuilder',
+    'default_jinja_builder',
     'CreativeAgentPromptContext',
     'JudgePromptContext',
     'RefinementPromptContext',
@@ -33,6 +37,7 @@ __all__ = [
     'PromptOutputSchema',
     'DynamicSemanticWordDiscovery',
     'GlobalWebCache',
+    'ResponseCache',
     'IndependentJudge',
     'ObservabilityTracker',
     'FinalOutputFormatter',
@@ -40,5 +45,8 @@ __all__ = [
     'supports_streaming_tools',
     'supports_tools',
     'get_model_info',
-    'JsonExtractor'
+    'JsonExtractor',
+    'BufferedOutputWriter',
+    'ensure_dir',
+    'write_file'
 ]
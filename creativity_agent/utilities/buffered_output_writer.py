@@ -0,0 +1,126 @@
+"""
+Buffered output writer that moves node output file writes off the hot path.
+
+Nodes submit (path, content) pairs; a background thread batches them and
+writes to disk, coalescing repeated writes to the same file.
+"""
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Directories already created by ensure_dir (a run touches only a handful)
+_ENSURED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process; later calls skip the mkdir syscall."""
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
+def write_file(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Write text or bytes to path, creating its directory with ensure_dir.
+
+    If the directory was removed after ensure_dir cached it, the stale entry
+    is dropped and the write retried once after recreating it.
+    """
+    for attempt in range(2):
+        ensure_dir(path.parent)
+        try:
+            if isinstance(data, bytes):
+                path.write_bytes(data)
+            else:
+                path.write_text(data, encoding='utf-8')
+            return
+        except FileNotFoundError:
+            if attempt:
+                raise
+            _ENSURED_DIRS.discard(str(path.parent))
+
+
+class BufferedOutputWriter:
+    """
+    Writes output files from a single background thread.
+
+    Writes are buffered until `flush_interval_s` has passed since the first
+    pending write, `max_buffered_bytes` is reached, or `flush()` is called.
+    Submission order is preserved; a later write to the same path replaces
+    an earlier pending one.
+    """
+
+    def __init__(self, flush_interval_s: float = 1.0, max_buffered_bytes: int = 1 << 20):
+        """
+        Initialize the writer and start its background thread.
+
+        Args:
+            flush_interval_s: Maximum time a write stays buffered
+            max_buffered_bytes: Buffered content size that triggers an immediate flush
+        """
+        self.flush_interval_s = flush_interval_s
+        self.max_buffered_bytes = max_buffered_bytes
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="output_writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, content: str) -> None:
+        """Queue content to be written to path."""
+        self._queue.put((Path(path), content))
+
+    def flush(self) -> None:
+        """Block until every write submitted so far is on disk."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        pending: Dict[Path, str] = {}
+        buffered_bytes = 0
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = threading.Event()  # Interval elapsed: flush without a waiter
+
+            if isinstance(item, tuple):
+                path, content = item
+                pending.pop(path, None)
+                pending[path] = content
+                buffered_bytes += len(content)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval_s
+                if buffered_bytes < self.max_buffered_bytes:
+                    continue
+
+            self._write(pending)
+            pending = {}
+            buffered_bytes = 0
+            deadline = None
+
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    @staticmethod
+    def _write(pending: Dict[Path, str]) -> None:
+        for path, content in pending.items():
+            try:
+                write_file(path, content)
+            except Exception as e:
+                logger.error(f"Failed to write output file {path}: {e}")
@@ -7,6 +7,8 @@ Now with dynamic semantic word discovery using embeddings.
 from strands import Agent
 from strands.models import BedrockModel
 from typing import List, Optional
+from botocore.config import Config as BotocoreConfig
+import boto3
 import logging
 import os
 from creativity_agent.models import ChaosInput, TangentialConcept
@@ -30,7 +32,9 @@ class ChaosGenerator:
         streaming: bool = True,
         region_name: Optional[str] = None,
         semantic_backend: str = "auto",
-        tangent_range: tuple = (0.3, 0.7)
+        tangent_range: tuple = (0.3, 0.7),
+        boto_session: Optional[boto3.Session] = None,
+        boto_client_config: Optional[BotocoreConfig] = None
     ):
         """
         Initialize chaos generator.
@@ -42,12 +46,18 @@ class ChaosGenerator:
             region_name: AWS region name
             semantic_backend: "auto", "sentence-transformers", "gensim", "wordnet", or "simple"
             tangent_range: (min, max) similarity for tangential words (0.3-0.7 is good sweet spot)
+            boto_session: Shared boto3 session to create the Bedrock client from (overrides region_name)
+            boto_client_config: Botocore client config (connection pool, retries)
         """
         self.model = BedrockModel(
             model_id=model_id,
             temperature=temperature,
             streaming=streaming,
-            region_name=region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+            boto_client_config=boto_client_config,
+            **(
+                {"boto_session": boto_session} if boto_session
+                else {"region_name": region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')}
+            )
         )
         self.agent = Agent(model=self.model, tools=[search_web, get_url_content, bulk_search_web], callback_handler=None)
         
@@ -28,6 +28,9 @@ class GlobalWebCache:
     Thread-safe with proper connection handling.
     """
     
+    # Upper bound on the memory-mapped portion of the database file
+    MMAP_SIZE_BYTES = 256 * 1024 * 1024
+    
     def __init__(self, cache_dir: Path):
         """
         Initialize the global web cache.
@@ -40,15 +43,35 @@ class GlobalWebCache:
         
         self.db_path = self.cache_dir / "global_web_cache.db"
         self._lock = threading.RLock()  # Thread-safe access
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_database()
         
         logger.info(f"Global web cache initialized at {self.db_path} (URL-based caching)")
     
     def _get_connection(self):
-        """Get a thread-safe SQLite connection."""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
-        conn.isolation_level = None  # Autocommit mode
-        return conn
+        """
+        Get the cache's SQLite connection, opening it on first use.
+        
+        One connection is reused for the cache's lifetime; every access holds
+        self._lock, so it is never used by two threads at once. WAL journaling
+        lets concurrent runs read while another writes, and reads are served
+        from a memory-mapped view of the database file.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+            conn.isolation_level = None  # Autocommit mode
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE_BYTES}")
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Close the SQLite connection (reopened automatically on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def _init_database(self):
         """Create database tables if they don't exist."""
@@ -113,7 +136,7 @@ class GlobalWebCache:
                 logger.error(f"Error initializing database: {e}")
                 raise
             finally:
-                conn.close()
+                cursor.close()
     
     def _make_url_hash(self, url: str) -> str:
         """Create a unique hash for a URL."""
@@ -159,12 +182,12 @@ class GlobalWebCache:
                         WHERE url_hash = ?
                     """, (datetime.now().isoformat(), url_hash))
                     conn.commit()
-                    conn.close()
+                    cursor.close()
                     
                     logger.info(f"Cache HIT for URL: {url[:60]}...")
                     return result[0]
                 
-                conn.close()
+                cursor.close()
                 logger.info(f"Cache MISS for URL: {url[:60]}...")
                 return None
         
@@ -217,7 +240,7 @@ class GlobalWebCache:
                     logger.info(f"Updated cached URL: {url[:60]}...")
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error caching URL content: {e}", exc_info=True)
@@ -262,7 +285,7 @@ class GlobalWebCache:
                     logger.info(f"Linked query '{query[:40]}...' to {len(urls)} URLs")
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error linking query to URLs: {e}")
@@ -296,7 +319,7 @@ class GlobalWebCache:
                     return results
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error getting URLs for query: {e}")
@@ -329,7 +352,7 @@ class GlobalWebCache:
                     return results
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error getting top URLs: {e}")
@@ -392,7 +415,7 @@ class GlobalWebCache:
                     }
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
@@ -463,7 +486,7 @@ class GlobalWebCache:
                     logger.info(f"Cleared {cache_deleted} cache entries and {query_deleted} query mappings older than {days} days")
                 
                 finally:
-                    conn.close()
+                    cursor.close()
         
         except Exception as e:
             logger.error(f"Error clearing old cache entries: {e}")
@@ -5,8 +5,11 @@ Uses Jinja2 templates for prompt rendering.
 from strands import Agent
 from strands.models import BedrockModel
 from typing import List, Dict, Optional, TYPE_CHECKING
+from botocore.config import Config as BotocoreConfig
+import boto3
 from creativity_agent.models.observability_models import JudgeEvaluation
 from datetime import datetime
+import asyncio
 import logging
 import re
 import json
@@ -29,7 +32,9 @@ class IndependentJudge:
         judge_model_id: str = "us.anthropic.claude-sonnet-4-20250514-v1:0",
         judge_temperature: float = 0.1,
         streaming: bool = True,
-        region_name: str = "us-east-1"
+        region_name: str = "us-east-1",
+        boto_session: Optional[boto3.Session] = None,
+        boto_client_config: Optional[BotocoreConfig] = None
     ):
         """
         Initialize the independent judge.
@@ -39,22 +44,37 @@ class IndependentJudge:
             judge_model_id: Model ID for the judge (from flow_config)
             judge_temperature: Temperature for judge evaluation
             streaming: Whether to use streaming mode (disable for models that don't support it)
-            region_name: AWS region for Bedrock
+            region_name: AWS region for Bedrock (ignored when boto_session is given)
+            boto_session: Shared boto3 session to create the Bedrock client from
+            boto_client_config: Botocore client config (connection pool, retries)
         """
         self.jinja_builder = jinja_builder
         self.judge_model_id = judge_model_id
-        model = BedrockModel(
+        self.model = BedrockModel(
             model_id=self.judge_model_id,
             temperature=judge_temperature,
             streaming=streaming,
-            region_name=region_name
+            boto_client_config=boto_client_config,
+            **({"boto_session": boto_session} if boto_session else {"region_name": region_name})
         )
         
         # Create agent wrapper for the judge model
-        self.agent = Agent(model=model, tools=[])
+        self.agent = self.create_agent()
         
         logger.info(f"Independent judge initialized with {self.judge_model_id}")
     
+    def create_agent(self) -> Agent:
+        """
+        Create a new judge agent sharing this judge's model.
+        
+        Strands agents reject concurrent invocations, so each judge node
+        that may run in parallel with others needs its own agent instance.
+        
+        Returns:
+            Agent bound to the judge model
+        """
+        return Agent(model=self.model, tools=[])
+    
     def evaluate_idea(
         self, 
         idea_text: str, 
@@ -79,60 +99,113 @@ class IndependentJudge:
         logger.info(f"Evaluating idea: {idea_name[:50]}...")
         
         try:
-            # Build the judge prompt using Jinja2 builder
-            from creativity_agent.utilities.jinja_prompt_builder import JudgePromptContext
-            
-            judge_context = JudgePromptContext(
-                idea_text=idea_text,
-                evaluation_criteria={
-                    "originality": "How novel and creative is this idea?",
-                    "feasibility": "How practical and implementable is this?",
-                    "impact": "What is the potential impact or value?",
-                    "substance": "How well-developed and substantial is the idea?"
-                },
-                acceptance_threshold=5.0
-            )
-            
-            prompt = self.jinja_builder.build_judge_prompt(judge_context)
-            
             # Get evaluation from judge
-            agent_result = self.agent(prompt)
-            response_content = agent_result.message['content']
-            response_text = response_content[0].get('text', '') if response_content else ''
-            
-            # Parse the evaluation response
-            evaluation = self._parse_evaluation(
-                response_text,
-                idea_name,
-                source_model,
-                temperature,
-                iteration
-            )
+            agent_result = self.agent(self._build_idea_prompt(idea_text))
+            return self._evaluation_from_result(agent_result, idea_name, source_model, temperature, iteration)
             
-            logger.info(f"Evaluation complete: {idea_name} - Score: {evaluation.overall_quality_score:.1f}, Decision: {'ACCEPTED' if evaluation.accepted else 'REJECTED'}")
-            
-            return evaluation
+        except Exception as e:
+            logger.error(f"Error evaluating idea '{idea_name}': {e}")
+            return self._error_evaluation(e, idea_name, source_model, temperature, iteration)
+    
+    async def evaluate_idea_async(
+        self,
+        agents: "asyncio.Queue[Agent]",
+        idea_text: str,
+        idea_name: str,
+        source_model: str,
+        temperature: float,
+        iteration: int
+    ) -> JudgeEvaluation:
+        """
+        Evaluate a single idea with an agent borrowed from a pool.
+        
+        Waits for a free agent, so the pool size bounds how many judge
+        requests are in flight.
+        
+        Args:
+            agents: Pool of judge agents (see create_agent)
+            idea_text, idea_name, source_model, temperature, iteration: As for evaluate_idea
             
+        Returns:
+            JudgeEvaluation with detailed scores and decision
+        """
+        agent = await agents.get()
+        try:
+            logger.info(f"Evaluating idea: {idea_name[:50]}...")
+            agent_result = await agent.invoke_async(self._build_idea_prompt(idea_text))
+            return self._evaluation_from_result(agent_result, idea_name, source_model, temperature, iteration)
         except Exception as e:
             logger.error(f"Error evaluating idea '{idea_name}': {e}")
-            # Return a default rejection evaluation
-            return JudgeEvaluation(
-                idea_id=f"error_{datetime.now().timestamp()}",
-                idea_name=idea_name,
-                originality_score=0.0,
-                feasibility_score=0.0,
-                impact_score=0.0,
-                substance_score=0.0,
-                overall_quality_score=0.0,
-                accepted=False,
-                rejection_reasons=[f"Evaluation error: {str(e)}"],
-                key_points=[],
-                model_id=source_model,
-                temperature=temperature,
-                iteration=iteration,
-                evaluation_timestamp=datetime.now(),
-                judge_model=self.judge_model_id
-            )
+            return self._error_evaluation(e, idea_name, source_model, temperature, iteration)
+        finally:
+            agents.put_nowait(agent)
+    
+    def _build_idea_prompt(self, idea_text: str) -> str:
+        """Render the judge prompt for a single idea."""
+        from creativity_agent.utilities.jinja_prompt_builder import JudgePromptContext
+        
+        judge_context = JudgePromptContext(
+            idea_text=idea_text,
+            evaluation_criteria={
+                "originality": "How novel and creative is this idea?",
+                "feasibility": "How practical and implementable is this?",
+                "impact": "What is the potential impact or value?",
+                "substance": "How well-developed and substantial is the idea?"
+            },
+            acceptance_threshold=5.0
+        )
+        return self.jinja_builder.build_judge_prompt(judge_context)
+    
+    def _evaluation_from_result(
+        self,
+        agent_result,
+        idea_name: str,
+        source_model: str,
+        temperature: float,
+        iteration: int
+    ) -> JudgeEvaluation:
+        """Parse a judge agent result into a JudgeEvaluation."""
+        response_content = agent_result.message['content']
+        response_text = response_content[0].get('text', '') if response_content else ''
+        
+        # Parse the evaluation response
+        evaluation = self._parse_evaluation(
+            response_text,
+            idea_name,
+            source_model,
+            temperature,
+            iteration
+        )
+        
+        logger.info(f"Evaluation complete: {idea_name} - Score: {evaluation.overall_quality_score:.1f}, Decision: {'ACCEPTED' if evaluation.accepted else 'REJECTED'}")
+        
+        return evaluation
+    
+    def _error_evaluation(
+        self,
+        error: Exception,
+        idea_name: str,
+        source_model: str,
+        temperature: float,
+        iteration: int
+    ) -> JudgeEvaluation:
+        """Default rejection evaluation for an idea the judge failed to evaluate."""
+        return JudgeEvaluation(
+            idea_id=f"error_{datetime.now().timestamp()}",
+            idea_name=idea_name,
+            originality_score=0.0,
+            feasibility_score=0.0,
+            impact_score=0.0,
+            substance_score=0.0,
+            overall_quality_score=0.0,
+            accepted=False,
+            rejection_reasons=[f"Evaluation error: {str(error)}"],
+            key_points=[],
+            model_id=source_model,
+            temperature=temperature,
+            iteration=iteration,
+            judge_model=self.judge_model_id
+        )
     
     def _parse_evaluation(
         self,
@@ -155,7 +228,7 @@ class IndependentJudge:
         Returns:
             Parsed JudgeEvaluation
         """
-        logger.debug(f"Parsing evaluation response:\n{response_text[:500]}")
+        logger.debug("Parsing evaluation response:\n%.500s", response_text)
         
         try:
             # Try to parse as JSON first
@@ -203,7 +276,6 @@ class IndependentJudge:
             model_id=source_model,
             temperature=temperature,
             iteration=iteration,
-            evaluation_timestamp=datetime.now(),
             judge_model=self.judge_model_id
         )
     
@@ -256,7 +328,6 @@ class IndependentJudge:
             model_id=source_model,
             temperature=temperature,
             iteration=iteration,
-            evaluation_timestamp=datetime.now(),
             judge_model=self.judge_model_id
         )
     
@@ -289,37 +360,50 @@ class IndependentJudge:
         items = [item.strip() for item in line.split(",")]
         return [item for item in items if item and item.lower() != "none"]
     
-    def batch_evaluate(
+    async def batch_evaluate_async(
         self,
         ideas: List[Dict[str, str]],
         source_model: str,
         temperature: float,
-        iteration: int
+        iteration: int,
+        max_concurrency: int = 8
     ) -> List[JudgeEvaluation]:
         """
-        Evaluate multiple ideas in batch.
+        Evaluate multiple ideas concurrently.
+        
+        Each in-flight evaluation uses its own agent (Strands agents reject
+        concurrent invocations); the agent pool size caps concurrency to
+        respect provider rate limits.
         
         Args:
             ideas: List of dicts with 'name' and 'text' keys
             source_model: Model that generated these ideas
             temperature: Temperature used
             iteration: Iteration number
+            max_concurrency: Maximum judge requests in flight
             
         Returns:
-            List of JudgeEvaluations
+            List of JudgeEvaluations, in the same order as ideas
         """
-        evaluations = []
+        if not ideas:
+            return []
+        
+        agents: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(max_concurrency, len(ideas))):
+            agents.put_nowait(self.create_agent())
         
-        for idea in ideas:
-            evaluation = self.evaluate_idea(
+        evaluations = await asyncio.gather(*(
+            self.evaluate_idea_async(
+                agents,
                 idea_text=idea['text'],
                 idea_name=idea['name'],
                 source_model=source_model,
                 temperature=temperature,
                 iteration=iteration
             )
-            evaluations.append(evaluation)
+            for idea in ideas
+        ))
         
         logger.info(f"Batch evaluation complete: {len(evaluations)} ideas evaluated")
         
-        return evaluations
+        return list(evaluations)
@@ -5,10 +5,14 @@ Replaces simple string formatting with sophisticated template-based prompts that
 structured JSON output, clear evaluation criteria, and validated results.
 """
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
+import os
+import threading
 from pydantic import BaseModel, Field
 
 
@@ -49,6 +53,10 @@ class JudgePromptContext(BaseModel):
     """Context variables for judge agent template."""
     
     refinement_output: Optional[str] = Field(default=None, description="Refinement output to parse and evaluate (for batch evaluation)")
+    model_outputs: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Refinement outputs keyed by model, evaluated together in one request"
+    )
     evaluation_criteria: Dict[str, str] = Field(
         description="Scoring criteria descriptions"
     )
@@ -94,43 +102,92 @@ class PromptOutputSchema(BaseModel):
     )
 
 
+# Prompt template file for each get_compiled() name
+_TEMPLATE_FILES = {
+    'creative': 'creative_agent.j2',
+    'judge': 'judge_agent.j2',
+    'refinement': 'refinement_agent.j2',
+    'chaos': 'chaos_generator.j2',
+    'judge_report': 'judge_report.j2',
+}
+
+
+@lru_cache(maxsize=None)
+def _shared_environment(
+    templates_dir: str,
+    bytecode_cache_dir: Optional[str],
+    default_bytecode_cache: bool = False
+) -> Environment:
+    """
+    One Environment per template directory, shared by every builder.
+    
+    Jinja caches compiled templates per Environment, so sharing it lets all
+    nodes reuse a template compiled by any of them.
+    
+    With default_bytecode_cache (and no bytecode_cache_dir), bytecode goes to
+    Jinja's own per-user temp directory, which Jinja creates with mode 0700
+    and checks the ownership of before loading anything from it.
+    """
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=bytecode_cache_dir)
+    elif default_bytecode_cache:
+        bytecode_cache = FileSystemBytecodeCache()
+    
+    # Templates don't change during a run: skip per-lookup mtime checks.
+    # Prompts are plain text (.j2), so autoescaping never applied to them.
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=False,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        cache_size=400
+    )
+    env.filters['json_stringify'] = JinjaPromptBuilder._json_stringify
+    env.filters['format_list'] = JinjaPromptBuilder._format_list
+    return env
+
+
 class JinjaPromptBuilder:
     """Advanced prompt builder using Jinja2 templates with structured output."""
     
-    def __init__(self, templates_dir: str = "prompts_templates"):
+    def __init__(
+        self,
+        templates_dir: str = "prompts_templates",
+        bytecode_cache_dir: Optional[Path] = None
+    ):
         """
         Initialize prompt builder.
         
         Args:
             templates_dir: Directory containing Jinja2 template files
+            bytecode_cache_dir: Optional directory for compiled template bytecode,
+                reused across runs to skip template parsing. Defaults to
+                Jinja's per-user cache directory unless
+                CREATIVITY_JINJA_BC_CACHE=0
         """
         self.templates_dir = Path(templates_dir)
         self.system_prompts_dir = Path(templates_dir).parent / "system_prompts"
         
-        # Initialize Jinja2 environment for templates
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        cache_dir = str(bytecode_cache_dir) if bytecode_cache_dir is not None else None
+        default_cache = os.getenv('CREATIVITY_JINJA_BC_CACHE', '1') != '0'
         
-        # Initialize Jinja2 environment for system prompts
-        self.system_env = Environment(
-            loader=FileSystemLoader(str(self.system_prompts_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Register custom filters
-        self.env.filters['json_stringify'] = self._json_stringify
-        self.env.filters['format_list'] = self._format_list
-        self.system_env.filters['json_stringify'] = self._json_stringify
-        self.system_env.filters['format_list'] = self._format_list
+        # Jinja2 environments for templates and system prompts, shared with
+        # other builders for the same directories
+        self.env = _shared_environment(str(self.templates_dir.resolve()), cache_dir, default_cache)
+        self.system_env = _shared_environment(str(self.system_prompts_dir.resolve()), cache_dir, default_cache)
         
         # Cache system prompts
         self._system_prompts_cache: Dict[str, str] = {}
+        
+        # Rendered creative/judge prompts keyed on (template name, canonical
+        # context JSON): parallel agents in an iteration share a context.
+        # Least recently used entries are evicted past 256.
+        self._render_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._render_cache_lock = threading.Lock()
     
     def get_creative_agent_system_prompt(self) -> str:
         """Get the system prompt for creative agent."""
@@ -180,6 +237,22 @@ class JinjaPromptBuilder:
                 self._system_prompts_cache['judge'] = ""
         return self._system_prompts_cache['judge']
     
+    def get_compiled(self, name: str) -> Template:
+        """
+        Get a compiled prompt template for rendering directly.
+        
+        Lets hot callers keep the Template and call render() with plain
+        keyword arguments, skipping the context model and schema extras the
+        build_*_prompt methods assemble on every call.
+        
+        Args:
+            name: Template name: 'creative', 'judge', 'refinement', 'chaos' or 'judge_report'
+            
+        Returns:
+            Compiled jinja2 Template
+        """
+        return self.env.get_template(_TEMPLATE_FILES[name])
+    
     @staticmethod
     def _json_stringify(data: Any) -> str:
         """Filter to convert data to JSON string."""
@@ -194,50 +267,72 @@ class JinjaPromptBuilder:
     
     def build_creative_agent_prompt(
         self,
-        context: CreativeAgentPromptContext
+        context: CreativeAgentPromptContext,
+        no_cache: bool = False
     ) -> str:
         """
         Build creative agent prompt with structured output requirements.
         
         Args:
             context: Context variables for template rendering
+            no_cache: Render even if an identical context was rendered before
             
         Returns:
             Rendered prompt string with JSON output schema
         """
-        template = self.env.get_template('creative_agent.j2')
-        
-        context_dict = {
-            **context.model_dump(),
-            'output_schema': self._get_creative_output_schema(),
-            'json_format_example': self._get_creative_output_example()
-        }
-        
-        return template.render(**context_dict)
+        return self._render_context('creative', context, no_cache)
     
     def build_judge_prompt(
         self,
-        context: JudgePromptContext
+        context: JudgePromptContext,
+        no_cache: bool = False
     ) -> str:
         """
         Build judge evaluation prompt with scoring schema.
         
         Args:
             context: Context variables for template rendering
+            no_cache: Render even if an identical context was rendered before
             
         Returns:
             Rendered prompt with evaluation criteria and JSON schema
         """
-        template = self.env.get_template('judge_agent.j2')
-        
-        context_dict = {
-            **context.model_dump(),
-            'output_schema': self._get_judge_output_schema(),
-            'json_format_example': self._get_judge_output_example(),
-            'scoring_guidelines': self._get_scoring_guidelines()
-        }
-        
-        return template.render(**context_dict)
+        return self._render_context('judge', context, no_cache)
+    
+    def _render_context(self, name: str, context: BaseModel, no_cache: bool) -> str:
+        """Render a template from a context model, through the render cache unless no_cache."""
+        context_dict = context.model_dump()
+        if no_cache:
+            return self._render(name, context_dict)
+        # Sorted JSON is only the cache key; the template renders the context
+        # as given, so dict fields keep their insertion order
+        key = (name, json.dumps(context_dict, sort_keys=True))
+        with self._render_cache_lock:
+            rendered = self._render_cache.get(key)
+            if rendered is not None:
+                self._render_cache.move_to_end(key)
+                return rendered
+        rendered = self._render(name, context_dict)
+        with self._render_cache_lock:
+            self._render_cache[key] = rendered
+            if len(self._render_cache) > 256:
+                self._render_cache.popitem(last=False)
+        return rendered
+    
+    def _render(self, name: str, context_dict: Dict[str, Any]) -> str:
+        """Render a creative or judge template with its output schema variables."""
+        if name == 'creative':
+            extras = {
+                'output_schema': self._get_creative_output_schema(),
+                'json_format_example': self._get_creative_output_example()
+            }
+        else:
+            extras = {
+                'output_schema': self._get_judge_output_schema(),
+                'json_format_example': self._get_judge_output_example(),
+                'scoring_guidelines': self._get_scoring_guidelines()
+            }
+        return self.get_compiled(name).render(**context_dict, **extras)
     
     def build_refinement_prompt(
         self,
@@ -264,13 +359,19 @@ class JinjaPromptBuilder:
     
     def build_chaos_prompt(
         self,
-        context: ChaosPromptContext
+        context: Optional[ChaosPromptContext] = None,
+        **variables: Any
     ) -> str:
         """
         Build chaos generator prompt.
         
+        Accepts either a ChaosPromptContext or its fields as keyword
+        arguments (original_prompt, concept_word, related_concepts), which
+        skips validating the context model.
+        
         Args:
             context: Context variables for template rendering
+            **variables: Template variables, used when no context is given
             
         Returns:
             Rendered prompt for tangential concept generation
@@ -278,7 +379,7 @@ class JinjaPromptBuilder:
         template = self.env.get_template('chaos_generator.j2')
         
         context_dict = {
-            **context.model_dump(),
+            **(context.model_dump() if context is not None else variables),
             'output_schema': self._get_chaos_output_schema(),
             'json_format_example': self._get_chaos_output_example()
         }
@@ -565,8 +666,15 @@ class JinjaPromptBuilder:
         }
 
 
+@lru_cache(maxsize=None)
+def default_jinja_builder() -> JinjaPromptBuilder:
+    """Process-wide builder used by nodes that aren't given one."""
+    return JinjaPromptBuilder()
+
+
 __all__ = [
     'JinjaPromptBuilder',
+    'default_jinja_builder',
     'PromptConfig',
     'CreativeAgentPromptContext',
     'JudgePromptContext',
@@ -27,32 +27,43 @@ class MemoryManager:
         self.memory_dir = memory_dir
         self.memory_dir.mkdir(exist_ok=True)
         self.memory = IdeaMemory()
-        self.memory_file = self.memory_dir / "idea_memory.json"
+        # Append-only journal; idea_memory.json is the older full-dump format
+        self.memory_file = self.memory_dir / "idea_memory.jsonl"
+        self.legacy_memory_file = self.memory_dir / "idea_memory.json"
     
     def load_memory(self) -> IdeaMemory:
-        """Load memory from disk if it exists."""
-        if self.memory_file.exists():
-            try:
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
+        """
+        Load memory from disk if it exists.
+        
+        Ideas added afterwards are appended to the memory journal as they
+        arrive. A legacy idea_memory.json is converted to a journal on load.
+        """
+        journal_exists = self.memory_file.exists()
+        try:
+            if journal_exists:
+                self.memory = IdeaMemory.load_jsonl(self.memory_file)
+            elif self.legacy_memory_file.exists():
+                with open(self.legacy_memory_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                self.memory = IdeaMemory(**data)
-                logger.info(f"Loaded memory: {len(self.memory.explored_ideas)} explored, "
-                          f"{len(self.memory.rejected_ideas)} rejected")
-            except Exception as e:
-                logger.error(f"Error loading memory: {e}")
-                self.memory = IdeaMemory()
+                self.memory = IdeaMemory.from_json(data)
+            logger.info(f"Loaded memory: {len(self.memory.explored_ideas)} explored, "
+                      f"{len(self.memory.rejected_ideas)} rejected")
+        except Exception as e:
+            logger.error(f"Error loading memory: {e}")
+            self.memory = IdeaMemory()
+        
+        self.memory.open_journal(self.memory_file, rewrite=not journal_exists)
         return self.memory
     
     def save_memory(self) -> None:
-        """Save current memory state to disk."""
+        """
+        Make the memory journal durable on disk.
+        
+        Ideas are already appended to the journal as they're added; this
+        flushes and fsyncs it (call on shutdown or at checkpoints).
+        """
         try:
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self.memory.model_dump(mode='json'),
-                    f,
-                    indent=2,
-                    default=str
-                )
+            self.memory.sync_journal()
             logger.info("Memory saved successfully")
         except Exception as e:
             logger.error(f"Error saving memory: {e}")
@@ -448,13 +459,22 @@ class MemoryManager:
         self.memory.add_rejected_idea(concept, reason, iteration)
         logger.info(f"Marked as rejected: {concept}")
     
+    def close(self) -> None:
+        """Sync and close the memory journal (call when the flow is done with memory)."""
+        self.memory.close_journal()
+    
     def get_memory_context(self) -> str:
         """Get formatted memory context for prompt injection."""
         return self.memory.get_memory_summary()
     
     def clear_memory(self) -> None:
         """Clear all memory (useful for starting fresh)."""
+        journaling = self.memory._journal is not None
+        self.memory.close_journal()
         self.memory = IdeaMemory()
-        if self.memory_file.exists():
-            self.memory_file.unlink()
+        for memory_file in (self.memory_file, self.legacy_memory_file):
+            if memory_file.exists():
+                memory_file.unlink()
+        if journaling:
+            self.memory.open_journal(self.memory_file)
         logger.info("Memory cleared")
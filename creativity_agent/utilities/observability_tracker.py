@@ -2,29 +2,56 @@
 Observability and metrics tracking with ElasticSearch integration.
 """
 from elasticsearch import Elasticsearch
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import List, Optional
+from pathlib import Path
 from creativity_agent.models.observability_models import (
     RunMetrics, IterationMetrics, StepMetrics, IdeaStatistics,
-    TokenUtilization, ModelType, TemperatureType, StepType, JudgeEvaluation
+    TokenUtilization, ModelType, TemperatureType, StepType, JudgeEvaluation, BreakdownColumns, epoch_ms
 )
 import logging
+import os
+import threading
 import time
 from statistics import median, mean
 
+try:
+    from elasticsearch.serializer import OrjsonSerializer
+except ImportError:  # Optional: orjson not installed (or an older client)
+    OrjsonSerializer = None
+
 logger = logging.getLogger(__name__)
 
 
+def _pid_running(pid: int) -> bool:
+    """Whether a process with this PID exists (always assumed on Windows)."""
+    if os.name == 'nt':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
 class ObservabilityTracker:
     """
     Tracks comprehensive metrics for creativity agent runs and sends to ElasticSearch.
+
+    Finished runs are appended to an on-disk JSONL queue and bulk-indexed by a
+    background thread, so ending a run never waits on ElasticSearch. Runs
+    still queued when the process exits are indexed by the next tracker.
+    Processes sharing a queue claim batches by renaming the queue to a
+    per-PID in-flight file, so each batch is indexed by one of them.
     """
     
     def __init__(
         self,
         es_uri: str,
         es_api_key: str,
-        index_name: str = "super-creativity"
+        index_name: str = "super-creativity",
+        queue_path: Optional[Path] = None
     ):
         """
         Initialize observability tracker with ElasticSearch connection.
@@ -33,11 +60,15 @@ class ObservabilityTracker:
             es_uri: ElasticSearch URI
             es_api_key: ElasticSearch API key
             index_name: Index name for storing metrics
+            queue_path: JSONL file holding runs waiting to be indexed
         """
+        # With orjson installed, encode documents (including bulk bodies) with it
+        serializer_kwargs = {"serializer": OrjsonSerializer()} if OrjsonSerializer else {}
         self.es_client = Elasticsearch(
             [es_uri],
             api_key=es_api_key,
-            verify_certs=True
+            verify_certs=True,
+            **serializer_kwargs
         )
         
         self.index_name = index_name
@@ -58,6 +89,20 @@ class ObservabilityTracker:
         self.current_run: Optional[RunMetrics] = None
         self.current_iteration: Optional[IterationMetrics] = None
         self.current_step_start: Optional[float] = None
+        
+        # Background indexing of queued runs
+        self.queue_path = Path(queue_path) if queue_path else (
+            Path.home() / ".cache" / "super-creativity" / f"{index_name}-queue.jsonl"
+        )
+        self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+        self._inflight_path = self._inflight_path_for(os.getpid())
+        self._queue_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._closed = False
+        self._flush_thread = threading.Thread(target=self._run_flusher, name="es_indexer", daemon=True)
+        self._flush_thread.start()
+        # Index anything left queued or in flight by earlier processes
+        self._flush_requested.set()
     
     def _ensure_index_exists(self):
         """Create the index with proper mappings if it doesn't exist."""
@@ -115,12 +160,12 @@ class ObservabilityTracker:
         """Start tracking a new run."""
         self.current_run = RunMetrics(
             run_id=run_id,
-            run_timestamp=datetime.now(),
             original_prompt=original_prompt,
             config_iterations=config_iterations,
             chaos_seeds_per_iteration=chaos_seeds_per_iteration,
             semantic_backend=semantic_backend,
             iterations=[],
+            index_name=self.index_name,
             total_duration_seconds=0.0,
             total_ideas_generated=0,
             final_idea_statistics=IdeaStatistics(
@@ -276,7 +321,9 @@ class ObservabilityTracker:
         self,
         final_idea_statistics: IdeaStatistics,
         success: bool = True,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        converged: bool = False,
+        iterations_completed: Optional[int] = None
     ):
         """Finalize and send the run metrics to ElasticSearch."""
         if not self.current_run:
@@ -300,49 +347,16 @@ class ObservabilityTracker:
             estimated_cost_usd=total_cost
         )
         
-        # Model breakdown
-        model_stats: Dict[str, Dict[str, Any]] = {}
-        for iteration in self.current_run.iterations:
-            for step in iteration.steps:
-                model_key = step.model_type.value
-                if model_key not in model_stats:
-                    model_stats[model_key] = {
-                        "total_duration_seconds": 0.0,
-                        "total_tokens": 0,
-                        "total_ideas": 0,
-                        "step_count": 0
-                    }
-                
-                model_stats[model_key]["total_duration_seconds"] += step.duration_seconds
-                model_stats[model_key]["total_tokens"] += step.token_usage.total_tokens
-                model_stats[model_key]["total_ideas"] += step.ideas_generated
-                model_stats[model_key]["step_count"] += 1
-        
-        self.current_run.model_breakdown = model_stats
-        
-        # Temperature breakdown
-        temp_stats: Dict[str, Dict[str, Any]] = {}
-        for iteration in self.current_run.iterations:
-            for step in iteration.steps:
-                temp_key = step.temperature_type.value
-                if temp_key not in temp_stats:
-                    temp_stats[temp_key] = {
-                        "total_duration_seconds": 0.0,
-                        "total_tokens": 0,
-                        "total_ideas": 0,
-                        "step_count": 0
-                    }
-                
-                temp_stats[temp_key]["total_duration_seconds"] += step.duration_seconds
-                temp_stats[temp_key]["total_tokens"] += step.token_usage.total_tokens
-                temp_stats[temp_key]["total_ideas"] += step.ideas_generated
-                temp_stats[temp_key]["step_count"] += 1
-        
-        self.current_run.temperature_breakdown = temp_stats
+        # Model and temperature breakdowns
+        all_steps = [step for iteration in self.current_run.iterations for step in iteration.steps]
+        self.current_run.model_breakdown = BreakdownColumns.from_steps(all_steps, 'model_type').to_breakdown()
+        self.current_run.temperature_breakdown = BreakdownColumns.from_steps(all_steps, 'temperature_type').to_breakdown()
         
         self.current_run.success = success
         self.current_run.error = error
-        self.current_run.indexed_at = datetime.now()
+        self.current_run.converged = converged
+        self.current_run.iterations_completed = iterations_completed
+        self.current_run.indexed_at = epoch_ms()
         
         # Send to ElasticSearch
         self._send_to_elasticsearch()
@@ -351,26 +365,81 @@ class ObservabilityTracker:
         self.current_run = None
     
     def _send_to_elasticsearch(self):
-        """Send the current run metrics to ElasticSearch."""
+        """Queue the current run metrics for background indexing."""
         if not self.current_run:
             logger.warning("No run to send to ElasticSearch")
             return
         
         try:
-            # Convert to dict for indexing
-            doc = self.current_run.model_dump(mode='json')
-            
-            # Index to ElasticSearch
-            response = self.es_client.index(
-                index=self.index_name,
-                id=self.current_run.run_id,
-                body=doc
-            )
+            line = self.current_run.model_dump_json() + "\n"
+            with self._queue_lock:
+                with open(self.queue_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            self._flush_requested.set()
             
-            logger.info(f"Successfully indexed run {self.current_run.run_id} to ElasticSearch: {response['result']}")
+            logger.info(f"Queued run {self.current_run.run_id} for ElasticSearch indexing")
             
         except Exception as e:
-            logger.error(f"Failed to index run to ElasticSearch: {e}")
+            logger.error(f"Failed to queue run for ElasticSearch: {e}")
+    
+    def close(self):
+        """Index any queued runs and stop the background indexer."""
+        self._closed = True
+        self._flush_requested.set()
+        self._flush_thread.join()
+    
+    def _run_flusher(self):
+        while True:
+            self._flush_requested.wait()
+            self._flush_requested.clear()
+            self._flush_queue()
+            if self._closed:
+                return
+    
+    def _inflight_path_for(self, pid: int) -> Path:
+        return self.queue_path.with_name(f"{self.queue_path.stem}.{pid}.inflight.jsonl")
+    
+    def _claim_batch(self) -> bool:
+        """
+        Move a batch of queued runs to this process's in-flight file.
+        
+        Our own failed flush is retried first, then in-flight files left by
+        processes that have exited, then the shared queue. Renames are atomic,
+        so when processes race for the same file exactly one of them gets it.
+        
+        Returns:
+            Whether there is a batch to index
+        """
+        if self._inflight_path.exists():
+            return True
+        orphaned = [
+            path for path in self.queue_path.parent.glob(f"{self.queue_path.stem}.*.inflight.jsonl")
+            if path.name.split('.')[-3].isdigit() and not _pid_running(int(path.name.split('.')[-3]))
+        ]
+        for path in orphaned + [self.queue_path]:
+            try:
+                path.replace(self._inflight_path)
+                return True
+            except FileNotFoundError:
+                continue  # Nothing there, or another process claimed it first
+        return False
+    
+    def _flush_queue(self):
+        """Bulk-index every queued run; on failure the runs stay queued for the next flush."""
+        while True:
+            with self._queue_lock:
+                if not self._claim_batch():
+                    return
+            
+            try:
+                with open(self._inflight_path, 'r', encoding='utf-8') as f:
+                    metrics = [RunMetrics.model_validate_json(line) for line in f if line.strip()]
+                indexed = RunMetrics.bulk_index(metrics, self.es_client)
+                self._inflight_path.unlink()
+                logger.info(f"Successfully indexed {indexed} run(s) to ElasticSearch")
+            except Exception as e:
+                logger.error(f"Failed to index queued runs to ElasticSearch: {e}")
+                return
     
     def record_judge_evaluation(self, evaluation: JudgeEvaluation):
         """Record a judge evaluation (can be used for separate judge tracking)."""
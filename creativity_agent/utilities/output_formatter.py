@@ -339,7 +339,6 @@ def save_formatted_output(
         )
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(formatted)
+    output_path.write_text(formatted, encoding='utf-8')
     
     logger.info(f"Saved formatted final output to {output_path}")
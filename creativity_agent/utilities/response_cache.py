@@ -0,0 +1,114 @@
+"""
+SQLite cache of agent responses keyed by prompt, for cross-run reuse.
+
+Lets a node skip its LLM call when it receives a prompt it has already
+answered with the same model settings in an earlier run.
+"""
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Optional
+from datetime import datetime
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    SQLite-based store of agent responses that persists across runs.
+
+    Entries are keyed by a hash of everything that determines the response
+    (see make_key); a changed prompt or model setting is simply a new key.
+
+    Thread-safe with proper connection handling.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory to store the SQLite database
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = self.cache_dir / "response_cache.db"
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        with self._lock:
+            self._get_connection().execute("""
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+
+        logger.info(f"Response cache initialized at {self.db_path}")
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the inputs that determine a response into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the cache's SQLite connection, opening it on first use (call with self._lock held)."""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+            conn.isolation_level = None  # Autocommit mode
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the SQLite connection (reopened automatically on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response if found, None otherwise
+        """
+        try:
+            with self._lock:
+                row = self._get_connection().execute(
+                    "SELECT response FROM response_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading response cache: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, response: str):
+        """
+        Store a response, replacing any previous one for the key.
+
+        Args:
+            key: Cache key from make_key
+            response: Response text to cache
+        """
+        try:
+            with self._lock:
+                self._get_connection().execute(
+                    "INSERT OR REPLACE INTO response_cache (key, response, timestamp) VALUES (?, ?, ?)",
+                    (key, response, datetime.now().isoformat())
+                )
+        except Exception as e:
+            logger.error(f"Error writing response cache: {e}")
@@ -0,0 +1,41 @@
+"""
+Optional compiled build of declarative model modules.
+
+Package metadata lives in pyproject.toml; this file only adds Cython
+extensions when explicitly requested:
+
+    pip install cython
+    SUPER_CREATIVITY_CYTHONIZE=1 pip install --no-build-isolation .
+
+The .py sources are still installed, so a failed or skipped compile falls
+back to pure Python. Compilation is skipped on CPython 3.12+, where the
+interpreter's own bytecode specialization narrows the gain.
+"""
+import os
+import sys
+
+from setuptools import setup
+
+# Pure declarative Pydantic schema modules, safe to compile unchanged
+CYTHON_MODULES = [
+    "creativity_agent/models/workflow_models/_core.py",
+    "creativity_agent/models/workflow_models/_extras.py",
+]
+
+
+def _ext_modules():
+    if os.getenv("SUPER_CREATIVITY_CYTHONIZE") != "1" or sys.version_info >= (3, 12):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("SUPER_CREATIVITY_CYTHONIZE=1 but Cython is not installed; building pure Python")
+        return []
+    return cythonize(
+        CYTHON_MODULES,
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+
+
+setup(ext_modules=_ext_modules())
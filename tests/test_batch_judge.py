@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch judge node that evaluates every model in one request.
+"""
+import asyncio
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from creativity_agent.models import SharedState
+from creativity_agent.nodes.batch_judge_node import BatchJudgeNode
+
+REFINEMENT_NODES = {"model_A_refinement": "model_A", "model_B_refinement": "model_B"}
+
+# Combined node input as the Strands graph builds it for a node with two dependencies
+TASK = [
+    {"text": "Original Task: invent something"},
+    {"text": "\nInputs from previous nodes:"},
+    {"text": "\nFrom model_A_refinement:"},
+    {"text": "  - refinement: Idea from A"},
+    {"text": "\nFrom model_B_refinement:"},
+    {"text": "  - refinement: Idea from B"},
+]
+
+
+def _idea(name):
+    return {"idea_name": name, "quality_score": 8.0}
+
+
+def _make_node(tmpdir, judge_response):
+    agent = MagicMock()
+    agent.invoke_async = AsyncMock(return_value=SimpleNamespace(
+        message={"content": [{"text": json.dumps(judge_response)}]}
+    ))
+    judge = MagicMock()
+    judge.create_agent.return_value = agent
+    judge.judge_model_id = "judge-model"
+    judge.jinja_builder.build_judge_prompt.return_value = "judge prompt"
+    judge.jinja_builder.get_compiled.return_value.render.return_value = "report"
+    shared_state = SharedState(run_id="test", run_dir=str(tmpdir))
+    node = BatchJudgeNode(
+        shared_state=shared_state,
+        judge=judge,
+        observability=MagicMock(),
+        outputs_dir=Path(tmpdir),
+        refinement_nodes=REFINEMENT_NODES
+    )
+    return node, agent, shared_state
+
+
+def _run(node):
+    invocation_state = {"original_prompt": "invent something", "iteration": 0, "run_id": "test", "run_dir": "."}
+    return asyncio.run(node.invoke_async(TASK, invocation_state))
+
+
+def test_split_model_outputs_groups_text_by_refinement_node():
+    """Each "From <node>:" block's agent outputs are attributed to that node's model."""
+    with TemporaryDirectory() as tmpdir:
+        node, _, _ = _make_node(tmpdir, {})
+        assert node._split_model_outputs(TASK) == {"model_A": "Idea from A", "model_B": "Idea from B"}
+
+
+def test_per_model_response_is_recorded_per_model():
+    """A per_model breakdown is recorded under each model, with missing models flagged."""
+    response = {"per_model": {"model_A": {"accepted_ideas": [_idea("A1")], "rejected_ideas": []}}}
+    with TemporaryDirectory() as tmpdir:
+        node, agent, shared_state = _make_node(tmpdir, response)
+        _run(node)
+
+        assert agent.invoke_async.await_count == 1
+        judged = shared_state.judge_results[0]
+        assert judged["model_A"]["accepted_ideas"] == [_idea("A1")]
+        assert judged["model_B"]["rejected_ideas"][0]["idea_name"] == "Missing Evaluation"
+        assert node.observability.record_judge_evaluation.call_count == 2
+
+
+def test_response_without_per_model_is_recorded_once():
+    """Without a per_model section the response is attributed once, not to every model."""
+    response = {"accepted_ideas": [_idea("Shared")], "rejected_ideas": []}
+    with TemporaryDirectory() as tmpdir:
+        node, _, shared_state = _make_node(tmpdir, response)
+        result = _run(node)
+
+        assert list(shared_state.judge_results[0]) == ["batch"]
+        assert node.observability.record_judge_evaluation.call_count == 1
+        judge_state = result.results["judge"].result.state
+        assert judge_state["accepted_ideas_count"] == 1
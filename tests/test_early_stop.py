@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for convergence-based early stopping of the iteration loop.
+"""
+from types import SimpleNamespace
+
+from strands.multiagent.base import NodeResult
+from strands.multiagent.graph import GraphResult
+
+from creativity_agent.agent_flow_graph import CreativityAgentFlowGraph
+from creativity_agent.config import EarlyStopConfig
+from creativity_agent.models import ExecutionState, SharedState
+from creativity_agent.nodes.mock_agent import MockJudgeNode
+
+
+def test_no_stop_before_min_iterations():
+    """Plateaued scores don't stop the run before min_iterations."""
+    early_stop = EarlyStopConfig(ftol=0.01, patience=1, min_iterations=3)
+    assert not early_stop.check_convergence([7.0, 7.0], [2, 2])
+    assert early_stop.check_convergence([7.0, 7.0, 7.0], [2, 2, 2])
+
+
+def test_stop_when_quality_plateaus():
+    """Stops once the mean score stalls for `patience` iterations."""
+    early_stop = EarlyStopConfig(ftol=0.1, patience=2, min_iterations=2)
+    assert not early_stop.check_convergence([6.0, 7.0, 7.05], [2, 2, 2])
+    assert early_stop.check_convergence([6.0, 7.0, 7.05, 7.0], [2, 2, 2, 2])
+
+
+def test_stop_when_no_new_ideas_accepted():
+    """Stops once no ideas are accepted for `patience` iterations."""
+    early_stop = EarlyStopConfig(ftol=0.01, patience=2, min_iterations=2)
+    assert not early_stop.check_convergence([7.0, 0.0, 8.0], [2, 0, 1])
+    assert early_stop.check_convergence([7.0, 5.0, 0.0, 0.0], [2, 1, 0, 0])
+
+
+def test_iteration_quality_read_from_judge_node_results():
+    """Accepted judge scores are read from the nested state of a judge node's result."""
+    evaluations = [
+        {"accepted": True, "overall_quality_score": 8.0},
+        {"accepted": True, "overall_quality_score": 7.0},
+        {"accepted": False, "overall_quality_score": 4.0},
+    ]
+    shared_state = SharedState()
+    judge = MockJudgeNode(shared_state=shared_state, outputs_dir=None)
+    state = ExecutionState(original_prompt="p", iteration=0, run_id="test", run_dir=".")
+    judge_result = judge.create_result(
+        message="judged",
+        state=state.with_updates(judge_evaluations=evaluations)
+    )
+    result = GraphResult(results={
+        "model_A_judge": NodeResult(result=judge_result),
+        "model_A_creative": NodeResult(result=judge_result),
+    })
+
+    flow = SimpleNamespace(shared_state=shared_state)
+    CreativityAgentFlowGraph._record_iteration_quality(flow, result)
+    assert shared_state.quality_history == [7.5]
+    assert shared_state.accepted_history == [2]
@@ -143,6 +143,7 @@ def test_chaos_template():
     )
     
     prompt = builder.build_chaos_prompt(context)
+    assert builder.build_chaos_prompt(**context.model_dump()) == prompt
     
     print("\n[OK] Chaos generator template rendered successfully")
     print(f"  Prompt length: {len(prompt)} characters")
@@ -156,13 +156,13 @@ def test_single_iteration():
             logger.warning(f"[WARN] Judge output not found: {judge_file}")
         
         # Check memory
-        memory_file = run_dir / "memory" / "idea_memory.json"
+        memory_file = run_dir / "memory" / "idea_memory.jsonl"
         if memory_file.exists():
             logger.info(f"\n[OK] Found memory file: {memory_file}")
-            memory_data = json.loads(memory_file.read_text(encoding='utf-8'))
+            record_kinds = [line.partition('\t')[0] for line in memory_file.read_text(encoding='utf-8').splitlines()]
             logger.info(f"Memory statistics:")
-            logger.info(f"  - explored_ideas count: {len(memory_data.get('explored_ideas', []))}")
-            logger.info(f"  - rejected_ideas count: {len(memory_data.get('rejected_ideas', []))}")
+            logger.info(f"  - explored_ideas count: {record_kinds.count('explored')}")
+            logger.info(f"  - rejected_ideas count: {record_kinds.count('rejected')}")
         else:
             logger.warning(f"[WARN] Memory file not found: {memory_file}")
         
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the append-only idea memory journal.
+"""
+import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from creativity_agent.models.memory_models import IdeaMemory
+
+
+def _write_journal(path: Path) -> None:
+    memory = IdeaMemory()
+    memory.open_journal(path, rewrite=True)
+    memory.add_explored_idea("alpha", ["a"], iteration=0)
+    memory.add_rejected_idea("beta", "too vague", iteration=0)
+    memory.close_journal()
+
+
+def test_torn_last_line_is_ignored(caplog):
+    """An interrupted final write is dropped without a warning."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "memory.jsonl"
+        _write_journal(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('explored\t{"concept": "gam')
+
+        with caplog.at_level(logging.WARNING):
+            memory = IdeaMemory.load_jsonl(path)
+        assert [idea.concept for idea in memory.explored_ideas] == ["alpha"]
+        assert [idea.concept for idea in memory.rejected_ideas] == ["beta"]
+        assert not caplog.records
+
+
+def test_unreadable_line_mid_file_is_reported(caplog):
+    """A bad line followed by valid records is skipped with a warning."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "memory.jsonl"
+        path.write_text('explored\t{"concept": "gam\n', encoding='utf-8')
+        memory = IdeaMemory()
+        memory.open_journal(path)
+        memory.add_explored_idea("delta", ["d"], iteration=1)
+        memory.close_journal()
+
+        with caplog.at_level(logging.WARNING):
+            memory = IdeaMemory.load_jsonl(path)
+        assert [idea.concept for idea in memory.explored_ideas] == ["delta"]
+        assert "line 1" in caplog.text
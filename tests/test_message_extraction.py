@@ -8,7 +8,7 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from creativity_agent.nodes.base_node import BaseNode
+from creativity_agent.nodes.base_node import BaseNode, _content_to_text
 from creativity_agent.models import SharedState, ExecutionState
 from strands.multiagent import MultiAgentResult
 from unittest.mock import Mock, MagicMock, AsyncMock
@@ -99,12 +99,23 @@ def test_extract_message_content_with_empty_message():
     print("✓ Empty message handling works")
 
 
+def test_content_to_text_joins_block_text():
+    """Test node task conversion to the text of its content blocks."""
+    
+    assert _content_to_text("plain task") == "plain task"
+    
+    task = [{"text": "From model_A_creative:"}, {"text": "  - agent: ideas"}]
+    assert _content_to_text(task) == "From model_A_creative:\n  - agent: ideas"
+    print("✓ Task content conversion works")
+
+
 if __name__ == "__main__":
     try:
         test_extract_message_content_with_dict_content()
         test_extract_message_content_with_object_content()
         test_extract_message_content_with_fallback()
         test_extract_message_content_with_empty_message()
+        test_content_to_text_joins_block_text()
         print("\n✓ All message extraction tests passed!")
     except AssertionError as e:
         print(f"\n✗ Test failed: {e}")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the mock chaos generator's per-seed web lookups.
+"""
+import asyncio
+
+import creativity_agent.tools as tools
+from creativity_agent.models import SharedState
+from creativity_agent.nodes import mock_agent
+from creativity_agent.nodes.mock_agent import MockChaosNode
+
+
+def test_seed_searches_fetch_first_url(monkeypatch):
+    """Each seed's search result is parsed and its first URL fetched."""
+    fetched = []
+
+    def fake_search_urls(query, max_results, backend):
+        return [f"https://example.com/{query.split()[-1]}", "https://example.com/other"]
+
+    def fake_get_url_content(url, max_chars=None):
+        fetched.append(url)
+        return "content"
+
+    monkeypatch.setattr(tools, "_search_urls", fake_search_urls)
+    monkeypatch.setattr(tools, "get_url_content", fake_get_url_content)
+    mock_agent._fetch_seed.cache_clear()
+
+    node = MockChaosNode(shared_state=SharedState(), chaos_seeds_per_iteration=3, outputs_dir=None)
+
+    async def search_seeds():
+        return await asyncio.gather(*(node._search_seed(seed) for seed in ("quantum", "fractal")))
+
+    results = asyncio.run(search_seeds())
+
+    assert sorted(fetched) == ["https://example.com/fractal", "https://example.com/quantum"]
+    assert all(result.startswith('["https://example.com/') for result in results)
+    mock_agent._fetch_seed.cache_clear()
+
+
+def test_seed_lookups_memoized_only_on_success(monkeypatch):
+    """A seed is searched once per process, but an empty result is retried."""
+    searches = []
+    results = {"quantum": [], "fractal": ["https://example.com/fractal"]}
+
+    def fake_search_urls(query, max_results, backend):
+        seed = query.split()[-1]
+        searches.append(seed)
+        return results[seed]
+
+    monkeypatch.setattr(tools, "_search_urls", fake_search_urls)
+    monkeypatch.setattr(tools, "get_url_content", lambda url, max_chars=None: "content")
+    mock_agent._fetch_seed.cache_clear()
+
+    node = MockChaosNode(shared_state=SharedState(), chaos_seeds_per_iteration=3, outputs_dir=None)
+
+    async def search_seeds():
+        return await asyncio.gather(*(node._search_seed(seed) for seed in ("quantum", "fractal")))
+
+    assert asyncio.run(search_seeds()) == ["", '["https://example.com/fractal"]']
+    assert asyncio.run(search_seeds()) == ["", '["https://example.com/fractal"]']
+    assert sorted(searches) == ["fractal", "quantum", "quantum"]
+    mock_agent._fetch_seed.cache_clear()
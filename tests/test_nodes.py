@@ -7,11 +7,11 @@ Tests include:
 - CreativeAgentNode
 - RefinementAgentNode
 - JudgeNode
-- IterationControllerNode
 """
 
 import pytest
 import asyncio
+import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -25,7 +25,6 @@ from creativity_agent.nodes.chaos_generator_node import ChaosGeneratorNode
 from creativity_agent.nodes.creative_agent_node import CreativeAgentNode
 from creativity_agent.nodes.refinement_agent_node import RefinementAgentNode
 from creativity_agent.nodes.judge_node import JudgeNode
-from creativity_agent.nodes.iteration_controller_node import IterationControllerNode
 from strands.multiagent.base import Status
 
 
@@ -256,69 +255,6 @@ class TestChaosGeneratorNode:
             assert result.status == Status.FAILED
 
 
-class TestIterationControllerNode:
-    """Tests for IterationControllerNode."""
-    
-    @pytest.mark.asyncio
-    async def test_iteration_controller_initialization(self):
-        """Test IterationControllerNode initialization."""
-        with TemporaryDirectory() as tmpdir:
-            node = IterationControllerNode(
-                max_iterations=5,
-                outputs_dir=Path(tmpdir)
-            )
-            
-            assert node.name == "iteration_controller"
-            assert node.max_iterations == 5
-    
-    @pytest.mark.asyncio
-    async def test_iteration_controller_continue(self):
-        """Test iteration controller continues when below max."""
-        with TemporaryDirectory() as tmpdir:
-            node = IterationControllerNode(
-                max_iterations=5,
-                outputs_dir=Path(tmpdir)
-            )
-            
-            state = {'iteration': 0}
-            
-            result = await node.invoke_async(
-                task='Test',
-                invocation_state=state
-            )
-            
-            assert result.status == Status.COMPLETED
-            assert result.execution_count == 1
-    
-    @pytest.mark.asyncio
-    async def test_iteration_controller_stop(self):
-        """Test iteration controller stops at max iterations."""
-        with TemporaryDirectory() as tmpdir:
-            node = IterationControllerNode(
-                max_iterations=3,
-                outputs_dir=Path(tmpdir)
-            )
-            
-            state = {'iteration': 2}  # Already at iteration 2, will be 3 after increment
-            
-            result = await node.invoke_async(
-                task='Test',
-                invocation_state=state
-            )
-            
-            assert result.status == Status.COMPLETED
-            assert result.execution_count == 1
-    
-    @pytest.mark.asyncio
-    async def test_iteration_controller_required_state(self):
-        """Test required state keys."""
-        with TemporaryDirectory() as tmpdir:
-            node = IterationControllerNode(max_iterations=5, outputs_dir=Path(tmpdir))
-            
-            required = node.get_required_state_keys()
-            assert 'iteration' in required
-
-
 class TestCreativeAgentNode:
     """Tests for CreativeAgentNode."""
     
@@ -572,29 +508,25 @@ class TestJudgeNode:
         with TemporaryDirectory() as tmpdir:
             outputs_dir = Path(tmpdir)
             
-            # Mock judge evaluations
-            from creativity_agent.models.observability_models import JudgeEvaluation
-            
-            mock_eval = JudgeEvaluation(
-                idea_id="test_1",
-                idea_name="Test Idea",
-                originality_score=8.0,
-                feasibility_score=7.0,
-                impact_score=9.0,
-                substance_score=8.0,
-                overall_quality_score=8.0,
-                accepted=True,
-                rejection_reasons=[],
-                key_points=["Good", "Novel"],
-                model_id="test-model",
-                temperature=0.7,
-                iteration=0,
-                evaluation_timestamp=__import__('datetime').datetime.now(),
-                judge_model="judge-model"
-            )
+            # Mock the judge agent's JSON response
+            judge_response = {
+                "accepted_ideas": [{
+                    "idea_name": "Test Idea",
+                    "originality_score": 8.0,
+                    "feasibility_score": 7.0,
+                    "impact_score": 9.0,
+                    "substance_score": 8.0,
+                    "quality_score": 8.0,
+                    "key_points": ["Good", "Novel"]
+                }],
+                "rejected_ideas": []
+            }
+            mock_agent_result = Mock()
+            mock_agent_result.message = {"content": [{"text": json.dumps(judge_response)}]}
             
             mock_judge = Mock()
-            mock_judge.batch_evaluate.return_value = [mock_eval]
+            mock_judge.judge_model_id = "judge-model"
+            mock_judge.create_agent.return_value.invoke_async = AsyncMock(return_value=mock_agent_result)
             
             node = JudgeNode(
                 judge=mock_judge,
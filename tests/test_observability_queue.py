@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk queue that the observability tracker bulk-indexes from.
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock
+
+import elasticsearch.helpers
+import pytest
+
+from creativity_agent.models.observability_models import IdeaStatistics
+from creativity_agent.utilities import observability_tracker
+from creativity_agent.utilities.observability_tracker import ObservabilityTracker
+
+
+@pytest.fixture
+def sent_ids(monkeypatch):
+    """Stub Elasticsearch and parallel_bulk; collects the ids of indexed documents."""
+    monkeypatch.setattr(observability_tracker, "Elasticsearch", MagicMock())
+    sent = []
+
+    def fake_parallel_bulk(client, actions, **kwargs):
+        for action in actions:
+            sent.append(action["_id"])
+            yield True, {}
+
+    monkeypatch.setattr(elasticsearch.helpers, "parallel_bulk", fake_parallel_bulk)
+    return sent
+
+
+def _finish_run(tracker, run_id):
+    tracker.start_run(
+        run_id=run_id,
+        original_prompt="prompt",
+        config_iterations=1,
+        chaos_seeds_per_iteration=1,
+        semantic_backend="simple"
+    )
+    tracker.end_run(final_idea_statistics=IdeaStatistics(
+        total_ideas=0, unique_ideas=0, duplicate_ideas=0, accepted_ideas=0, rejected_ideas=0
+    ))
+
+
+def test_queued_runs_are_indexed_once(sent_ids):
+    """Runs queued by a tracker are sent once and removed from the queue."""
+    with TemporaryDirectory() as tmpdir:
+        queue_path = Path(tmpdir) / "queue.jsonl"
+        tracker = ObservabilityTracker("http://es", "key", queue_path=queue_path)
+        _finish_run(tracker, "run_1")
+        _finish_run(tracker, "run_2")
+        tracker.close()
+
+        # A second tracker on the same queue finds nothing left to send
+        ObservabilityTracker("http://es", "key", queue_path=queue_path).close()
+
+        assert sorted(sent_ids) == ["run_1", "run_2"]
+        assert list(Path(tmpdir).iterdir()) == []
+
+
+def test_failed_flush_leaves_runs_queued(sent_ids, monkeypatch):
+    """Runs whose bulk request fails stay on disk and are sent by the next tracker."""
+    with TemporaryDirectory() as tmpdir:
+        queue_path = Path(tmpdir) / "queue.jsonl"
+
+        def failing_parallel_bulk(client, actions, **kwargs):
+            raise ConnectionError("ES unavailable")
+            yield
+
+        with monkeypatch.context() as failing:
+            failing.setattr(elasticsearch.helpers, "parallel_bulk", failing_parallel_bulk)
+            tracker = ObservabilityTracker("http://es", "key", queue_path=queue_path)
+            _finish_run(tracker, "run_1")
+            tracker.close()
+        assert sent_ids == []
+        assert list(Path(tmpdir).iterdir())
+
+        # Simulate a later process: the failed batch was left by a process that has exited
+        monkeypatch.setattr(observability_tracker, "_pid_running", lambda pid: False)
+        monkeypatch.setattr(observability_tracker.os, "getpid", lambda: 1)
+        ObservabilityTracker("http://es", "key", queue_path=queue_path).close()
+        assert sent_ids == ["run_1"]
+        assert list(Path(tmpdir).iterdir()) == []
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the buffered background output writer.
+"""
+import shutil
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from creativity_agent.utilities import BufferedOutputWriter, write_file
+
+
+def test_flush_writes_submitted_files():
+    """flush() returns only after queued content is on disk."""
+    with TemporaryDirectory() as tmpdir:
+        writer = BufferedOutputWriter(flush_interval_s=60.0)
+        target = Path(tmpdir) / "nested" / "out.txt"
+        writer.submit(target, "hello")
+        writer.flush()
+        assert target.read_text(encoding='utf-8') == "hello"
+        writer.close()
+
+
+def test_later_write_to_same_path_wins():
+    """Repeated writes to one path are coalesced to the last content."""
+    with TemporaryDirectory() as tmpdir:
+        writer = BufferedOutputWriter(flush_interval_s=60.0)
+        target = Path(tmpdir) / "out.txt"
+        writer.submit(target, "first")
+        writer.submit(target, "second")
+        writer.close()
+        assert target.read_text(encoding='utf-8') == "second"
+
+
+def test_size_threshold_triggers_write():
+    """Exceeding max_buffered_bytes writes without an explicit flush."""
+    with TemporaryDirectory() as tmpdir:
+        writer = BufferedOutputWriter(flush_interval_s=60.0, max_buffered_bytes=4)
+        target = Path(tmpdir) / "out.txt"
+        writer.submit(target, "12345")
+        # No flush: only the size threshold can write the file before the interval
+        deadline = time.monotonic() + 5.0
+        while not target.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert target.exists()
+        writer.close()
+
+
+def test_write_recreates_removed_directory():
+    """A directory removed after it was first created is recreated on the next write."""
+    with TemporaryDirectory() as tmpdir:
+        target = Path(tmpdir) / "run" / "out.txt"
+        write_file(target, "first")
+        shutil.rmtree(target.parent)
+        write_file(target, "second")
+        assert target.read_text(encoding='utf-8') == "second"
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the prompt builder's cache of rendered creative/judge prompts.
+"""
+from pathlib import Path
+
+from creativity_agent.utilities import JinjaPromptBuilder, JudgePromptContext
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "creativity_agent" / "prompts_templates"
+
+
+def _counting_builder():
+    builder = JinjaPromptBuilder(templates_dir=str(TEMPLATES_DIR))
+    calls = []
+    render = builder._render
+
+    def counting_render(name, context_dict):
+        calls.append(name)
+        return render(name, context_dict)
+
+    builder._render = counting_render
+    return builder, calls
+
+
+def _judge_context():
+    return JudgePromptContext(
+        model_outputs={"model_B": "Idea B", "model_A": "Idea A"},
+        evaluation_criteria={"originality": "How novel and creative?"}
+    )
+
+
+def test_identical_context_renders_once():
+    """A second build with an equal context is served from the cache."""
+    builder, calls = _counting_builder()
+    first = builder.build_judge_prompt(_judge_context())
+    assert builder.build_judge_prompt(_judge_context()) == first
+    assert calls == ["judge"]
+
+
+def test_no_cache_bypasses_cache():
+    """no_cache=True renders every time."""
+    builder, calls = _counting_builder()
+    builder.build_judge_prompt(_judge_context())
+    builder.build_judge_prompt(_judge_context(), no_cache=True)
+    assert calls == ["judge", "judge"]
+
+
+def test_render_keeps_context_order():
+    """The cache key is canonical JSON, but model outputs render in their given order."""
+    builder, _ = _counting_builder()
+    prompt = builder.build_judge_prompt(_judge_context())
+    assert prompt.index("### Model model_B") < prompt.index("### Model model_A")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-run agent response cache.
+"""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from creativity_agent.models import SharedState
+from creativity_agent.nodes.refinement_agent_node import RefinementAgentNode
+from creativity_agent.utilities import ResponseCache
+
+
+def test_put_then_get_across_instances():
+    """Stored responses are returned by a later cache over the same directory."""
+    with TemporaryDirectory() as tmpdir:
+        key = ResponseCache.make_key("model settings", "system", "prompt")
+        cache = ResponseCache(tmpdir)
+        assert cache.get(key) is None
+        cache.put(key, "refined ideas")
+        cache.close()
+
+        reopened = ResponseCache(tmpdir)
+        assert reopened.get(key) == "refined ideas"
+        reopened.close()
+
+
+def test_key_depends_on_every_part():
+    """Any change to the keyed inputs gives a different key."""
+    key = ResponseCache.make_key("a", "bc")
+    assert key == ResponseCache.make_key("a", "bc")
+    assert key != ResponseCache.make_key("ab", "c")
+    assert key != ResponseCache.make_key("a", "bd")
+
+
+def _make_refinement_node(tmpdir, cache):
+    agent = MagicMock()
+    agent.model.get_config.return_value = {"model_id": "test-model", "temperature": 0.2}
+    agent.system_prompt = "system"
+    agent.invoke_async = AsyncMock(return_value=SimpleNamespace(
+        message={"content": [{"text": "fresh ideas"}]}
+    ))
+    jinja_builder = MagicMock()
+    jinja_builder.build_refinement_prompt.return_value = "refinement prompt"
+    node = RefinementAgentNode(
+        shared_state=SharedState(),
+        agent=agent,
+        node_name="refinement_test",
+        outputs_dir=Path(tmpdir),
+        jinja_builder=jinja_builder,
+        response_cache=cache
+    )
+    return node, agent
+
+
+def _refine(node):
+    invocation_state = {"original_prompt": "Test prompt", "iteration": 0, "run_id": "test", "run_dir": "."}
+    result = asyncio.run(node.invoke_async("Creative output", invocation_state))
+    return result.results[node.name].result.state["refinement_output"]
+
+
+def test_refinement_cache_miss_stores_response():
+    """A prompt not in the cache is sent to the agent and its response stored."""
+    with TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(tmpdir)
+        node, agent = _make_refinement_node(tmpdir, cache)
+        assert _refine(node) == "fresh ideas"
+        assert agent.invoke_async.await_count == 1
+        key = cache.make_key('{"model_id": "test-model", "temperature": 0.2}', "system", "refinement prompt")
+        assert cache.get(key) == "fresh ideas"
+        cache.close()
+
+
+def test_refinement_cache_hit_skips_agent():
+    """A cached response to the same prompt and model settings is reused without invoking the agent."""
+    with TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(tmpdir)
+        node, agent = _make_refinement_node(tmpdir, cache)
+        _refine(node)
+
+        cached_node, cached_agent = _make_refinement_node(tmpdir, cache)
+        assert _refine(cached_node) == "fresh ideas"
+        cached_agent.invoke_async.assert_not_awaited()
+        cache.close()
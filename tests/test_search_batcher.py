@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for coalescing of concurrent web searches.
+"""
+import json
+import threading
+
+import creativity_agent.tools as tools
+
+
+def test_concurrent_bulk_searches_share_backend_calls(monkeypatch):
+    """Identical queries from concurrent agents run one backend search."""
+    calls = []
+
+    def fake_search_urls(query, max_results, backend):
+        calls.append(query)
+        return [f"https://example.com/{query}"]
+
+    monkeypatch.setattr(tools, "_search_urls", fake_search_urls)
+    monkeypatch.setattr(tools, "_search_batcher", tools._SearchBatcher(window_s=0.5))
+
+    outputs = []
+    threads = [
+        threading.Thread(target=lambda: outputs.append(tools.bulk_search_web('["alpha", "beta"]')))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["alpha", "beta"]
+    for output in outputs:
+        assert json.loads(output) == {
+            "alpha": ["https://example.com/alpha"],
+            "beta": ["https://example.com/beta"],
+        }